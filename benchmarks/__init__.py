@@ -0,0 +1,17 @@
+"""Offline benchmarks of unitxt recipes, splitters and metrics.
+
+The benchmarks run on synthetic data shaped like real cards (classification,
+multiple choice, question answering over long contexts, tables and retrieval
+lists), so they need no network access and run on CPU.
+
+The benchmarks import the installed unitxt (``pip install -e .``, or run them with
+``PYTHONPATH=src``). Usage (from the root of the repository):
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --filter "recipe/.*" --size 2000 --repeat 5
+    python -m benchmarks.compare benchmarks/baseline.json results.json
+
+benchmarks/baseline.json holds the results of a previous run. Regenerate it with
+``python -m benchmarks.run --output benchmarks/baseline.json`` when a change of
+performance is intended (or the benchmarks change), on the machine the results
+are compared on.
+"""
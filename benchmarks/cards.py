@@ -0,0 +1,133 @@
+"""Cards, templates and metrics over the synthetic data of benchmarks.generators."""
+import tempfile
+from typing import Dict, List, Tuple
+
+from unitxt.card import TaskCard
+from unitxt.catalog import add_to_catalog
+from unitxt.dataclass import InternalField
+from unitxt.loaders import Loader
+from unitxt.metrics import BulkInstanceMetric
+from unitxt.register import register_local_catalog
+from unitxt.splitters import RandomSampler
+from unitxt.stream import MultiStream
+from unitxt.struct_data_operators import SerializeTableAsMarkdown
+from unitxt.task import FormTask
+from unitxt.templates import (
+    InputOutputTemplate,
+    MultipleChoiceTemplate,
+    MultiReferenceTemplate,
+    Template,
+)
+
+from .generators import generate
+
+
+class LoadSynthetic(Loader):
+    """Loads synthetic data of one of the shapes of benchmarks.generators."""
+
+    shape: str
+    sizes: Dict[str, int]
+    seed: int = 0
+    _cache: Dict = InternalField(default_factory=dict)
+
+    def process(self) -> MultiStream:
+        if not self._cache:
+            for index, (split, size) in enumerate(self.sizes.items()):
+                self._cache[split] = generate(self.shape, size, seed=self.seed + index)
+        return MultiStream.from_iterables(self._cache, copying=True)
+
+
+class BenchmarkWordOverlap(BulkInstanceMetric):
+    """The fraction of the words of the prediction found in the first reference.
+
+    A bulk metric that needs no model or download, for the metric benchmarks.
+    """
+
+    main_score = "word_overlap"
+    reduction_map = {"mean": ["word_overlap"]}
+
+    def compute(
+        self,
+        references: List[List[str]],
+        predictions: List[str],
+        task_data: List[Dict],
+    ) -> List[Dict]:
+        results = []
+        for prediction, reference in zip(predictions, references):
+            words = prediction.split()
+            reference_words = set(reference[0].split())
+            overlap = sum(1 for word in words if word in reference_words)
+            results.append({"word_overlap": overlap / max(len(words), 1)})
+        return results
+
+
+BULK_METRIC = "metrics.benchmarks.word_overlap"
+
+_catalog_dir = None
+
+
+def register_benchmark_metrics():
+    """Add the metrics defined here to a temporary catalog, to refer to them by name."""
+    global _catalog_dir
+    if _catalog_dir is None:
+        _catalog_dir = tempfile.TemporaryDirectory()
+        add_to_catalog(
+            BenchmarkWordOverlap(),
+            BULK_METRIC,
+            catalog_path=_catalog_dir.name,
+            verbose=False,
+        )
+    register_local_catalog(_catalog_dir.name)
+
+
+def make_card(shape: str, sizes: Dict[str, int]) -> Tuple[TaskCard, Template]:
+    """A card and a template for synthetic data of the given shape."""
+    loader = LoadSynthetic(shape=shape, sizes=sizes)
+    preprocess_steps = []
+    if shape == "classification":
+        task = FormTask(
+            inputs=["text"], outputs=["label"], metrics=["metrics.accuracy"]
+        )
+        template = InputOutputTemplate(
+            input_format="Classify: {text}", output_format="{label}"
+        )
+    elif shape == "multiple_choice":
+        task = FormTask(
+            inputs=["question", "choices"],
+            outputs=["choices", "label"],
+            metrics=["metrics.accuracy"],
+        )
+        template = MultipleChoiceTemplate(
+            input_format="{question}\nChoices: {choices}\nAnswer:"
+        )
+    elif shape in ["qa_long_context", "tables"]:
+        if shape == "tables":
+            preprocess_steps.append(
+                SerializeTableAsMarkdown(field_to_field={"table": "context"})
+            )
+        task = FormTask(
+            inputs=["context", "question"],
+            outputs=["answers"],
+            metrics=["metrics.token_overlap"],
+        )
+        template = MultiReferenceTemplate(
+            input_format="{context}\nQuestion: {question}\nAnswer:",
+            references_field="answers",
+        )
+    elif shape == "retrieval":
+        task = FormTask(
+            inputs=["question"], outputs=["context_ids"], metrics=["metrics.mrr"]
+        )
+        template = MultiReferenceTemplate(
+            input_format="Find the passages for: {question}",
+            references_field="context_ids",
+        )
+    else:
+        raise ValueError(f"Unknown shape: {shape}")
+    card = TaskCard(
+        loader=loader,
+        preprocess_steps=preprocess_steps,
+        task=task,
+        sampler=RandomSampler(),
+    )
+    return card, template
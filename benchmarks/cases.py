@@ -0,0 +1,215 @@
+"""The benchmark cases.
+
+A case is a function of the data size, that prepares the data and operators and
+returns the function to time, and the number of instances it processes.
+"""
+import json
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from unitxt.artifact import reset_artifacts_cache
+from unitxt.metric_utils import _compute
+from unitxt.operators import ArtifactFetcherMixin, SplitByValue
+from unitxt.splitters import (
+    RandomSampler,
+    RenameSplits,
+    SeparateSplit,
+    SliceSplit,
+    SplitRandomMix,
+    SpreadSplit,
+)
+from unitxt.standard import StandardRecipe
+from unitxt.stream import MultiStream
+
+from .cards import BULK_METRIC, make_card, register_benchmark_metrics
+from .generators import SHAPES, generate
+
+Case = Callable[[int], Tuple[Callable[[], None], int]]
+
+CASES: Dict[str, Case] = {}
+
+# shapes with large instances are benchmarked on fewer instances
+SHAPE_SIZE_FACTORS = {"qa_long_context": 0.1, "tables": 0.25}
+
+
+def case(name: str):
+    def register(function: Case) -> Case:
+        CASES[name] = function
+        return function
+
+    return register
+
+
+def select_cases(pattern: Optional[str] = None) -> Dict[str, Case]:
+    if pattern is None:
+        return dict(CASES)
+    return {name: case for name, case in CASES.items() if re.search(pattern, name)}
+
+
+def consume(multi_stream: MultiStream):
+    for stream in multi_stream.values():
+        for _ in stream:
+            pass
+
+
+def _recipe_sizes(shape: str, size: int) -> Dict[str, int]:
+    size = max(int(size * SHAPE_SIZE_FACTORS.get(shape, 1)), 20)
+    return {"train": size, "test": max(size // 4, 1)}
+
+
+def _recipe_case(shape: str, num_demos: int):
+    def run_case(size):
+        sizes = _recipe_sizes(shape, size)
+        card, template = make_card(shape, sizes)
+        kwargs = {}
+        if num_demos:
+            kwargs = {
+                "num_demos": num_demos,
+                "demos_pool_size": min(100, sizes["train"] // 2),
+            }
+        recipe = StandardRecipe(card=card, template=template, **kwargs)
+        return lambda: consume(recipe()), sum(sizes.values())
+
+    return run_case
+
+
+for _shape in SHAPES:
+    case(f"recipe/{_shape}")(_recipe_case(_shape, num_demos=0))
+    case(f"recipe/{_shape}/demos")(_recipe_case(_shape, num_demos=3))
+
+
+def _splitter_case(make_splitter):
+    def run_case(size):
+        data = {
+            "train": generate("classification", size),
+            "test": generate("classification", max(size // 4, 1), seed=1),
+        }
+        multi_stream = MultiStream.from_iterables(data)
+        splitter = make_splitter(size)
+        return lambda: consume(splitter(multi_stream)), sum(map(len, data.values()))
+
+    return run_case
+
+
+case("splitters/rename_splits")(
+    _splitter_case(lambda size: RenameSplits(mapper={"train": "training"}))
+)
+case("splitters/split_random_mix")(
+    _splitter_case(
+        lambda size: SplitRandomMix(
+            mix={"train": "train[90%]", "validation": "train[10%]", "test": "test"}
+        )
+    )
+)
+case("splitters/separate_split")(
+    _splitter_case(
+        lambda size: SeparateSplit(
+            from_split="train",
+            to_split_names=["demos_pool", "train"],
+            to_split_sizes=[min(100, size // 2)],
+        )
+    )
+)
+case("splitters/slice_split")(
+    _splitter_case(
+        lambda size: SliceSplit(
+            slices={
+                "train": f"train[:{size // 2}]",
+                "validation": f"train[{size // 2}:]",
+                "test": "test",
+            }
+        )
+    )
+)
+
+
+@case("splitters/spread_split")
+def spread_split(size):
+    multi_stream = SeparateSplit(
+        from_split="train",
+        to_split_names=["demos_pool", "train"],
+        to_split_sizes=[min(100, size // 2)],
+    )(
+        MultiStream.from_iterables(
+            {
+                "train": generate("classification", size),
+                "test": generate("classification", max(size // 4, 1), seed=1),
+            }
+        )
+    )
+    spread = SpreadSplit(
+        source_stream="demos_pool",
+        target_field="demos",
+        sampler=RandomSampler(sample_size=3),
+    )
+    return lambda: consume(spread(multi_stream)), size + max(size // 4, 1)
+
+
+@case("split_by_value/100_groups")
+def split_by_value(size):
+    data = generate("classification", size)
+    for index, instance in enumerate(data):
+        instance["group"] = index % 100
+    multi_stream = MultiStream.from_iterables({"test": data})
+    operator = SplitByValue(fields=["group"])
+    return lambda: consume(operator(multi_stream)), size
+
+
+def _metric_data(metric: str, size: int) -> Tuple[List[str], List[Dict]]:
+    data = generate("classification", size, seed=2)
+    predictions = [
+        instance["label"] if index % 3 else "label_0"
+        for index, instance in enumerate(data)
+    ]
+    references = [
+        {
+            "metrics": [metric],
+            "source": instance["text"],
+            "target": instance["label"],
+            "references": [instance["label"]],
+            "task_data": json.dumps({}),
+            "group": "unitxt",
+            "postprocessors": ["processors.to_string_stripped"],
+        }
+        for instance in data
+    ]
+    return predictions, references
+
+
+def _metric_case(metric: str, calc_confidence_intervals: bool):
+    def run_case(size):
+        register_benchmark_metrics()
+        # ApplyMetric disables the confidence intervals of the fetched metric in place,
+        # so every case fetches its own metric instead of the one of a previous case
+        ArtifactFetcherMixin.cache.clear()
+        reset_artifacts_cache()
+        predictions, references = _metric_data(metric, size)
+        return (
+            lambda: _compute(
+                predictions,
+                references,
+                calc_confidence_intervals=calc_confidence_intervals,
+            ),
+            size,
+        )
+
+    return run_case
+
+
+for _kind, _metric in [
+    ("instance", "metrics.accuracy"),
+    ("bulk", BULK_METRIC),
+    ("global", "metrics.kendalltau_b"),
+]:
+    case(f"metrics/{_kind}")(_metric_case(_metric, calc_confidence_intervals=False))
+    case(f"metrics/{_kind}/bootstrap")(
+        _metric_case(_metric, calc_confidence_intervals=True)
+    )
+
+
+@case("to_dataset/classification")
+def to_dataset(size):
+    sizes = _recipe_sizes("classification", size)
+    card, template = make_card("classification", sizes)
+    recipe = StandardRecipe(card=card, template=template)
+    return lambda: recipe().to_dataset(), sum(sizes.values())
@@ -0,0 +1,79 @@
+"""Compare benchmark results against a baseline.
+
+Prints the ratio of the median time of every case to its time in the baseline,
+and exits with status 1 when a case is slower than the baseline by more than
+--threshold (a fraction, 0.25 by default), so it can fail a CI job.
+
+Usage:
+    python -m benchmarks.compare benchmarks/baseline.json results.json
+    python -m benchmarks.compare benchmarks/baseline.json results.json --threshold 0.1
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.25
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Return a row per case, and the names of the cases slower than the threshold."""
+    rows = []
+    regressions = []
+    baseline_results = baseline["results"]
+    current_results = current["results"]
+    for name in sorted(set(baseline_results) | set(current_results)):
+        before = baseline_results.get(name)
+        after = current_results.get(name)
+        row = {"name": name, "baseline": None, "current": None, "ratio": None}
+        if before is not None:
+            row["baseline"] = before["seconds_median"]
+        if after is not None:
+            row["current"] = after["seconds_median"]
+        if before is not None and after is not None and before["seconds_median"]:
+            if before["instances"] != after["instances"]:
+                row["note"] = "different sizes"
+            else:
+                row["ratio"] = after["seconds_median"] / before["seconds_median"]
+                if row["ratio"] > 1 + threshold:
+                    regressions.append(name)
+        rows.append(row)
+    return rows, regressions
+
+
+def _format_ms(seconds) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    rows, regressions = compare(baseline, current, threshold=args.threshold)
+    print(f"{'case':<40} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for row in rows:
+        ratio = "-" if row["ratio"] is None else f"{row['ratio']:.2f}"
+        mark = " <-- slower" if row["name"] in regressions else ""
+        note = f" ({row['note']})" if "note" in row else ""
+        print(
+            f"{row['name']:<40} {_format_ms(row['baseline']):>12} "
+            f"{_format_ms(row['current']):>12} {ratio:>7}{mark}{note}"
+        )
+    if regressions:
+        print(
+            f"\n{len(regressions)} case(s) slower than the baseline by more than "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Synthetic data shaped like the data of real cards.
+
+Every generator returns a list of instances, and is deterministic given its seed.
+"""
+import random
+from typing import Any, Dict, List
+
+WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+    "quebec", "romeo", "sierra", "tango", "uniform", "victor", "whiskey", "xray",
+    "yankee", "zulu", "apple", "river", "stone", "cloud", "light", "music",
+    "paper", "glass", "table", "window", "garden", "forest", "ocean", "mountain",
+]  # fmt: skip
+
+
+def _text(random_generator: random.Random, words: int) -> str:
+    return " ".join(random_generator.choices(WORDS, k=words))
+
+
+def classification(
+    size: int, seed: int = 0, num_labels: int = 5, words: int = 30
+) -> List[Dict[str, Any]]:
+    random_generator = random.Random(seed)
+    labels = [f"label_{i}" for i in range(num_labels)]
+    return [
+        {
+            "text": _text(random_generator, words),
+            "label": random_generator.choice(labels),
+        }
+        for _ in range(size)
+    ]
+
+
+def multiple_choice(
+    size: int, seed: int = 0, num_choices: int = 4, words: int = 20
+) -> List[Dict[str, Any]]:
+    random_generator = random.Random(seed)
+    return [
+        {
+            "question": _text(random_generator, words) + "?",
+            "choices": [_text(random_generator, 3) for _ in range(num_choices)],
+            "label": random_generator.randrange(num_choices),
+        }
+        for _ in range(size)
+    ]
+
+
+def qa_long_context(
+    size: int, seed: int = 0, context_words: int = 2000
+) -> List[Dict[str, Any]]:
+    random_generator = random.Random(seed)
+    return [
+        {
+            "context": _text(random_generator, context_words),
+            "question": _text(random_generator, 10) + "?",
+            "answers": [_text(random_generator, 3)],
+        }
+        for _ in range(size)
+    ]
+
+
+def tables(
+    size: int, seed: int = 0, rows: int = 20, columns: int = 6
+) -> List[Dict[str, Any]]:
+    random_generator = random.Random(seed)
+    return [
+        {
+            "table": {
+                "header": [f"column_{i}" for i in range(columns)],
+                "rows": [
+                    [
+                        str(random_generator.randrange(1000))
+                        if column % 2
+                        else _text(random_generator, 2)
+                        for column in range(columns)
+                    ]
+                    for _ in range(rows)
+                ],
+            },
+            "question": _text(random_generator, 10) + "?",
+            "answers": [str(random_generator.randrange(1000))],
+        }
+        for _ in range(size)
+    ]
+
+
+def retrieval(
+    size: int, seed: int = 0, list_size: int = 20, corpus_size: int = 1000
+) -> List[Dict[str, Any]]:
+    random_generator = random.Random(seed)
+    return [
+        {
+            "question": _text(random_generator, 10) + "?",
+            "context_ids": [
+                str(random_generator.randrange(corpus_size))
+                for _ in range(random_generator.randint(1, 3))
+            ],
+            "retrieved_ids": [
+                str(random_generator.randrange(corpus_size)) for _ in range(list_size)
+            ],
+        }
+        for _ in range(size)
+    ]
+
+
+SHAPES = {
+    "classification": classification,
+    "multiple_choice": multiple_choice,
+    "qa_long_context": qa_long_context,
+    "tables": tables,
+    "retrieval": retrieval,
+}
+
+
+def generate(shape: str, size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    return SHAPES[shape](size, seed=seed)
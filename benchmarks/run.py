@@ -0,0 +1,91 @@
+"""Run the benchmarks, and write their results as json.
+
+Every case is run once to warm up (loading the catalog, filling caches), then
+--repeat times, and its results are the minimum and median times, and the
+instances processed per second at the median time.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --filter "metrics/" --size 5000 --repeat 5
+    python -m benchmarks.run --list
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+
+os.environ.setdefault("UNITXT_DEFAULT_VERBOSITY", "error")
+os.environ.setdefault("HF_DATASETS_DISABLE_PROGRESS_BARS", "1")
+
+from unitxt.version import version  # noqa: E402
+
+from .cases import select_cases  # noqa: E402
+
+
+def run_case(setup, size: int, repeat: int):
+    run, instances = setup(size)
+    run()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    return {
+        "instances": instances,
+        "seconds_min": min(times),
+        "seconds_median": median,
+        "instances_per_second": instances / median if median else None,
+    }
+
+
+def run_benchmarks(pattern=None, size: int = 1000, repeat: int = 3, verbose=True):
+    results = {}
+    for name, setup in select_cases(pattern).items():
+        results[name] = run_case(setup, size, repeat)
+        if verbose:
+            print(
+                f"{name:<40} {results[name]['seconds_median'] * 1000:>10.1f}ms "
+                f"{results[name]['instances_per_second']:>12.0f} instances/s"
+            )
+    return {
+        "metadata": {
+            "unitxt_version": version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "size": size,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", help="Write the results to this json file.")
+    parser.add_argument("--filter", help="Run only cases matching this regex.")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--list", action="store_true", help="List the cases.")
+    args = parser.parse_args()
+
+    if args.list:
+        for name in select_cases(args.filter):
+            print(name)
+        return
+
+    results = run_benchmarks(args.filter, size=args.size, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
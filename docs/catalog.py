@@ -16,6 +16,9 @@ def write_title(title, label):
 
 def custom_walk(top):
     for entry in os.scandir(top):
+        if entry.name.startswith("."):
+            # e.g. the catalog index
+            continue
         if entry.is_dir():
             yield entry
             yield from custom_walk(entry.path)
@@ -48,9 +51,17 @@ def all_subtypes_of_artifact(artifact):
     return to_return
 
 
+def get_artifact_class(artifact_type):
+    # artifact types are registered when their module is first imported
+    assert Artifact.is_registered_type(
+        artifact_type
+    ), f"Unknown artifact type '{artifact_type}'"
+    return Artifact._class_register[artifact_type]
+
+
 def make_content(artifact, label, all_labels):
     artifact_type = artifact["type"]
-    artifact_class = Artifact._class_register.get(artifact_type)
+    artifact_class = get_artifact_class(artifact_type)
     type_class_name = artifact_class.__name__
     artifact_class_id = f"{artifact_class.__module__}.{type_class_name}"
     catalog_id = label.replace("catalog.", "")
@@ -75,7 +86,7 @@ def make_content(artifact, label, all_labels):
     subtypes = list(set(subtypes))
     subtypes.remove(artifact_type)  # this was already documented
     for subtype in subtypes:
-        subtype_class = Artifact._class_register.get(subtype)
+        subtype_class = get_artifact_class(subtype)
         subtype_class_name = subtype_class.__name__
         if subtype_class.__doc__:
             explanation_str = f"Explanation about `{subtype_class_name}`"
@@ -0,0 +1,94 @@
+"""Compare the compiled queries of unitxt.dict_utils to searching with dpath on every call.
+
+Each case runs a query on a typical instance many times, once through dict_get/dict_set
+and once through the dpath calls they used to make.
+
+Usage:
+    python profile/dict_utils_benchmark.py
+    python profile/dict_utils_benchmark.py --number 20000
+"""
+import argparse
+import copy
+import os
+import sys
+import timeit
+
+import dpath
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from unitxt.dict_utils import dict_creator, dict_get, dict_set  # noqa: E402
+
+
+def dpath_get(dic, query):
+    return [v for _, v in dpath.search(dic, query, yielded=True)]
+
+
+def dpath_set(dic, query, value):
+    paths = [p for p, _ in dpath.search(dic, query, yielded=True)]
+    if len(paths) == 0:
+        dpath.new(dic, query, value, creator=dict_creator)
+    else:
+        dpath.set(dic, paths[0], value)
+
+
+INSTANCE = {
+    "source": "Classify the sentence: the movie was great.",
+    "target": "positive",
+    "references": ["positive"],
+    "task_data": {
+        "text": "the movie was great.",
+        "label": "positive",
+        "choices": ["negative", "neutral", "positive"],
+    },
+    "inputs": {"text": "the movie was great.", "text_type": "sentence"},
+    "outputs": {"label": "positive"},
+    "metadata": {"template": "templates.classification.default", "num_demos": 0},
+    "demos": [
+        {"inputs": {"text": f"sentence {i}"}, "outputs": {"label": "neutral"}}
+        for i in range(5)
+    ],
+}
+
+CASES = [
+    ("get top level", "get", "target"),
+    ("get nested", "get", "task_data/label"),
+    ("get list index", "get", "task_data/choices/2"),
+    ("get wildcard", "get", "demos/*/outputs/label"),
+    ("set existing", "set", "outputs/label"),
+    ("set new nested", "set", "metadata/new/field"),
+]
+
+
+def run_case(kind, query, number):
+    instance = copy.deepcopy(INSTANCE)
+    if kind == "get":
+        compiled = timeit.timeit(lambda: dict_get(instance, query), number=number)
+        baseline = timeit.timeit(lambda: dpath_get(instance, query), number=number)
+    else:
+        compiled = timeit.timeit(
+            lambda: dict_set(instance, query, "value"), number=number
+        )
+        baseline = timeit.timeit(
+            lambda: dpath_set(instance, query, "value"), number=number
+        )
+    return compiled / number * 1e6, baseline / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'case':20} {'compiled':>12} {'dpath':>12} {'speedup':>8}")
+    for name, kind, query in CASES:
+        compiled, baseline = run_case(kind, query, args.number)
+        print(
+            f"{name:20} {compiled:10.2f}us {baseline:10.2f}us {baseline / compiled:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Load test the local evaluation service, and compare it to calling evaluate directly.
+
+Sends --requests evaluate requests of --size instances from --clients concurrent
+clients to an evaluation service (started in this process, unless --url is given),
+and reports the request latencies, the throughput and how requests were coalesced
+into batches. The same requests are then evaluated with unitxt.api.evaluate, one
+after the other, for comparison.
+
+Usage:
+    python profile/evaluation_service_load_test.py
+    python profile/evaluation_service_load_test.py --requests 200 --clients 16 --size 20
+    python profile/evaluation_service_load_test.py --url http://127.0.0.1:8009
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from unitxt.api import evaluate  # noqa: E402
+from unitxt.evaluation_service import EvaluationClient, EvaluationService  # noqa: E402
+
+
+def make_job(metrics, size, seed):
+    data = [
+        {
+            "metrics": metrics,
+            "source": f"question {i}",
+            "target": "yes",
+            "references": ["yes"],
+            "task_data": json.dumps({}),
+            "group": "unitxt",
+            "postprocessors": ["processors.to_string_stripped"],
+        }
+        for i in range(size)
+    ]
+    predictions = ["yes" if (i + seed) % 3 else "no" for i in range(size)]
+    return predictions, data
+
+
+def run_clients(client, jobs, clients, calc_confidence_intervals):
+    latencies = []
+    lock = threading.Lock()
+    next_job = iter(jobs)
+
+    def run():
+        while True:
+            with lock:
+                job = next(next_job, None)
+            if job is None:
+                return
+            start = time.perf_counter()
+            client.evaluate(*job, calc_confidence_intervals=calc_confidence_intervals)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=run) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies), time.perf_counter() - start
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[
+        min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--url", help="Url of a running service.")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--size", type=int, default=10, help="Instances per request.")
+    parser.add_argument("--metrics", nargs="+", default=["metrics.accuracy"])
+    parser.add_argument("--no-confidence-intervals", action="store_true")
+    parser.add_argument("--batch-wait", type=float, default=0.005)
+    args = parser.parse_args()
+    calc_confidence_intervals = not args.no_confidence_intervals
+
+    jobs = [make_job(args.metrics, args.size, i) for i in range(args.requests)]
+
+    service = None
+    url = args.url
+    if url is None:
+        service = EvaluationService(
+            port=0, metrics=args.metrics, batch_wait=args.batch_wait
+        )
+        service.start()
+        url = service.url
+    try:
+        client = EvaluationClient(url)
+        before = client.health()
+        latencies, wall_time = run_clients(
+            client, jobs, args.clients, calc_confidence_intervals
+        )
+        after = client.health()
+    finally:
+        if service is not None:
+            service.close()
+
+    batches = after["evaluated_batches"] - before["evaluated_batches"]
+    print(
+        f"service: {args.requests} requests of {args.size} instances from {args.clients} clients "
+        f"in {wall_time:.2f}s ({args.requests / wall_time:.1f} requests/s), "
+        f"{args.requests / max(batches, 1):.1f} requests per batch"
+    )
+    print(
+        f"         latency p50 {percentile(latencies, 0.5) * 1000:.1f}ms "
+        f"p99 {percentile(latencies, 0.99) * 1000:.1f}ms "
+        f"mean {statistics.mean(latencies) * 1000:.1f}ms"
+    )
+
+    start = time.perf_counter()
+    for predictions, data in jobs:
+        if calc_confidence_intervals:
+            evaluate(predictions, data)
+        else:
+            from unitxt.metric_utils import _compute
+
+            _compute(predictions, data, calc_confidence_intervals=False)
+    direct_time = time.perf_counter() - start
+    print(
+        f"direct:  {args.requests} sequential evaluate calls in {direct_time:.2f}s "
+        f"({args.requests / direct_time:.1f} requests/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Measure the import time of unitxt entry points with `python -X importtime`.
+
+Each module is imported in a fresh interpreter several times, and the median of the
+total import time (the sum of the self times reported by -X importtime) is reported,
+together with the slowest third-party packages it imports.
+
+Usage:
+    python profile/import_time.py
+    python profile/import_time.py --repeat 10 --output import_time.json
+    python profile/import_time.py --baseline import_time.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+DEFAULT_MODULES = ["unitxt", "unitxt.api", "unitxt.metric"]
+HEAVY_PACKAGES = [
+    "datasets",
+    "evaluate",
+    "pandas",
+    "numpy",
+    "scipy",
+    "requests",
+    "pkg_resources",
+]
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"
+)
+LINE_REGEX = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_once(module):
+    env = {**os.environ, "PYTHONPATH": SRC_DIR}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    packages = defaultdict(int)
+    for line in result.stderr.splitlines():
+        match = LINE_REGEX.match(line)
+        if match is None:
+            continue
+        self_time = int(match.group(1))
+        total += self_time
+        packages[match.group(4).split(".")[0]] += self_time
+    return total, packages
+
+
+def measure(module, repeat):
+    totals = []
+    packages_times = defaultdict(list)
+    for _ in range(repeat):
+        total, packages = measure_once(module)
+        totals.append(total)
+        for package, self_time in packages.items():
+            packages_times[package].append(self_time)
+    packages = {
+        package: statistics.median(times) / 1000
+        for package, times in packages_times.items()
+    }
+    return {
+        "total_ms": statistics.median(totals) / 1000,
+        "min_ms": min(totals) / 1000,
+        "heavy_packages": sorted(p for p in HEAVY_PACKAGES if p in packages),
+        "top_packages_ms": dict(
+            sorted(packages.items(), key=lambda item: -item[1])[:10]
+        ),
+    }
+
+
+def compare(results, baseline, max_regression):
+    failed = []
+    for module, result in results.items():
+        if module not in baseline:
+            continue
+        before = baseline[module]["total_ms"]
+        after = result["total_ms"]
+        change = (after - before) / before if before else 0.0
+        print(f"{module:20} {before:10.1f}ms -> {after:10.1f}ms ({change:+.1%})")
+        if change > max_regression:
+            failed.append(module)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write the results as json to this file.")
+    parser.add_argument("--baseline", help="Compare to results stored by --output.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Relative slowdown from the baseline that fails the run.",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for module in args.modules:
+        results[module] = measure(module, args.repeat)
+        result = results[module]
+        print(
+            f"import {module:15} {result['total_ms']:10.1f}ms (min {result['min_ms']:.1f}ms)"
+            f"  heavy packages: {', '.join(result['heavy_packages']) or '-'}"
+        )
+        for package, time_ms in result["top_packages_ms"].items():
+            print(f"    {package:30} {time_ms:10.1f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        failed = compare(results, baseline, args.max_regression)
+        if failed:
+            print(f"Import time regressed for: {', '.join(failed)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
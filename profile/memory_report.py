@@ -0,0 +1,57 @@
+"""Report the memory allocated by every operator of a recipe, or of an evaluation.
+
+Runs the recipe of --query (or evaluates its test split with --evaluate, using the
+references as predictions) under unitxt.memory_profiling.MemoryProfiler, and prints
+the memory charged to every operator and split, the memory alive at the peak and
+the memory retained at the end of the run.
+
+Usage:
+    python profile/memory_report.py --query "card=cards.wnli,template_card_index=0"
+    python profile/memory_report.py --query "card=cards.wnli,template_card_index=0" --evaluate
+    python profile/memory_report.py --query ... --json report.json
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from unitxt.api import evaluate, load_dataset  # noqa: E402
+from unitxt.memory_profiling import MemoryProfiler  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--query", required=True, help="A dataset query.")
+    parser.add_argument("--evaluate", action="store_true")
+    parser.add_argument("--interval", type=float, default=0.5)
+    parser.add_argument("--nframes", type=int, default=25)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", help="Write the report to this json file.")
+    args = parser.parse_args()
+
+    if args.evaluate:
+        test_set = list(load_dataset(args.query)["test"])
+        predictions = [instance["references"][0] for instance in test_set]
+
+    with MemoryProfiler(
+        interval=args.interval, nframes=args.nframes, top=args.top
+    ) as profiler:
+        if args.evaluate:
+            evaluate(predictions, test_set)
+        else:
+            for split in load_dataset(args.query).values():
+                for _ in split:
+                    pass
+
+    print(profiler.format_report())
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(profiler.report(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Measure the latency of rendering single instances with an InstanceRenderer.
+
+The renderer is built from a StandardRecipe over a synthetic classification dataset
+(written to a temporary csv), and renders instances one at a time, as an online
+service would. Reports the p50, p99 and max latency of a render call, with and
+without demos, and optionally from several threads at once.
+
+Usage:
+    python profile/render_latency_benchmark.py
+    python profile/render_latency_benchmark.py --number 20000 --num-demos 0 5 --threads 4
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from unitxt.card import TaskCard  # noqa: E402
+from unitxt.formats import SystemFormat  # noqa: E402
+from unitxt.loaders import LoadCSV  # noqa: E402
+from unitxt.renderer import InstanceRenderer  # noqa: E402
+from unitxt.splitters import RandomSampler  # noqa: E402
+from unitxt.standard import StandardRecipe  # noqa: E402
+from unitxt.task import FormTask  # noqa: E402
+from unitxt.templates import InputOutputTemplate  # noqa: E402
+
+LABELS = ["negative", "neutral", "positive"]
+
+
+def make_instance(i):
+    return {
+        "text": f"sentence number {i} about a movie that was quite something",
+        "label": LABELS[i % len(LABELS)],
+    }
+
+
+def make_renderer(tmp_dir, num_demos, pool_size):
+    path = os.path.join(tmp_dir, "train.csv")
+    pd.DataFrame([make_instance(i) for i in range(pool_size * 2)]).to_csv(
+        path, index=False
+    )
+    card = TaskCard(
+        loader=LoadCSV(files={"train": path}),
+        task=FormTask(inputs=["text"], outputs=["label"], metrics=["metrics.accuracy"]),
+        sampler=RandomSampler(),
+    )
+    recipe = StandardRecipe(
+        card=card,
+        template=InputOutputTemplate(
+            input_format="{text}",
+            output_format="{label}",
+            instruction="Classify the sentiment of the sentence.",
+        ),
+        format=SystemFormat(
+            demo_format="Sentence: {source}\nSentiment: {target}\n\n",
+            model_input_format="{instruction}\n\n{demos}Sentence: {source}\nSentiment: ",
+        ),
+        num_demos=num_demos,
+        demos_pool_size=pool_size if num_demos > 0 else None,
+    )
+    return InstanceRenderer(recipe)
+
+
+def measure(renderer, instances, threads):
+    latencies = [[] for _ in range(threads)]
+
+    def run(thread_index):
+        timings = latencies[thread_index]
+        for instance in instances[thread_index::threads]:
+            start = time.perf_counter()
+            renderer.render(instance)
+            timings.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall_time = time.perf_counter() - start
+    return sorted(t for timings in latencies for t in timings), wall_time
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[
+        min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=5000)
+    parser.add_argument("--num-demos", type=int, nargs="+", default=[0, 3])
+    parser.add_argument("--pool-size", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    instances = [make_instance(i) for i in range(args.number)]
+    print(
+        f"{'num_demos':>9} {'build':>9} {'p50':>9} {'p99':>9} {'max':>9} {'mean':>9} {'renders/s':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num_demos in args.num_demos:
+            start = time.perf_counter()
+            renderer = make_renderer(tmp_dir, num_demos, args.pool_size)
+            build_time = time.perf_counter() - start
+            for instance in instances[:100]:
+                renderer.render(instance)
+            latencies, wall_time = measure(renderer, instances, args.threads)
+            print(
+                f"{num_demos:9} {build_time * 1000:7.1f}ms "
+                f"{percentile(latencies, 0.5) * 1e6:7.1f}us "
+                f"{percentile(latencies, 0.99) * 1e6:7.1f}us "
+                f"{latencies[-1] * 1e6:7.1f}us "
+                f"{statistics.mean(latencies) * 1e6:7.1f}us "
+                f"{len(latencies) / wall_time:10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
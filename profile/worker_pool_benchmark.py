@@ -0,0 +1,108 @@
+"""Compare running unitxt evaluate jobs in a warm worker pool to a cold process per job.
+
+Every job evaluates a small batch of predictions. The cold mode starts a new python
+process per job (paying imports, catalog registration and metric loading each time),
+the warm mode dispatches the jobs to a WarmWorkerPool.
+
+Usage:
+    python profile/worker_pool_benchmark.py
+    python profile/worker_pool_benchmark.py --jobs 50 --processes 4 --metrics metrics.accuracy
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"
+)
+sys.path.insert(0, SRC_DIR)
+
+from unitxt.worker_pool import WarmWorkerPool  # noqa: E402
+
+COLD_JOB = """
+import json, sys
+from unitxt.api import evaluate
+with open(sys.argv[1]) as f:
+    job = json.load(f)
+evaluate(job["predictions"], job["data"])
+"""
+
+
+def make_job(metrics, size):
+    data = [
+        {
+            "metrics": metrics,
+            "source": f"question {i}",
+            "target": "yes",
+            "references": ["yes"],
+            "task_data": json.dumps({}),
+            "group": "unitxt",
+            "postprocessors": ["processors.to_string_stripped"],
+        }
+        for i in range(size)
+    ]
+    predictions = ["yes" if i % 3 else "no" for i in range(size)]
+    return predictions, data
+
+
+def run_cold(jobs):
+    env = {**os.environ, "PYTHONPATH": SRC_DIR}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "job.json")
+        start = time.time()
+        for predictions, data in jobs:
+            with open(path, "w") as f:
+                json.dump({"predictions": predictions, "data": data}, f)
+            subprocess.run(
+                [sys.executable, "-c", COLD_JOB, path],
+                env=env,
+                check=True,
+                capture_output=True,
+            )
+        return time.time() - start
+
+
+def run_warm(jobs, processes, metrics):
+    start = time.time()
+    with WarmWorkerPool(processes=processes, metrics=metrics) as pool:
+        warm_up_time = time.time() - start
+        pool.map_evaluate(jobs)
+    return time.time() - start, warm_up_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--size", type=int, default=20, help="Instances per job.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--metrics", nargs="+", default=["metrics.accuracy"])
+    parser.add_argument(
+        "--cold-jobs",
+        type=int,
+        default=5,
+        help="Number of jobs to time in cold mode (extrapolated to --jobs).",
+    )
+    args = parser.parse_args()
+
+    job = make_job(args.metrics, args.size)
+    cold_jobs = min(args.cold_jobs, args.jobs)
+    cold_time = run_cold([job] * cold_jobs) / cold_jobs
+    warm_time, warm_up_time = run_warm([job] * args.jobs, args.processes, args.metrics)
+
+    print(f"cold: {cold_time * 1000:10.1f}ms per job")
+    print(
+        f"warm: {(warm_time - warm_up_time) / args.jobs * 1000:10.1f}ms per job "
+        f"({args.processes} workers, {warm_up_time:.2f}s to warm up)"
+    )
+    print(
+        f"{args.jobs} jobs: cold {cold_time * args.jobs:.2f}s, warm {warm_time:.2f}s "
+        f"(including warm up)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,19 @@
-from typing import Any, Dict, List, Union
-
-from datasets import DatasetDict
+from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 from .artifact import fetch_artifact
 from .dataset_utils import get_dataset_artifact
 from .logging_utils import get_logger
 from .metric_utils import _compute
 from .operator import SourceOperator
+from .renderer import InstanceRenderer
+
+if TYPE_CHECKING:
+    from datasets import DatasetDict
 
 logger = get_logger()
 
 
-def load(source: Union[SourceOperator, str]) -> DatasetDict:
+def load(source: Union[SourceOperator, str]) -> "DatasetDict":
     assert isinstance(
         source, (SourceOperator, str)
     ), "source must be a SourceOperator or a string"
@@ -20,11 +22,17 @@ def load(source: Union[SourceOperator, str]) -> DatasetDict:
     return source().to_dataset()
 
 
-def load_dataset(dataset_query: str) -> DatasetDict:
+def load_dataset(dataset_query: str) -> "DatasetDict":
     dataset_query = dataset_query.replace("sys_prompt", "instruction")
     dataset_stream = get_dataset_artifact(dataset_query)
     return dataset_stream().to_dataset()
 
 
+def get_renderer(dataset_query: str, **kwargs) -> InstanceRenderer:
+    """Return a renderer of single instances with the recipe of a dataset query (see ``InstanceRenderer``)."""
+    dataset_query = dataset_query.replace("sys_prompt", "instruction")
+    return InstanceRenderer(get_dataset_artifact(dataset_query), **kwargs)
+
+
 def evaluate(predictions, data) -> List[Dict[str, Any]]:
     return _compute(predictions=predictions, references=data)
@@ -1,4 +1,5 @@
 import difflib
+import importlib
 import inspect
 import json
 import os
@@ -8,6 +9,7 @@ from copy import deepcopy
 from functools import lru_cache
 from typing import Dict, List, Optional, Union, final
 
+from .artifact_types_manifest import ARTIFACT_TYPES_MODULES
 from .dataclass import AbstractField, Dataclass, Field, InternalField, fields
 from .logging_utils import get_logger
 from .parsing_utils import (
@@ -15,6 +17,7 @@ from .parsing_utils import (
     separate_inside_and_outside_square_brackets,
 )
 from .settings_utils import get_settings
+from .telemetry import cache_requests, registry
 from .text_utils import camel_to_snake_case, is_camel_case
 from .type_utils import issubtype
 from .utils import load_json, save_json
@@ -74,20 +77,21 @@ class Artifactories:
         self.artifactories = []
 
 
-def map_values_in_place(object, mapper):
+def map_values(object, mapper):
+    """Map the values of a dict or list (or a single value), without modifying the given object."""
+    if isinstance(object, Artifact):
+        return mapper(object)
     if isinstance(object, dict):
-        for key, value in object.items():
-            object[key] = mapper(value)
-        return object
+        return {key: mapper(value) for key, value in object.items()}
     if isinstance(object, list):
-        for i in range(len(object)):
-            object[i] = mapper(object[i])
-        return object
+        return [mapper(value) for value in object]
     return mapper(object)
 
 
 def get_closest_artifact_type(type):
-    artifact_type_options = list(Artifact._class_register.keys())
+    artifact_type_options = sorted(
+        set(Artifact._class_register.keys()) | set(ARTIFACT_TYPES_MODULES.keys())
+    )
     matches = difflib.get_close_matches(type, artifact_type_options)
     if matches:
         return matches[0]  # Return the closest match
@@ -149,7 +153,7 @@ class Artifact(Dataclass):
 
         snake_case_key = camel_to_snake_case(artifact_class.__name__)
 
-        if cls.is_registered_type(snake_case_key):
+        if snake_case_key in cls._class_register:
             assert (
                 str(cls._class_register[snake_case_key]) == str(artifact_class)
             ), f"Artifact class name must be unique, '{snake_case_key}' already exists for {cls._class_register[snake_case_key]}. Cannot be overriden by {artifact_class}."
@@ -174,8 +178,17 @@ class Artifact(Dataclass):
 
     @classmethod
     def is_registered_type(cls, type: str):
+        if type not in cls._class_register:
+            cls._import_artifact_type_module(type)
         return type in cls._class_register
 
+    @classmethod
+    def _import_artifact_type_module(cls, type: str):
+        """Import the unitxt module defining the given artifact type, registering its classes."""
+        module_name = ARTIFACT_TYPES_MODULES.get(type)
+        if module_name is not None:
+            importlib.import_module("." + module_name, __package__)
+
     @classmethod
     def is_registered_class_name(cls, class_name: str):
         snake_case_key = camel_to_snake_case(class_name)
@@ -224,31 +237,35 @@ class Artifact(Dataclass):
 
     @final
     def __pre_init__(self, **kwargs):
-        self._init_dict = get_raw(kwargs)
+        # The constructor arguments are kept by reference, and converted to their raw
+        # (serializable) form only when the artifact is serialized (see _to_raw_dict).
+        # Hence, they should not be modified in place after construction.
+        self._init_dict = kwargs
 
     @final
     def __post_init__(self):
         self.type = self.register_class(self.__class__)
 
         for field in fields(self):
-            if issubtype(
-                field.type, Union[Artifact, List[Artifact], Dict[str, Artifact]]
-            ):
+            if issubtype(field.type, ArtifactFieldType):
                 value = getattr(self, field.name)
-                value = map_values_in_place(value, maybe_recover_artifact)
+                value = map_values(value, maybe_recover_artifact)
                 setattr(self, field.name, value)
 
         self.prepare()
         self.verify()
 
     def _to_raw_dict(self):
-        return {"type": self.type, **self._init_dict}
+        return {"type": self.type, **get_raw(self._init_dict)}
 
     def save(self, path):
         data = self.to_dict()
         save_json(path, data)
 
 
+ArtifactFieldType = Union[Artifact, List[Artifact], Dict[str, Artifact]]
+
+
 def get_raw(obj):
     if isinstance(obj, Artifact):
         return obj._to_raw_dict()
@@ -333,6 +350,19 @@ def verbosed_fetch_artifact(identifer):
     return artifact
 
 
+def _collect_artifacts_cache_telemetry():
+    for cache_name, cached_function in [
+        ("fetch_artifact", fetch_artifact),
+        ("verbosed_fetch_artifact", verbosed_fetch_artifact),
+    ]:
+        info = cached_function.cache_info()
+        cache_requests.set(info.hits, cache=cache_name, result="hit")
+        cache_requests.set(info.misses, cache=cache_name, result="miss")
+
+
+registry.add_collector(_collect_artifacts_cache_telemetry)
+
+
 def reset_artifacts_cache():
     fetch_artifact.cache_clear()
     verbosed_fetch_artifact.cache_clear()
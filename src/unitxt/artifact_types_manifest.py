@@ -0,0 +1,225 @@
+# This file is generated by `make artifacts-manifest`. Do not edit it by hand.
+# It maps each artifact type to the module (relative to the unitxt package)
+# defining it, so modules are imported only when their types are first loaded.
+ARTIFACT_TYPES_MODULES = {
+    "accuracy": "metrics",
+    "add_constant": "operators",
+    "add_demos_field": "standard",
+    "add_fields": "operators",
+    "add_id": "operators",
+    "apply": "operators",
+    "apply_metric": "operators",
+    "apply_operators_field": "operators",
+    "apply_stream_operators_field": "operators",
+    "augment_prefix_suffix": "operators",
+    "augment_whitespace": "operators",
+    "augmentor": "operators",
+    "base_field_operator": "operator",
+    "base_fusion": "fusion",
+    "base_recipe": "standard",
+    "bert_score": "metrics",
+    "bulk_instance_metric": "metrics",
+    "cast_fields": "operators",
+    "catalog": "catalog",
+    "char_edit_distance_accuracy": "metrics",
+    "collection": "collections",
+    "compute_expression_mixin": "operators",
+    "convert_to_boolean": "processors",
+    "copy_fields": "operators",
+    "create_demos_pool": "standard",
+    "custom_f1": "metrics",
+    "deterministic_balancer": "operators",
+    "dict_collection": "collections",
+    "dict_of_lists_to_pairs": "processors",
+    "diverse_labels_sampler": "splitters",
+    "divide_all_fields_by": "operators",
+    "download_files": "operators",
+    "download_operator": "operators",
+    "empty_system_prompt": "system_prompts",
+    "encode_labels": "operators",
+    "environment_local_catalog": "catalog",
+    "execute_expression": "operators",
+    "extract_field_values": "operators",
+    "extract_most_common_field_values": "operators",
+    "extract_zip_file": "operators",
+    "f1": "metrics",
+    "f1_macro": "metrics",
+    "f1_macro_multi_label": "metrics",
+    "f1_micro": "metrics",
+    "f1_micro_multi_label": "metrics",
+    "f1_multi_label": "metrics",
+    "f1_weighted": "metrics",
+    "field_operator": "operators",
+    "filter_by_condition": "operators",
+    "filter_by_expression": "operators",
+    "first_character": "processors",
+    "fixed_fusion": "fusion",
+    "fixed_group_absval_norm_cohens_h_paraphrase_accuracy": "metrics",
+    "fixed_group_absval_norm_cohens_h_paraphrase_string_containment": "metrics",
+    "fixed_group_absval_norm_hedges_g_paraphrase_accuracy": "metrics",
+    "fixed_group_absval_norm_hedges_g_paraphrase_string_containment": "metrics",
+    "fixed_group_mean_accuracy": "metrics",
+    "fixed_group_mean_baseline_accuracy": "metrics",
+    "fixed_group_mean_baseline_string_containment": "metrics",
+    "fixed_group_mean_paraphrase_accuracy": "metrics",
+    "fixed_group_mean_paraphrase_string_containment": "metrics",
+    "fixed_group_mean_string_containment": "metrics",
+    "fixed_group_norm_cohens_h_paraphrase_accuracy": "metrics",
+    "fixed_group_norm_cohens_h_paraphrase_string_containment": "metrics",
+    "fixed_group_norm_hedges_g_paraphrase_accuracy": "metrics",
+    "fixed_group_norm_hedges_g_paraphrase_string_containment": "metrics",
+    "fixed_group_pdr_paraphrase_accuracy": "metrics",
+    "fixed_group_pdr_paraphrase_string_containment": "metrics",
+    "flatten_instances": "operators",
+    "form_task": "task",
+    "format": "formats",
+    "from_iterables": "operators",
+    "from_predictions_and_original_data": "metric_utils",
+    "github_catalog": "catalog",
+    "global_metric": "metrics",
+    "group_mean_accuracy": "metrics",
+    "group_mean_string_containment": "metrics",
+    "group_mean_token_overlap": "metrics",
+    "huggingface_bulk_metric": "metrics",
+    "huggingface_metric": "metrics",
+    "index_of": "operators",
+    "input_output_template": "templates",
+    "instance_metric": "metrics",
+    "instance_operator": "operator",
+    "instance_operator_with_multi_stream_access": "operator",
+    "intersect": "operators",
+    "item_picker": "collections",
+    "iterable_source": "operators",
+    "join_str": "operators",
+    "kendall_tau_metric": "metrics",
+    "key_val_template": "templates",
+    "kpa": "metrics",
+    "length_balancer": "operators",
+    "list_collection": "collections",
+    "list_field_values": "operators",
+    "list_to_empty_entities_tuples": "processors",
+    "list_to_key_val_pairs": "struct_data_operators",
+    "load_csv": "loaders",
+    "load_from_arrow": "loaders",
+    "load_from_data_frame": "loaders",
+    "load_from_files": "loaders",
+    "load_from_ibm_cloud": "loaders",
+    "load_from_kaggle": "loaders",
+    "load_from_sql": "loaders",
+    "load_from_tables": "loaders",
+    "load_hf": "loaders",
+    "load_json": "processors",
+    "load_jsonl": "loaders",
+    "load_parquet": "loaders",
+    "loader": "loaders",
+    "local_catalog": "catalog",
+    "lower_case": "processors",
+    "lower_case_till_punc": "processors",
+    "map": "metrics",
+    "map_instance_values": "operators",
+    "matthews_correlation": "metrics",
+    "merge_streams": "operators",
+    "metric": "metrics",
+    "metric_pipeline": "metrics",
+    "metric_recipe": "metric_utils",
+    "metric_with_confidence_interval": "metrics",
+    "mrr": "metrics",
+    "multi_label_template": "templates",
+    "multi_reference_template": "templates",
+    "multi_stream_operator": "operator",
+    "multi_stream_score_mean": "metric_utils",
+    "multiple_choice_task": "task",
+    "multiple_choice_template": "templates",
+    "ndcg": "metrics",
+    "ner": "metrics",
+    "normalize_list_fields": "normalizers",
+    "null_augmentor": "operators",
+    "operator": "operator",
+    "output_quantizing_template": "templates",
+    "package_requirements_mixin": "operator",
+    "paged_stream_operator": "operator",
+    "perplexity": "metrics",
+    "perturbate": "operators",
+    "precision_macro_multi_label": "metrics",
+    "precision_micro_multi_label": "metrics",
+    "random_picker": "collections",
+    "random_sampler": "splitters",
+    "recall_macro_multi_label": "metrics",
+    "recall_micro_multi_label": "metrics",
+    "regex_parser": "processors",
+    "remove_fields": "operators",
+    "remove_values": "operators",
+    "rename_fields": "operators",
+    "rename_splits": "splitters",
+    "retrieval_at_k": "metrics",
+    "retrieval_metric": "metrics",
+    "reward": "metrics",
+    "roc_auc": "metrics",
+    "rouge": "metrics",
+    "sampler": "splitters",
+    "sentence_bert": "metrics",
+    "separate_split": "splitters",
+    "sequential_operator": "operator",
+    "sequential_operator_initilizer": "operator",
+    "sequential_recipe": "recipe",
+    "serialize_key_val_pairs": "struct_data_operators",
+    "serialize_table": "struct_data_operators",
+    "serialize_table_as_indexed_row_major": "struct_data_operators",
+    "serialize_table_as_markdown": "struct_data_operators",
+    "serialize_table_row_as_list": "struct_data_operators",
+    "serialize_table_row_as_text": "struct_data_operators",
+    "serialize_triples": "struct_data_operators",
+    "shuffle": "operators",
+    "shuffle_field_values": "operators",
+    "side_effect_operator": "operator",
+    "single_stream_operator": "operator",
+    "single_stream_reducer": "operator",
+    "slice_split": "splitters",
+    "source_operator": "operator",
+    "source_sequential_operator": "operator",
+    "span_labeling_base_template": "templates",
+    "span_labeling_json_template": "templates",
+    "span_labeling_template": "templates",
+    "spearmanr": "metrics",
+    "split_by_value": "operators",
+    "split_random_mix": "splitters",
+    "splitter": "splitters",
+    "spread_split": "splitters",
+    "squad": "metrics",
+    "stance_to_pro_con": "processors",
+    "standard_recipe": "standard",
+    "standard_recipe_with_indexes": "standard",
+    "stream_initializer_operator": "operator",
+    "stream_instance_operator": "operator",
+    "stream_instance_operator_validator": "operator",
+    "stream_refiner": "operators",
+    "streaming_operator": "operator",
+    "string_containment": "metrics",
+    "string_or_not_string": "processors",
+    "system_format": "formats",
+    "system_prompt": "system_prompts",
+    "take_by_field": "operators",
+    "take_first_non_empty_line": "processors",
+    "take_first_word": "processors",
+    "task_card": "card",
+    "template": "templates",
+    "templates_list": "templates",
+    "textual_instruction": "instructions",
+    "textual_system_prompt": "system_prompts",
+    "to_list_by_comma": "processors",
+    "to_string": "processors",
+    "to_string_stripped": "processors",
+    "to_unitxt_group": "schema",
+    "to_yes_or_none": "processors",
+    "token_overlap": "metrics",
+    "truncate_table_cells": "struct_data_operators",
+    "truncate_table_rows": "struct_data_operators",
+    "unique": "operators",
+    "update_stream": "metrics",
+    "validate_schema": "validate",
+    "weighted_fusion": "fusion",
+    "wer": "metrics",
+    "yes_no_template": "templates",
+    "yes_no_to_int": "processors",
+    "zip_field_values": "operators",
+}
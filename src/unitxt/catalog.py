@@ -1,12 +1,12 @@
 import os
 import re
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import requests
-
 from .artifact import (
     Artifact,
     Artifactories,
@@ -14,6 +14,14 @@ from .artifact import (
     get_artifactory_name_and_args,
     reset_artifacts_cache,
 )
+from .catalog_index import (
+    get_catalog_index,
+    get_catalog_references,
+    query_entries,
+)
+from .dataclass import InternalField
+from .file_utils import get_cache_dir
+from .http_utils import CachedJsonFetcher
 from .logging_utils import get_logger
 from .settings_utils import get_constants
 from .text_utils import print_dict
@@ -23,6 +31,20 @@ logger = get_logger()
 constants = get_constants()
 
 
+_saved_artifacts_recorders = []
+
+
+@contextmanager
+def record_saved_artifacts():
+    """Collect the paths of the artifacts saved to local catalogs within the context."""
+    saved_paths = []
+    _saved_artifacts_recorders.append(saved_paths)
+    try:
+        yield saved_paths
+    finally:
+        _saved_artifacts_recorders.remove(saved_paths)
+
+
 class Catalog(Artifactory):
     name: str = None
     location: str = None
@@ -81,6 +103,10 @@ class LocalCatalog(Catalog):
         path = self.path(artifact_identifier)
         os.makedirs(Path(path).parent.absolute(), exist_ok=True)
         artifact.save(path)
+        if self.is_local:
+            get_catalog_index(self.location).update(artifact_identifier)
+        for saved_paths in _saved_artifacts_recorders:
+            saved_paths.append(path)
         if verbose:
             logger.info(f"Artifact {artifact_identifier} saved to {path}")
 
@@ -90,28 +116,88 @@ class EnvironmentLocalCatalog(LocalCatalog):
 
 
 class GithubCatalog(LocalCatalog):
+    """A read-only catalog served over http from the unitxt github repository.
+
+    All requests go through one pooled session. Every artifact is fetched once
+    (membership checks and loading share the same response), responses are kept in
+    an on-disk cache keyed by the unitxt version and revalidated with their ETag,
+    and the artifacts an artifact refers to are prefetched concurrently.
+
+    Args:
+        location (str, optional): Base url of the catalog. Defaults to the github raw url of the current version.
+        cache_dir (str, optional): Directory of the on-disk response cache. Defaults to a directory under the unitxt cache dir.
+        use_cache (bool): Whether to keep responses on disk.
+        prefetch_workers (int): Number of concurrent requests used when prefetching references. 0 disables prefetching.
+    """
+
     name = "community"
     repo = "unitxt"
     repo_dir = "src/unitxt/catalog"
     user = "IBM"
     is_local: bool = False
+    location: str = None
+    cache_dir: str = None
+    use_cache: bool = True
+    prefetch_workers: int = 8
+    _fetcher: CachedJsonFetcher = InternalField(default=None)
 
     def prepare(self):
         tag = version
-        self.location = f"https://raw.githubusercontent.com/{self.user}/{self.repo}/{tag}/{self.repo_dir}"
+        if self.location is None:
+            self.location = f"https://raw.githubusercontent.com/{self.user}/{self.repo}/{tag}/{self.repo_dir}"
+        cache_dir = None
+        if self.use_cache:
+            cache_dir = self.cache_dir or get_cache_dir("remote_catalogs")
+            cache_dir = os.path.join(cache_dir, tag)
+        self._fetcher = CachedJsonFetcher(cache_dir=cache_dir)
 
     def load(self, artifact_identifier: str, overwrite_args=None):
-        url = self.path(artifact_identifier)
-        response = requests.get(url)
-        data = response.json()
+        data = self._fetcher.fetch(self.path(artifact_identifier))
+        assert (
+            data is not None
+        ), f"Artifact with name {artifact_identifier} does not exist"
+        self.prefetch_references(data)
         new_artifact = Artifact.from_dict(data, overwrite_args=overwrite_args)
         new_artifact.artifact_identifier = artifact_identifier
         return new_artifact
 
     def __contains__(self, artifact_identifier: str):
-        url = self.path(artifact_identifier)
-        response = requests.head(url)
-        return response.status_code == 200
+        return self._fetcher.fetch(self.path(artifact_identifier)) is not None
+
+    def prefetch_references(self, data):
+        """Concurrently fetch the closure of catalog references found in an artifact dict.
+
+        References that exist in a local catalog are skipped, since they are resolved
+        there before this catalog is consulted.
+        """
+        if self.prefetch_workers <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=self.prefetch_workers) as executor:
+            seen = set()
+            frontier = [data]
+            while frontier:
+                urls = []
+                for document in frontier:
+                    for reference in get_catalog_references(document):
+                        url = self.path(reference)
+                        if url in seen or self._fetcher.is_fetched(url):
+                            continue
+                        seen.add(url)
+                        if not is_in_local_catalog(reference):
+                            urls.append(url)
+                frontier = [
+                    document
+                    for document in executor.map(self._fetcher.fetch, urls)
+                    if document is not None
+                ]
+
+
+def is_in_local_catalog(artifact_identifier: str) -> bool:
+    for artifactory in Artifactories():
+        if isinstance(artifactory, LocalCatalog) and artifactory.is_local:
+            if artifact_identifier in artifactory:
+                return True
+    return False
 
 
 def verify_legal_catalog_name(name):
@@ -173,21 +259,8 @@ def get_local_catalogs_paths():
     return result
 
 
-def count_files_recursively(folder):
-    file_count = 0
-    for _, _, files in os.walk(folder):
-        file_count += len(files)
-    return file_count
-
-
 def local_catalog_summary(catalog_path):
-    result = {}
-
-    for dir in os.listdir(catalog_path):
-        if os.path.isdir(os.path.join(catalog_path, dir)):
-            result[dir] = count_files_recursively(os.path.join(catalog_path, dir))
-
-    return result
+    return get_catalog_index(catalog_path).summary()
 
 
 def summary():
@@ -201,22 +274,60 @@ def summary():
     return result
 
 
+def get_local_catalogs_entries():
+    """Return the index entries of the artifacts in all the local catalogs.
+
+    When an artifact name exists in several catalogs, the entry of the catalog that
+    is searched first when fetching artifacts is returned.
+    """
+    entries = {}
+    for local_catalog_path in get_local_catalogs_paths():
+        for name, entry in get_catalog_index(local_catalog_path).entries.items():
+            entries.setdefault(name, entry)
+    return entries
+
+
+def query_catalog(
+    type: Optional[str] = None,
+    task: Optional[str] = None,
+    metric: Optional[str] = None,
+    template: Optional[str] = None,
+    references: Optional[str] = None,
+    prefix: Optional[str] = None,
+):
+    """Return the names of the artifacts in the local catalogs that match all the given conditions.
+
+    The catalogs are searched through their indexes, without parsing the artifact files.
+
+    Args:
+        type (str, optional): The artifact type, e.g. 'task_card'.
+        task (str, optional): The task of a card, e.g. 'tasks.qa.open'.
+        metric (str, optional): A metric used by a task, or by the task of a card, e.g. 'metrics.rouge'.
+        template (str, optional): A template that a card refers to, directly or through a templates list.
+        references (str, optional): A catalog name the artifact refers to anywhere in its definition.
+        prefix (str, optional): A prefix of the artifact names, e.g. 'cards.'.
+
+    Example:
+        query_catalog(type="task_card", template="templates.qa.open.simple")
+    """
+    return query_entries(
+        get_local_catalogs_entries(),
+        type=type,
+        task=task,
+        metric=metric,
+        template=template,
+        references=references,
+        prefix=prefix,
+    )
+
+
 def ls(to_file=None):
     done = set()
     result = []
     for local_catalog_path in get_local_catalogs_paths():
         if local_catalog_path not in done:
-            for root, _, files in os.walk(local_catalog_path):
-                for file in files:
-                    if ".json" not in file:
-                        continue
-                    file_path = os.path.relpath(
-                        os.path.join(root, file), local_catalog_path
-                    )
-                    file_id = ".".join(
-                        file_path.replace(".json", "").split(os.path.sep)
-                    )
-                    result.append(file_id)
+            result.extend(get_catalog_index(local_catalog_path).names())
+        done.add(local_catalog_path)
     if to_file:
         with open(to_file, "w+") as f:
             f.write("\n".join(result))
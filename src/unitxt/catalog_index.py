@@ -0,0 +1,283 @@
+import json
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .http_utils import atomic_write_json
+from .logging_utils import get_logger
+from .settings_utils import get_constants
+
+logger = get_logger()
+constants = get_constants()
+
+INDEX_FILE_NAME = ".index.json"
+INDEX_VERSION = 1
+
+
+_catalog_reference_regex = re.compile(
+    r"^([A-Za-z_]\w*(?:\.\w+)+)(?:\[.*\])?$", re.DOTALL
+)
+
+
+def get_catalog_references(obj) -> Iterable[str]:
+    """Return the strings in a json object that look like catalog names (e.g. 'templates.x.y')."""
+    if isinstance(obj, dict):
+        for value in obj.values():
+            yield from get_catalog_references(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from get_catalog_references(value)
+    elif isinstance(obj, str):
+        match = _catalog_reference_regex.match(obj)
+        if match is not None:
+            yield match.group(1)
+
+
+def index_entry(data: Dict) -> Dict:
+    """Return the queryable summary of an artifact dict that is kept in the index.
+
+    The entry holds the artifact type, the task a card refers to, the metrics a task
+    (or a card with an inline task) uses, the templates a card refers to, and all
+    the catalog names the artifact refers to.
+    """
+    entry = {"type": data.get("type")}
+    task = data.get("task")
+    if isinstance(task, str):
+        entry["task"] = task.split("[")[0]
+    elif isinstance(task, dict) and "metrics" in task:
+        entry["metrics"] = sorted(set(get_catalog_references(task["metrics"])))
+    if "metrics" in data:
+        entry["metrics"] = sorted(set(get_catalog_references(data["metrics"])))
+    if "templates" in data:
+        entry["templates"] = sorted(set(get_catalog_references(data["templates"])))
+    if "augmentable_inputs" in data:
+        entry["augmentable"] = True
+    entry["references"] = sorted(set(get_catalog_references(data)))
+    return entry
+
+
+def name_of_path(relative_path: str) -> str:
+    return constants.catalog_hirarchy_sep.join(
+        relative_path[: -len(".json")].split(os.path.sep)
+    )
+
+
+def _scan(
+    location: str, relative_dir: str = ""
+) -> Iterable[Tuple[str, os.stat_result]]:
+    """Yield the relative path and stat of every json file under location, skipping hidden files."""
+    with os.scandir(os.path.join(location, relative_dir)) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            relative_path = os.path.join(relative_dir, entry.name)
+            if entry.is_dir():
+                yield from _scan(location, relative_path)
+            elif entry.name.endswith(".json"):
+                yield relative_path, entry.stat()
+
+
+class CatalogIndex:
+    """A persistent index of the artifacts in a local catalog directory.
+
+    The index keeps, for every artifact, a small summary (see ``index_entry``) so the
+    catalog can be listed and filtered without parsing the artifact files. It is
+    stored in ``.index.json`` inside the catalog directory, together with the
+    modification time and size of every file. The first query in a process checks
+    these against the files on disk (without reading them) and parses only files
+    that were added or changed. Artifacts saved with ``add_to_catalog`` update the
+    index directly.
+
+    Use ``get_catalog_index`` to get the shared index of a directory.
+
+    Args:
+        location (str): The catalog directory.
+    """
+
+    def __init__(self, location: str):
+        self.location = location
+        self.path = os.path.join(location, INDEX_FILE_NAME)
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._is_refreshed = False
+        self._lock = threading.RLock()
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+        except (OSError, json.decoder.JSONDecodeError):
+            logger.warning(f"Ignoring unreadable catalog index {self.path}")
+            return
+        if stored.get("version") == INDEX_VERSION:
+            self._entries = stored["artifacts"]
+
+    def _save(self):
+        try:
+            atomic_write_json(
+                self.path, {"version": INDEX_VERSION, "artifacts": self._entries}
+            )
+        except OSError as e:
+            logger.info(f"Could not write catalog index {self.path}: {e}")
+
+    def _read_entry(self, relative_path: str, stat: os.stat_result) -> Dict:
+        try:
+            with open(os.path.join(self.location, relative_path)) as f:
+                entry = index_entry(json.load(f))
+        except (OSError, json.decoder.JSONDecodeError, AttributeError):
+            entry = {"type": None, "references": []}
+        entry["path"] = relative_path
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        return entry
+
+    def refresh(self, force: bool = False):
+        """Bring the index up to date with the catalog directory.
+
+        Only files whose modification time or size changed are parsed. Unless force
+        is True, this is done once in the lifetime of the index.
+        """
+        with self._lock:
+            if self._is_refreshed and not force:
+                return
+            self._load()
+            entries = {}
+            changed = False
+            if os.path.isdir(self.location):
+                for relative_path, stat in _scan(self.location):
+                    name = name_of_path(relative_path)
+                    entry = self._entries.get(name)
+                    if (
+                        entry is None
+                        or entry["mtime_ns"] != stat.st_mtime_ns
+                        or entry["size"] != stat.st_size
+                    ):
+                        entry = self._read_entry(relative_path, stat)
+                        changed = True
+                    entries[name] = entry
+            if changed or len(entries) != len(self._entries):
+                self._entries = entries
+                self._save()
+            self._is_refreshed = True
+
+    def update(self, name: str):
+        """Index (or re-index) one artifact after it was saved to the catalog."""
+        with self._lock:
+            self._load()
+            relative_path = (
+                os.path.join(*name.split(constants.catalog_hirarchy_sep)) + ".json"
+            )
+            path = os.path.join(self.location, relative_path)
+            if os.path.isfile(path):
+                self._entries[name] = self._read_entry(relative_path, os.stat(path))
+            else:
+                self._entries.pop(name, None)
+            self._save()
+
+    @property
+    def entries(self) -> Dict[str, Dict]:
+        self.refresh()
+        return self._entries
+
+    def names(self, prefix: Optional[str] = None) -> List[str]:
+        return sorted(
+            name for name in self.entries if prefix is None or name.startswith(prefix)
+        )
+
+    def query(self, **kwargs) -> List[str]:
+        """Return the names of the artifacts that match all the given conditions (see ``query_entries``)."""
+        return query_entries(self.entries, **kwargs)
+
+    def summary(self) -> Dict[str, int]:
+        """Return the number of artifacts under every top level directory of the catalog."""
+        return dict(
+            Counter(
+                name.split(constants.catalog_hirarchy_sep)[0]
+                for name in self.entries
+                if constants.catalog_hirarchy_sep in name
+            )
+        )
+
+
+def templates_of(entries: Dict[str, Dict], name: str) -> Set[str]:
+    """Return the templates a card refers to, with templates lists replaced by their items."""
+    templates = set()
+    for template in entries[name].get("templates", []):
+        template_entry = entries.get(template)
+        if template_entry is not None and template_entry["type"] == "templates_list":
+            templates.update(template_entry["references"])
+        else:
+            templates.add(template)
+    return templates
+
+
+def metrics_of(entries: Dict[str, Dict], name: str) -> Set[str]:
+    """Return the metrics of a task, or of the task of a card."""
+    entry = entries[name]
+    metrics = set(entry.get("metrics", []))
+    task_entry = entries.get(entry.get("task"))
+    if task_entry is not None:
+        metrics.update(task_entry.get("metrics", []))
+    return metrics
+
+
+def query_entries(
+    entries: Dict[str, Dict],
+    type: Optional[str] = None,
+    task: Optional[str] = None,
+    metric: Optional[str] = None,
+    template: Optional[str] = None,
+    references: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> List[str]:
+    """Return the sorted names of the indexed artifacts that match all the given conditions.
+
+    Args:
+        entries (Dict[str, Dict]): Index entries by artifact name.
+        type (str, optional): The artifact type, e.g. 'task_card'.
+        task (str, optional): The name of the task of a card, e.g. 'tasks.qa.open'.
+        metric (str, optional): A metric name used by a task, or by the task of a card, e.g. 'metrics.rouge'.
+        template (str, optional): A template name that a card refers to, directly or through a templates list.
+        references (str, optional): A catalog name the artifact refers to anywhere in its definition.
+        prefix (str, optional): A prefix of the artifact names, e.g. 'cards.'.
+    """
+    result = []
+    for name, entry in entries.items():
+        if prefix is not None and not name.startswith(prefix):
+            continue
+        if type is not None and entry["type"] != type:
+            continue
+        if task is not None and entry.get("task") != task:
+            continue
+        if references is not None and references not in entry["references"]:
+            continue
+        if metric is not None and metric not in metrics_of(entries, name):
+            continue
+        if template is not None and template not in templates_of(entries, name):
+            continue
+        result.append(name)
+    return sorted(result)
+
+
+_indexes: Dict[str, CatalogIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_catalog_index(location: str) -> CatalogIndex:
+    """Return the shared index of a local catalog directory."""
+    key = os.path.realpath(location)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = CatalogIndex(location)
+        return _indexes[key]
+
+
+def reset_catalog_indexes():
+    with _indexes_lock:
+        _indexes.clear()
@@ -0,0 +1,204 @@
+"""A persistent, size-bounded cache of the datasets prepared by remote loaders.
+
+Loaders that download and prepare a dataset (e.g., LoadHF when it cannot stream,
+and LoadFromKaggle) save the prepared dataset to this cache, and later runs load
+it from the cache instead of downloading and preparing it again.
+
+The cache is configured through the settings:
+
+* ``unitxt.settings.dataset_cache`` (env: UNITXT_DATASET_CACHE): set to False to disable it.
+* ``unitxt.settings.dataset_cache_dir`` (env: UNITXT_DATASET_CACHE_DIR): its location,
+  by default the "datasets" directory under the unitxt cache dir.
+* ``unitxt.settings.dataset_cache_max_size_gb`` (env: UNITXT_DATASET_CACHE_MAX_SIZE_GB):
+  when the cache grows beyond this size, the least recently used entries are deleted.
+
+Every entry is written to a temporary directory and renamed into place, so
+concurrent processes never read a partially written entry; when two processes
+prepare the same entry, the first rename wins and the other copy is deleted.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .file_utils import file_lock, get_cache_dir
+from .http_utils import atomic_write_json
+from .logging_utils import get_logger
+from .settings_utils import get_settings, is_true
+from .telemetry import record_cache
+
+logger = get_logger()
+settings = get_settings()
+
+ENTRY_FILE = "unitxt_cache_entry.json"
+
+
+def _directory_size(path: str) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                size += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                pass
+    return size
+
+
+class DatasetCache:
+    """A directory of cache entries, each a directory holding one prepared dataset.
+
+    Args:
+        root: the directory of the cache.
+        max_size: the size in bytes the cache is reduced to, by deleting the least
+            recently used entries, whenever an entry is added. None for no limit.
+    """
+
+    def __init__(self, root: str, max_size: Optional[int] = None):
+        self.root = root
+        self.max_size = max_size
+
+    @staticmethod
+    def key(**parts: Any) -> str:
+        """A key of the entry of a dataset, from all the arguments that determine its content."""
+        description = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(description.encode()).hexdigest()[:32]
+
+    def entry_dir(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def get(self, key: str) -> Optional[str]:
+        """The directory of the entry of key, or None if there is no such (complete) entry."""
+        entry_file = os.path.join(self.entry_dir(key), ENTRY_FILE)
+        hit = os.path.exists(entry_file)
+        record_cache("dataset_cache", hit=hit)
+        if not hit:
+            logger.info(f"Dataset cache miss: {key}")
+            return None
+        logger.info(f"Dataset cache hit: {key}")
+        try:
+            # the modification time of the entry file is the last use of the entry
+            os.utime(entry_file)
+        except OSError:
+            pass
+        return self.entry_dir(key)
+
+    def put(self, key: str, write: Callable[[str], None], description: str = "") -> str:
+        """Add an entry, whose content write(directory) writes, and return its directory."""
+        os.makedirs(self.root, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(dir=self.root, prefix=".tmp-")
+        try:
+            write(temp_dir)
+            with open(os.path.join(temp_dir, ENTRY_FILE), "w") as f:
+                json.dump(
+                    {
+                        "key": key,
+                        "description": description,
+                        "size": _directory_size(temp_dir),
+                        "created": time.time(),
+                    },
+                    f,
+                )
+            try:
+                os.rename(temp_dir, self.entry_dir(key))
+            except OSError:
+                # another process added the entry first
+                if not os.path.exists(os.path.join(self.entry_dir(key), ENTRY_FILE)):
+                    raise
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        logger.info(f"Dataset cache stored: {key} {description}")
+        self.evict(keep=key)
+        return self.entry_dir(key)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """The entries of the cache, from the least to the most recently used."""
+        if not os.path.isdir(self.root):
+            return []
+        entries = []
+        for name in os.listdir(self.root):
+            entry_file = os.path.join(self.root, name, ENTRY_FILE)
+            try:
+                with open(entry_file) as f:
+                    entry = json.load(f)
+                entry["used"] = os.path.getmtime(entry_file)
+            except (OSError, ValueError):
+                continue
+            entries.append(entry)
+        return sorted(entries, key=lambda entry: entry["used"])
+
+    def size(self) -> int:
+        return sum(entry["size"] for entry in self.entries())
+
+    def _lock(self):
+        return file_lock(os.path.join(self.root, ".lock"))
+
+    def delete(self, key: str):
+        entry_dir = self.entry_dir(key)
+        if not os.path.isdir(entry_dir):
+            return
+        # rename first, so the entry disappears at once for other processes
+        deleted_dir = tempfile.mkdtemp(dir=self.root, prefix=".deleted-")
+        try:
+            os.replace(entry_dir, os.path.join(deleted_dir, key))
+        except OSError:
+            pass
+        shutil.rmtree(deleted_dir, ignore_errors=True)
+
+    def evict(self, keep: Optional[str] = None):
+        """Delete the least recently used entries, until the cache fits in max_size."""
+        if self.max_size is None:
+            return
+        with self._lock():
+            entries = self.entries()
+            total = sum(entry["size"] for entry in entries)
+            for entry in entries:
+                if total <= self.max_size:
+                    break
+                if entry["key"] == keep:
+                    continue
+                logger.info(
+                    f"Dataset cache evicted: {entry['key']} {entry['description']}"
+                )
+                self.delete(entry["key"])
+                total -= entry["size"]
+
+    def clear(self):
+        for entry in self.entries():
+            self.delete(entry["key"])
+
+    def _flags_file(self, key: str) -> str:
+        return os.path.join(self.root, "flags", key + ".json")
+
+    def get_flag(self, key: str, name: str) -> Any:
+        """A remembered fact about a dataset (e.g., whether it can be streamed), or None."""
+        try:
+            with open(self._flags_file(key)) as f:
+                return json.load(f).get(name)
+        except (OSError, ValueError):
+            return None
+
+    def set_flag(self, key: str, name: str, value: Any):
+        flags = {}
+        try:
+            with open(self._flags_file(key)) as f:
+                flags = json.load(f)
+        except (OSError, ValueError):
+            pass
+        flags[name] = value
+        atomic_write_json(self._flags_file(key), flags)
+
+
+def get_dataset_cache() -> Optional[DatasetCache]:
+    """The dataset cache configured by the settings, or None when it is disabled."""
+    if not is_true(settings.dataset_cache):
+        return None
+    max_size = settings.dataset_cache_max_size_gb
+    return DatasetCache(
+        root=settings.dataset_cache_dir or get_cache_dir("datasets"),
+        max_size=None if max_size is None else int(float(max_size) * (1 << 30)),
+    )
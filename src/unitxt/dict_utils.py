@@ -1,10 +1,17 @@
+import fnmatch
 import os
+import re
+from functools import lru_cache
 from typing import Sequence
 
 import dpath
 from dpath import MutableSequence
+from dpath.exceptions import PathNotFound
 from dpath.segments import extend
 
+_leaf_types = (bytes, str, int, float, bool, type(None))
+_glob_chars_regex = re.compile(r"[*?\[]")
+
 
 def is_subpath(subpath, fullpath):
     # Normalize the paths to handle different formats and separators
@@ -19,16 +26,6 @@ def is_subpath(subpath, fullpath):
     return fullpath_components[: len(subpath_components)] == subpath_components
 
 
-def dpath_get(dic, query_path):
-    return [v for _, v in dpath.search(dic, query_path, yielded=True)]
-
-
-def dpath_set_one(dic, query_path, value):
-    n = dpath.set(dic, query_path, value)
-    if n != 1:
-        raise ValueError(f'query "{query_path}" matched multiple items in dict: {dic}')
-
-
 def dict_delete(dic, query_path):
     dpath.delete(dic, query_path)
 
@@ -66,21 +63,251 @@ def dict_creator(current, segments, i, hints=()):
             current[segment] = {}
 
 
+def is_leaf(obj):
+    return isinstance(obj, _leaf_types)
+
+
+def _children(node):
+    """Return the (key, value, length) of the children of a node, as dpath walks them.
+
+    length is the length of the parent for sequence items (whose negative indices
+    also match) and None for mapping items.
+    """
+    if is_leaf(node):
+        return ()
+    try:
+        return [(key, value, None) for key, value in node.items()]
+    except AttributeError:
+        try:
+            length = len(node)
+        except TypeError:
+            return ()
+        return [(index, value, length) for index, value in enumerate(node)]
+
+
+def _compile_segment(pattern):
+    """Compile one segment of a query into a matcher of (key, length), with dpath semantics.
+
+    Integer keys (and sequence indices) match a pattern that is an integer, other
+    keys match through fnmatch.
+    """
+    try:
+        int_pattern = int(pattern)
+    except ValueError:
+        int_pattern = None
+    regex = None
+    if _glob_chars_regex.search(pattern):
+        regex = re.compile(fnmatch.translate(pattern)).match
+
+    def matches(key, length):
+        if isinstance(key, int):
+            if int_pattern is not None:
+                return key == int_pattern or (
+                    length is not None and length + int_pattern == key
+                )
+            key = str(key)
+        elif not isinstance(key, str):
+            return False
+        if regex is None:
+            return key == pattern
+        return regex(key) is not None
+
+    return matches
+
+
+def _match_any(key, length):
+    return isinstance(key, (int, str, bytes))
+
+
+class DictQuery:
+    """A query string (e.g. "a/b", "a/*/b", "**/c") compiled for repeated use on dicts.
+
+    Matching follows dpath: segments are separated by "/", a leading "/" is ignored,
+    segments may contain fnmatch wildcards, "**" matches any number of segments, and
+    integer segments index sequences. Segments without wildcards are resolved by
+    direct indexing, and only the parts of the dict that can match the query are
+    visited. Matches are returned in the order dpath returns them.
+
+    Use ``compile_query`` to get the cached compiled form of a query.
+    """
+
+    def __init__(self, query: str):
+        self.query = query
+        self.segments = query.lstrip("/").split("/")
+        if "**" in self.segments:
+            self.star_star = self.segments.index("**")
+            if "**" in self.segments[self.star_star + 1 :]:
+                raise ValueError(
+                    f"Invalid query {query}: only one '**' is permitted per query"
+                )
+        else:
+            self.star_star = None
+        self.is_literal_segment = [
+            _glob_chars_regex.search(segment) is None for segment in self.segments
+        ]
+        self.matchers = [
+            _match_any if segment == "**" else _compile_segment(segment)
+            for segment in self.segments
+        ]
+        self.int_segments = []
+        for segment in self.segments:
+            try:
+                self.int_segments.append(int(segment))
+            except ValueError:
+                self.int_segments.append(None)
+
+    def _literal_keys(self, node, depth):
+        """Return the keys of the children of node that match a wildcard-free segment."""
+        segment = self.segments[depth]
+        int_segment = self.int_segments[depth]
+        if is_leaf(node):
+            return []
+        if hasattr(node, "items"):
+            keys = [segment] if segment in node else []
+            try:
+                if int_segment is not None and int_segment in node:
+                    keys.append(int_segment)
+            except TypeError:
+                pass
+            if len(keys) == 2:
+                order = list(node)
+                keys.sort(key=order.index)
+            return keys
+        try:
+            length = len(node)
+        except TypeError:
+            return []
+        if int_segment is None or not -length <= int_segment < length:
+            return []
+        return [int_segment % length]
+
+    def _search(self, node, depth, location):
+        # Matches of a query without "**" are all at the same depth, so visiting the
+        # matching children of every node in order yields them in dpath order.
+        if self.is_literal_segment[depth]:
+            children = [(key, node[key]) for key in self._literal_keys(node, depth)]
+        else:
+            matcher = self.matchers[depth]
+            children = [
+                (key, value)
+                for key, value, length in _children(node)
+                if matcher(key, length)
+            ]
+        for key, value in children:
+            if depth == len(self.segments) - 1:
+                yield (*location, key), value
+            else:
+                yield from self._search(value, depth + 1, (*location, key))
+
+    def _walk(self, node, location, lengths):
+        # Walks like dpath (all the children of a node, then the subtree of each child),
+        # skipping subtrees that cannot match the part of the query before "**".
+        depth = len(location)
+        children = [
+            (key, value, length)
+            for key, value, length in _children(node)
+            if depth >= self.star_star or self.matchers[depth](key, length)
+        ]
+        for key, value, length in children:
+            yield (*location, key), value, (*lengths, length)
+        for key, value, length in children:
+            yield from self._walk(value, (*location, key), (*lengths, length))
+
+    def search(self, dic):
+        """Yield the (path, value) of every item that matches the query, where path is a tuple of keys."""
+        if self.star_star is None:
+            yield from self._search(dic, 0, ())
+            return
+        for path, value, lengths in self._walk(dic, (), ()):
+            if self._star_star_matches(path, lengths):
+                yield path, value
+
+    def _star_star_matches(self, path, lengths):
+        extra = len(path) - len(self.segments)
+        if extra < -1:
+            return False
+        ss = self.star_star
+        for i, (key, length) in enumerate(zip(path, lengths)):
+            if i < ss:
+                continue  # matched while walking
+            if i <= ss + extra:
+                matcher = _match_any
+            else:
+                matcher = self.matchers[i - extra]
+            if not matcher(key, length):
+                return False
+        return True
+
+    def get(self, dic):
+        return [value for _, value in self.search(dic)]
+
+    def paths(self, dic):
+        return [path for path, _ in self.search(dic)]
+
+
+@lru_cache(maxsize=1024)
+def compile_query(query: str) -> DictQuery:
+    return DictQuery(query)
+
+
+def set_path(dic, path, value):
+    """Set the value at a path (a tuple of keys) that exists in dic."""
+    current = dic
+    for key in path[:-1]:
+        current = current[key]
+    current[path[-1]] = value
+
+
+def new_path(dic, segments, value):
+    """Set the value at a path of segments, creating missing components (like dpath.new with dict_creator)."""
+    current = dic
+    for i, segment in enumerate(segments[:-1]):
+        if isinstance(current, Sequence) and segment.isdecimal():
+            segment = int(segment)
+        try:
+            current[segment]
+        except:
+            dict_creator(current, segments, i)
+        current = current[segment]
+        if is_leaf(current):
+            raise PathNotFound(f"Path: {segments}[{i}]")
+
+    last_segment = segments[-1]
+    if isinstance(current, Sequence) and last_segment.isdecimal():
+        last_segment = int(last_segment)
+        extend(current, last_segment)
+    current[last_segment] = value
+
+
+def _set_one(dic, query_path, path, value):
+    try:
+        set_path(dic, path, value)
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(
+            f'query "{query_path}" matched the item at {list(path)}, but it cannot be set in dict: {dic}. {e.__class__.__name__}: {e}'
+        ) from e
+
+
+def dpath_get(dic, query_path):
+    return compile_query(query_path).get(dic)
+
+
 def dpath_set(dic, query_path, value, not_exist_ok=True):
-    paths = [p for p, _ in dpath.search(dic, query_path, yielded=True)]
+    query = compile_query(query_path)
+    paths = query.paths(dic)
     if len(paths) == 0 and not_exist_ok:
-        dpath.new(dic, query_path, value, creator=dict_creator)
+        new_path(dic, query.segments, value)
     else:
         if len(paths) != 1:
             raise ValueError(
                 f'query "{query_path}" matched {len(paths)} items in dict: {dic}. should match only one.'
             )
         for path in paths:
-            dpath_set_one(dic, path, value)
+            _set_one(dic, query_path, path, value)
 
 
 def dpath_set_multiple(dic, query_path, values, not_exist_ok=True):
-    paths = [p for p, _ in dpath.search(dic, query_path, yielded=True)]
+    paths = compile_query(query_path).paths(dic)
     if len(paths) == 0:
         if not_exist_ok:
             raise ValueError(
@@ -93,7 +320,7 @@ def dpath_set_multiple(dic, query_path, values, not_exist_ok=True):
             f'query "{query_path}" matched {len(paths)} items in dict: {dic} but {len(values)} values are provided. should match only one.'
         )
     for path, value in zip(paths, values):
-        dpath_set_one(dic, path, value)
+        _set_one(dic, query_path, path, value)
 
 
 def dict_get(dic, query, use_dpath=True, not_exist_ok=False, default=None):
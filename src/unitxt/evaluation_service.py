@@ -0,0 +1,440 @@
+"""A long-lived local HTTP service that evaluates predictions with warm metrics.
+
+Start the service (the metrics given are loaded once, when it starts):
+
+    python -m unitxt.evaluation_service --port 8009 --metrics metrics.accuracy metrics.rouge
+
+and evaluate with the client, exactly as with ``unitxt.api.evaluate``:
+
+    from unitxt.evaluation_service import EvaluationClient
+
+    results = EvaluationClient("http://127.0.0.1:8009").evaluate(predictions, data)
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .logging_utils import get_logger
+from .metric_utils import MetricRecipe, MultiStreamScoreMean
+from .operators import MergeStreams
+from .stream import MultiStream, Stream
+from .worker_pool import warm_up
+
+logger = get_logger()
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8009
+
+
+class EvaluationRequest:
+    def __init__(
+        self,
+        predictions: List[str],
+        references: List[Dict[str, Any]],
+        calc_confidence_intervals: bool = True,
+    ):
+        if len(predictions) != len(references):
+            raise ValueError(
+                f"Got {len(predictions)} predictions but {len(references)} references"
+            )
+        self.predictions = predictions
+        self.references = references
+        self.calc_confidence_intervals = calc_confidence_intervals
+        self.results: Optional[List[Dict[str, Any]]] = None
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+
+    def __len__(self):
+        return len(self.predictions)
+
+    def wait(self) -> List[Dict[str, Any]]:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.results
+
+
+def _predictions_with_references(predictions, references):
+    for prediction, original in zip(predictions, references):
+        yield {**original, "prediction": prediction}
+
+
+def evaluate_batch(
+    requests: List[EvaluationRequest], calc_confidence_intervals: bool = True
+) -> Iterator[List[Dict[str, Any]]]:
+    """Evaluate many requests with one metric recipe, and yield the results of every request in order.
+
+    Every request becomes a stream of one multi stream, that goes through the steps of
+    the recipe once. The metrics still score the stream of every request separately
+    (their global scores are of a single request), so a batch makes as many metric
+    computations as evaluating its requests one by one; it saves only the setup of
+    the recipe. The scores are then averaged over groups and merged per request, so
+    every request gets the same results ``unitxt.api.evaluate`` returns for it alone.
+    """
+    recipe = MetricRecipe(calc_confidence_intervals=calc_confidence_intervals)
+    # the recipe steps, without its first step (that reads predictions into a single
+    # stream) and its last two steps (that average and merge over all streams)
+    multi_stream = MultiStream(
+        {
+            f"request{i}": Stream(
+                _predictions_with_references,
+                gen_kwargs={
+                    "predictions": request.predictions,
+                    "references": request.references,
+                },
+            )
+            for i, request in enumerate(requests)
+        }
+    )
+    for step in recipe.steps[1:-2]:
+        multi_stream = step(multi_stream)
+
+    for i in range(len(requests)):
+        prefix = f"request{i}_"
+        request_streams = MultiStream(
+            {
+                "all_" + name[len(prefix) :]: stream
+                for name, stream in multi_stream.items()
+                if name.startswith(prefix)
+            }
+        )
+        request_streams = MergeStreams()(MultiStreamScoreMean()(request_streams))
+        yield list(request_streams["all"])
+
+
+class BatchEvaluator:
+    """Evaluates queued requests on a single thread, in batches of concurrent requests.
+
+    When a request arrives, the evaluator waits up to ``batch_wait`` seconds for more
+    requests, and evaluates all of them (up to ``max_batch_instances`` instances) with
+    one metric recipe (see ``evaluate_batch``: the metrics score every request
+    separately). Metrics are evaluated on one thread only, since metric objects are
+    shared and are not thread safe, and the warm metrics are what saves time.
+    """
+
+    def __init__(self, max_batch_instances: int = 10000, batch_wait: float = 0.005):
+        self.max_batch_instances = max_batch_instances
+        self.batch_wait = batch_wait
+        self.queue = queue.Queue()
+        self.evaluated_requests = 0
+        self.evaluated_batches = 0
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, request: EvaluationRequest) -> EvaluationRequest:
+        self.start()
+        self.queue.put(request)
+        return request
+
+    def _next_batch(self, first: EvaluationRequest) -> List[EvaluationRequest]:
+        batch = [first]
+        size = len(first)
+        deadline = time.monotonic() + self.batch_wait
+        while size < self.max_batch_instances:
+            try:
+                request = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if request is None:
+                self.queue.put(None)
+                break
+            batch.append(request)
+            size += len(request)
+        return batch
+
+    def _evaluate(self, batch: List[EvaluationRequest]):
+        for calc_confidence_intervals in (True, False):
+            requests = [
+                request
+                for request in batch
+                if request.calc_confidence_intervals == calc_confidence_intervals
+            ]
+            if not requests:
+                continue
+            try:
+                results = evaluate_batch(requests, calc_confidence_intervals)
+                for request in requests:
+                    request.results = next(results)
+                    request.done.set()
+            except Exception as e:
+                # a request of the batch failed, evaluate the rest of it alone
+                for request in requests:
+                    if not request.done.is_set():
+                        self._evaluate_alone(request, e if len(requests) == 1 else None)
+
+    def _evaluate_alone(self, request: EvaluationRequest, error=None):
+        if error is None:
+            try:
+                request.results = next(
+                    evaluate_batch([request], request.calc_confidence_intervals)
+                )
+            except Exception as e:
+                error = e
+        request.error = error
+        request.done.set()
+
+    def _run(self):
+        while True:
+            request = self.queue.get()
+            if request is None:
+                return
+            batch = self._next_batch(request)
+            self._evaluate(batch)
+            self.evaluated_requests += len(batch)
+            self.evaluated_batches += 1
+
+
+def _to_json(value):
+    # numpy scalars and arrays in scores
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class EvaluationRequestHandler(BaseHTTPRequestHandler):
+    """Handles ``GET /health`` and ``POST /evaluate``.
+
+    The body of ``/evaluate`` is a json object with "predictions", "references" (the
+    instances of the dataset, as given to ``unitxt.api.evaluate``) and optionally
+    "calc_confidence_intervals". The results are streamed back as json lines, one
+    evaluated instance per line.
+    """
+
+    def log_message(self, format, *args):
+        message = format % args
+        logger.debug(message)
+
+    def _send_json(self, status: HTTPStatus, data: Dict[str, Any]):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        if self.path != "/health":
+            self._send_json(
+                HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"}
+            )
+            return
+        evaluator = self.server.evaluator
+        self._send_json(
+            HTTPStatus.OK,
+            {
+                "status": "ok",
+                "pending_requests": evaluator.queue.qsize(),
+                "evaluated_requests": evaluator.evaluated_requests,
+                "evaluated_batches": evaluator.evaluated_batches,
+            },
+        )
+
+    def do_POST(self):  # noqa: N802
+        if self.path != "/evaluate":
+            self._send_json(
+                HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"}
+            )
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            request = EvaluationRequest(
+                body["predictions"],
+                body["references"],
+                body.get("calc_confidence_intervals", True),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Bad request: {e}"})
+            return
+        try:
+            results = self.server.evaluator.submit(request).wait()
+        except Exception as e:
+            self._send_json(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"}
+            )
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for instance in results:
+            self.wfile.write(json.dumps(instance, default=_to_json).encode() + b"\n")
+
+
+class EvaluationService:
+    """A local HTTP evaluation service that keeps metrics warm between requests.
+
+    The metrics given are loaded (with their models) when the service starts, and
+    every other metric is loaded on its first use and kept. Catalogs are registered
+    once. Requests are evaluated one batch at a time on a single thread (see ``BatchEvaluator``).
+
+    Args:
+        host (str): The host to listen on. Defaults to localhost.
+        port (int): The port to listen on. 0 picks a free port.
+        metrics (Iterable[str]): Metrics to load when the service starts.
+        max_batch_instances (int): The maximal number of instances evaluated in one batch.
+        batch_wait (float): Seconds to wait for more requests before evaluating a batch.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        metrics: Iterable[str] = (),
+        max_batch_instances: int = 10000,
+        batch_wait: float = 0.005,
+    ):
+        self.metrics = list(metrics)
+        self.evaluator = BatchEvaluator(
+            max_batch_instances=max_batch_instances, batch_wait=batch_wait
+        )
+        self.server = ThreadingHTTPServer((host, port), EvaluationRequestHandler)
+        self.server.daemon_threads = True
+        self.server.evaluator = self.evaluator
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _start(self):
+        warm_up(metrics=self.metrics)
+        self.evaluator.start()
+        logger.info(f"Evaluation service is listening on {self.url}")
+
+    def serve_forever(self):
+        self._start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.close()
+
+    def start(self):
+        """Serve on a background thread."""
+        self._start()
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+        self.evaluator.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class EvaluationClient:
+    """A client of an ``EvaluationService``.
+
+    Args:
+        url (str): The url of the service.
+        timeout (float, optional): Seconds to wait for a response.
+    """
+
+    def __init__(
+        self,
+        url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}",
+        timeout: Optional[float] = None,
+    ):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def health(self) -> Dict[str, Any]:
+        from .http_utils import get_session
+
+        response = get_session().get(self.url + "/health", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def iter_evaluate(
+        self,
+        predictions: List[str],
+        data: Iterable[Dict[str, Any]],
+        calc_confidence_intervals: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Evaluate like ``unitxt.api.evaluate``, yielding the evaluated instances as they are received."""
+        from .http_utils import get_session
+
+        response = get_session().post(
+            self.url + "/evaluate",
+            json={
+                "predictions": list(predictions),
+                "references": list(data),
+                "calc_confidence_intervals": calc_confidence_intervals,
+            },
+            stream=True,
+            timeout=self.timeout,
+        )
+        with response:
+            if response.status_code != HTTPStatus.OK:
+                try:
+                    error = response.json()["error"]
+                except ValueError:
+                    error = response.text
+                raise RuntimeError(
+                    f"Evaluation service returned {response.status_code}: {error}"
+                )
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+    def evaluate(
+        self,
+        predictions: List[str],
+        data: Iterable[Dict[str, Any]],
+        calc_confidence_intervals: bool = True,
+    ) -> List[Dict[str, Any]]:
+        return list(self.iter_evaluate(predictions, data, calc_confidence_intervals))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a local unitxt evaluation service."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--metrics", nargs="*", default=[], help="Metrics to load on start up."
+    )
+    parser.add_argument("--max-batch-instances", type=int, default=10000)
+    parser.add_argument(
+        "--batch-wait",
+        type=float,
+        default=0.005,
+        help="Seconds to wait for more requests before evaluating a batch.",
+    )
+    args = parser.parse_args()
+
+    EvaluationService(
+        host=args.host,
+        port=args.port,
+        metrics=args.metrics,
+        max_batch_instances=args.max_batch_instances,
+        batch_wait=args.batch_wait,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""Dry-run plans of sequential operators and recipes.
+
+``explain`` runs the steps of a ``SourceSequentialOperator`` (e.g., a recipe) on a
+sample of the instances of its loader, one step at a time, and reports per step:
+
+* instances in and out, and the selectivity (out / in).
+* the time per instance, and the peak memory of the step.
+* the splits it reads and the splits it creates (the fan-out of splitters).
+* how many passes it makes over its input streams. A step that reads its input
+  more than once (e.g., ``SplitByValue`` reads it once per group) re-runs all the
+  operators upstream of it on every pass, so its cost grows with the number of passes.
+* the fields it adds and removes.
+
+Every step runs on a copy of the materialized output of the step before it, so its
+time and memory are its own. When the number of instances the loader produces is
+known, the time and memory of every step are extrapolated (linearly) to it.
+"""
+import copy
+import itertools
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Set, Union
+
+from .stream import MultiStream, Stream
+
+
+def _counted_stream(instances: List[Dict[str, Any]], counts: Dict[str, int]):
+    counts["passes"] += 1
+    for instance in instances:
+        counts["reads"] += 1
+        yield instance
+
+
+def _fields(streams: Dict[str, List[Dict[str, Any]]]) -> Set[str]:
+    fields = set()
+    for instances in streams.values():
+        for instance in instances:
+            fields.update(instance.keys())
+    return fields
+
+
+def _format_size(size: Optional[float]) -> str:
+    if size is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+class StepPlan:
+    """The measurements of one step on the sample."""
+
+    def __init__(self, index: int, step):
+        self.index = index
+        self.step = step.__class__.__name__
+        self.instances_in = 0
+        self.instances_out = 0
+        self.seconds = 0.0
+        self.peak_bytes = None
+        self.splits_in: List[str] = []
+        self.splits_out: List[str] = []
+        self.passes = 0.0
+        self.fields_added: List[str] = []
+        self.fields_removed: List[str] = []
+        self.estimated_seconds = None
+        self.estimated_peak_bytes = None
+
+    @property
+    def selectivity(self) -> Optional[float]:
+        if not self.instances_in:
+            return None
+        return self.instances_out / self.instances_in
+
+    @property
+    def seconds_per_instance(self) -> Optional[float]:
+        count = self.instances_in or self.instances_out
+        if not count:
+            return None
+        return self.seconds / count
+
+    @property
+    def new_splits(self) -> List[str]:
+        return [split for split in self.splits_out if split not in self.splits_in]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "step": self.step,
+            "instances_in": self.instances_in,
+            "instances_out": self.instances_out,
+            "selectivity": self.selectivity,
+            "seconds": self.seconds,
+            "seconds_per_instance": self.seconds_per_instance,
+            "peak_bytes": self.peak_bytes,
+            "splits_in": self.splits_in,
+            "splits_out": self.splits_out,
+            "new_splits": self.new_splits,
+            "passes": self.passes,
+            "fields_added": self.fields_added,
+            "fields_removed": self.fields_removed,
+            "estimated_seconds": self.estimated_seconds,
+            "estimated_peak_bytes": self.estimated_peak_bytes,
+        }
+
+
+class Plan:
+    """The measurements of all the steps, and their extrapolation to the full data."""
+
+    def __init__(
+        self,
+        steps: List[StepPlan],
+        sample_size: int,
+        sampled_instances: int,
+        full_instances: Optional[int],
+    ):
+        self.steps = steps
+        self.sample_size = sample_size
+        self.sampled_instances = sampled_instances
+        self.full_instances = full_instances
+
+    @property
+    def scale(self) -> Optional[float]:
+        if self.full_instances is None or not self.sampled_instances:
+            return None
+        return self.full_instances / self.sampled_instances
+
+    @property
+    def seconds(self) -> float:
+        return sum(step.seconds for step in self.steps)
+
+    @property
+    def estimated_seconds(self) -> Optional[float]:
+        if self.scale is None:
+            return None
+        return self.seconds * self.scale
+
+    @property
+    def estimated_peak_bytes(self) -> Optional[float]:
+        sizes = [
+            step.estimated_peak_bytes
+            for step in self.steps
+            if step.estimated_peak_bytes is not None
+        ]
+        return max(sizes) if sizes else None
+
+    def hotspots(self) -> List[StepPlan]:
+        """The steps that read their input more than once."""
+        return [step for step in self.steps if step.passes > 1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sample_size": self.sample_size,
+            "sampled_instances": self.sampled_instances,
+            "full_instances": self.full_instances,
+            "seconds": self.seconds,
+            "estimated_seconds": self.estimated_seconds,
+            "estimated_peak_bytes": self.estimated_peak_bytes,
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'#':>3} {'step':<28} {'in':>7} {'out':>7} {'select':>7} {'per inst':>9} "
+            f"{'passes':>6} {'memory':>9} {'est time':>9} {'est mem':>9}  fields / splits"
+        ]
+        for step in self.steps:
+            selectivity = "-" if step.selectivity is None else f"{step.selectivity:.2f}"
+            per_instance = step.seconds_per_instance
+            per_instance = (
+                "-" if per_instance is None else f"{per_instance * 1e6:.0f}us"
+            )
+            notes = [f"+{field}" for field in step.fields_added]
+            notes.extend(f"-{field}" for field in step.fields_removed)
+            if step.new_splits:
+                notes.append(f"splits: {', '.join(step.new_splits)}")
+            lines.append(
+                f"{step.index:>3} {step.step[:28]:<28} {step.instances_in:>7} "
+                f"{step.instances_out:>7} {selectivity:>7} {per_instance:>9} "
+                f"{step.passes:>5.1f}{'*' if step.passes > 1 else ' '} "
+                f"{_format_size(step.peak_bytes):>9} "
+                f"{_format_seconds(step.estimated_seconds):>9} "
+                f"{_format_size(step.estimated_peak_bytes):>9}  {' '.join(notes)}"
+            )
+        lines.append("")
+        lines.append(
+            f"Sampled {self.sampled_instances} instances (up to {self.sample_size} per split) "
+            f"in {_format_seconds(self.seconds)}."
+        )
+        if self.scale is not None:
+            lines.append(
+                f"Estimated for {self.full_instances} instances: "
+                f"{_format_seconds(self.estimated_seconds)}, "
+                f"peak memory {_format_size(self.estimated_peak_bytes)}."
+            )
+        hotspots = self.hotspots()
+        if hotspots:
+            lines.append(
+                "Steps marked with * read their input more than once, re-running "
+                "the steps before them on every pass: "
+                + ", ".join(f"{step.index} ({step.step})" for step in hotspots)
+            )
+        return "\n".join(lines)
+
+
+def _run_step(step, inputs, is_source, sample_size, counts):
+    if is_source:
+        return {
+            name: list(itertools.islice(stream, sample_size))
+            for name, stream in step().items()
+        }
+    multi_stream = MultiStream(
+        {
+            name: Stream(
+                _counted_stream,
+                gen_kwargs={"instances": instances, "counts": counts[name]},
+            )
+            for name, instances in inputs.items()
+        }
+    )
+    return {name: list(stream) for name, stream in step(multi_stream).items()}
+
+
+def _measure_peak_memory(step, inputs, is_source, sample_size) -> int:
+    counts = {name: {"passes": 0, "reads": 0} for name in inputs}
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        _run_step(step, copy.deepcopy(inputs), is_source, sample_size, counts)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def explain(
+    operator,
+    sample_size: int = 100,
+    full_size: Optional[Union[int, Dict[str, int]]] = None,
+    measure_memory: bool = True,
+) -> Plan:
+    """Run the steps of a source sequential operator on a sample, and measure each step.
+
+    Args:
+        operator: a SourceSequentialOperator, e.g., a recipe.
+        sample_size: the instances taken from every split of the loader.
+        full_size: the number of instances the loader produces, in total or per split.
+            When not given, the size of a split is known only if the loader produced
+            fewer than sample_size instances for it, or if a loader_limit is set.
+        measure_memory: measure the peak memory of every step with tracemalloc,
+            which runs every step a second time.
+    """
+    steps = operator.steps[: operator._get_max_steps()]
+    plans = []
+    outputs = None
+    sampled_sizes = {}
+    for index, step in enumerate(steps):
+        is_source = index == 0
+        inputs = {} if is_source else outputs
+        plan = StepPlan(index, step)
+        plan.splits_in = list(inputs.keys())
+        plan.instances_in = sum(len(instances) for instances in inputs.values())
+        counts = {name: {"passes": 0, "reads": 0} for name in inputs}
+
+        start = time.perf_counter()
+        outputs = _run_step(step, copy.deepcopy(inputs), is_source, sample_size, counts)
+        plan.seconds = time.perf_counter() - start
+
+        if measure_memory:
+            plan.peak_bytes = _measure_peak_memory(step, inputs, is_source, sample_size)
+        plan.splits_out = list(outputs.keys())
+        plan.instances_out = sum(len(instances) for instances in outputs.values())
+        if plan.instances_in:
+            plan.passes = (
+                sum(count["reads"] for count in counts.values()) / plan.instances_in
+            )
+        fields_in, fields_out = _fields(inputs), _fields(outputs)
+        plan.fields_added = sorted(fields_out - fields_in)
+        plan.fields_removed = sorted(fields_in - fields_out)
+        if is_source:
+            sampled_sizes = {
+                name: len(instances) for name, instances in outputs.items()
+            }
+        plans.append(plan)
+
+    full_instances = _full_instances(steps[0], sampled_sizes, sample_size, full_size)
+    result = Plan(
+        plans, sample_size, sum(sampled_sizes.values()), full_instances=full_instances
+    )
+    if result.scale is not None:
+        for plan in plans:
+            plan.estimated_seconds = plan.seconds * result.scale
+            if plan.peak_bytes is not None:
+                plan.estimated_peak_bytes = plan.peak_bytes * result.scale
+    return result
+
+
+def _full_instances(source, sampled_sizes, sample_size, full_size) -> Optional[int]:
+    if isinstance(full_size, int):
+        return full_size
+    full_size = full_size or {}
+    get_limit = getattr(source, "get_limit", None)
+    limit = get_limit() if get_limit is not None else None
+    total = 0
+    for name, size in sampled_sizes.items():
+        if name in full_size:
+            total += full_size[name]
+        elif size < sample_size:
+            total += size
+        elif limit is not None:
+            total += limit
+        else:
+            return None
+    return total
@@ -1,5 +1,29 @@
+import bz2
+import gzip
+import hashlib
+import io
+import lzma
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import BinaryIO, Optional
+
+from .settings_utils import get_constants, get_settings
+
+constants = get_constants()
+settings = get_settings()
+
+
+def get_cache_dir(*sub_dirs: str) -> str:
+    """Return the path of a directory under the unitxt cache root.
+
+    The root is ``unitxt.settings.cache_dir`` (env: UNITXT_CACHE_DIR) when set,
+    and ``~/.cache/unitxt`` otherwise.
+
+    :param sub_dirs: Path components appended to the cache root.
+    :return: The path of the directory. It is not created.
+    """
+    root = settings.cache_dir or constants.default_cache_dir
+    return os.path.join(root, *sub_dirs)
 
 
 def get_all_files_in_dir(
@@ -28,3 +52,168 @@ def get_all_files_in_dir(
         if not recursive:
             break
     return files
+
+
+def file_checksum(
+    path: str, algorithm: str = "sha256", chunk_size: int = 1 << 20
+) -> str:
+    """Return the hex digest of the content of a file, read in chunks.
+
+    :param path: The path of the file.
+    :param algorithm: A hashlib algorithm name (e.g., "sha256", "md5").
+    :param chunk_size: The number of bytes read at once.
+    :return: The hex digest.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def file_lock(path: str):
+    """Hold an exclusive lock of a lock file, between processes and threads alike.
+
+    :param path: The path of the lock file. It is created if missing.
+    """
+    try:
+        import fcntl
+    except ImportError:  # not posix
+        yield
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+
+DEFAULT_READ_BUFFER_SIZE = 1 << 20
+
+
+def infer_compression(path: str) -> Optional[str]:
+    """Return the compression of a file by its extension.
+
+    :param path: The path (or name) of the file.
+    :return: "gzip", "bz2", "xz" or "zstd", or None for a file that is not compressed.
+    """
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def _zstd_reader(fileobj: BinaryIO, buffer_size: int):
+    try:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(
+            fileobj, read_size=buffer_size
+        )
+    except ImportError:
+        pass
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Reading zstd compressed files requires the zstandard package (pip install zstandard)"
+        ) from e
+    return pa.CompressedInputStream(pa.PythonFile(fileobj, mode="r"), "zstd")
+
+
+def _decompressor(fileobj: BinaryIO, compression: str, buffer_size: int):
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    if compression == "bz2":
+        return bz2.BZ2File(fileobj, mode="rb")
+    if compression == "xz":
+        return lzma.LZMAFile(fileobj, mode="rb")
+    if compression == "zstd":
+        return _zstd_reader(fileobj, buffer_size)
+    raise ValueError(
+        f"Unsupported compression '{compression}', expected one of {list(COMPRESSION_EXTENSIONS.values())}"
+    )
+
+
+class _RawReader(io.RawIOBase):
+    """A raw stream reading from any object with a read method (e.g., an http response body)."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.fileobj.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def decompressed_stream(
+    fileobj: BinaryIO,
+    compression: Optional[str],
+    buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+) -> BinaryIO:
+    """Return a buffered binary stream of the decompressed content of a binary stream.
+
+    The content is decompressed while it is read, e.g., from the body of an http response.
+    Closing the returned stream does not close fileobj.
+
+    :param fileobj: The compressed binary stream.
+    :param compression: "gzip", "bz2", "xz", "zstd" (through the zstandard package when
+        installed, and pyarrow otherwise), or None for no compression.
+    :param buffer_size: The size of the buffer of the returned stream.
+    :return: The buffered decompressed stream.
+    """
+    if compression is None:
+        return io.BufferedReader(_RawReader(fileobj), buffer_size=buffer_size)
+    return io.BufferedReader(
+        _decompressor(fileobj, compression, buffer_size), buffer_size=buffer_size
+    )
+
+
+class _DecompressedFile(io.BufferedReader):
+    """A buffered decompressed stream of a file, which closes the file when closed."""
+
+    def __init__(self, file: BinaryIO, compression: str, buffer_size: int):
+        super().__init__(
+            _decompressor(file, compression, buffer_size), buffer_size=buffer_size
+        )
+        self.file = file
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self.file.close()
+
+
+def open_file(
+    path: str,
+    compression: Optional[str] = "infer",
+    buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+) -> BinaryIO:
+    """Open a local file for reading in binary mode, decompressing it while it is read.
+
+    Compressed files are streamed, never decompressed to disk or into memory as a whole,
+    and are read through a large buffer.
+
+    :param path: The path of the file.
+    :param compression: "infer" to infer the compression from the extension of the file
+        (.gz, .bz2, .xz or .zst), a compression as accepted by decompressed_stream, or None.
+    :param buffer_size: The size of the read buffer.
+    :return: The opened binary stream, to be closed by the caller (e.g., used as a context manager).
+    """
+    if compression == "infer":
+        compression = infer_compression(path)
+    file = open(path, "rb", buffering=buffer_size)
+    if compression is None:
+        return file
+    try:
+        return _DecompressedFile(file, compression, buffer_size)
+    except BaseException:
+        file.close()
+        raise
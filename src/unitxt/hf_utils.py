@@ -1,11 +1,11 @@
 from pathlib import Path
 
-from datasets.utils.py_utils import get_imports
-
 from .file_utils import get_all_files_in_dir
 
 
 def get_missing_imports(file, exclude=None):
+    from datasets.utils.py_utils import get_imports
+
     if exclude is None:
         exclude = []
     src_dir = Path(__file__).parent
@@ -0,0 +1,294 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+
+from .logging_utils import get_logger
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_maxsize: int = 32) -> "requests.Session":
+    """Return a process-wide ``requests.Session`` with a pooled connection adapter.
+
+    Reusing one session keeps TCP/TLS connections alive between requests to the
+    same host, which matters when many small files are fetched from the same server.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+    return _session
+
+
+def reset_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def atomic_write_json(path: str, data: Any):
+    """Write json to path through a temporary file in the same directory and a rename."""
+    dir_name = os.path.dirname(path)
+    os.makedirs(dir_name, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=dir_name, delete=False, suffix=".tmp"
+    ) as f:
+        json.dump(data, f, ensure_ascii=False)
+        temp_path = f.name
+    # Temporary files are created readable only by their owner
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, path)
+
+
+def _completed_parts(part_file: str, state_file: str, expected: Dict[str, Any]):
+    """The parts of a partial download already written, or none if it downloaded another object."""
+    if os.path.exists(part_file):
+        try:
+            with open(state_file) as f:
+                state = json.load(f)
+            if all(state.get(key) == value for key, value in expected.items()):
+                return set(state["done"])
+        except (OSError, ValueError, KeyError):
+            pass
+    with open(part_file, "wb") as f:
+        f.truncate(expected["size"])
+    return set()
+
+
+def download_in_parts(
+    read_range: Callable[[int, int], Iterable[bytes]],
+    size: int,
+    local_file: str,
+    version: str = "",
+    part_size: int = 16 << 20,
+    max_workers: int = 8,
+    executor: Optional[Executor] = None,
+    progress: Optional[Callable[[int], Any]] = None,
+):
+    """Download an object of a known size into local_file, reading its byte ranges concurrently.
+
+    read_range(start, end) returns the bytes of the object from start to end (inclusive),
+    e.g., by a GET with a "Range: bytes=start-end" header. The parts are written into
+    local_file + ".part", and the completed parts are recorded next to it, so a download
+    that was interrupted continues with the missing parts only, unless the size or the
+    version (e.g., the ETag) of the object changed. local_file is renamed into place
+    once complete, so it never holds a partial download.
+
+    Args:
+        read_range: reads a range of bytes of the object.
+        size: the size of the object in bytes.
+        local_file: the path to download to.
+        version: the version of the object; a partial download of another version is discarded.
+        part_size: the size of the ranges read.
+        max_workers: the number of ranges read concurrently, when no executor is given.
+        executor: the executor to read the ranges with, e.g., shared by downloads of several objects.
+        progress: called with the number of bytes of every chunk written.
+    """
+    part_file = local_file + ".part"
+    state_file = part_file + ".json"
+    expected = {"size": size, "version": version, "part_size": part_size}
+    done = _completed_parts(part_file, state_file, expected)
+    if done:
+        logger.info(f"Resuming the download of {local_file}")
+
+    parts = [
+        (start, min(start + part_size, size) - 1) for start in range(0, size, part_size)
+    ]
+    state_lock = threading.Lock()
+
+    def download_part(index: int):
+        start, end = parts[index]
+        position = start
+        with open(part_file, "r+b") as f:
+            f.seek(start)
+            for chunk in read_range(start, end):
+                f.write(chunk)
+                position += len(chunk)
+                if progress is not None:
+                    progress(len(chunk))
+        if position != end + 1:
+            raise OSError(
+                f"Expected bytes {start}-{end} of {local_file}, got {position - start} bytes"
+            )
+        with state_lock:
+            done.add(index)
+            atomic_write_json(state_file, {**expected, "done": sorted(done)})
+
+    pending = [index for index in range(len(parts)) if index not in done]
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as own_executor:
+            futures = [own_executor.submit(download_part, index) for index in pending]
+    else:
+        futures = [executor.submit(download_part, index) for index in pending]
+    for future in futures:
+        future.result()
+
+    os.replace(part_file, local_file)
+    if os.path.exists(state_file):
+        os.remove(state_file)
+
+
+class CachedJsonFetcher:
+    """Fetches json documents over http, with an in-memory and an on-disk cache.
+
+    Every url is fetched at most once per fetcher. Responses that carry an
+    ``ETag`` or ``Last-Modified`` header are stored on disk under ``cache_dir``,
+    and later fetches (for example, in a new process) revalidate them with
+    ``If-None-Match``/``If-Modified-Since``, so an unchanged document costs a
+    body-less 304 response. If the server cannot be reached, a stored copy is used.
+
+    Args:
+        cache_dir (str, optional): Directory of the on-disk cache. If None, only the in-memory cache is used.
+        session (requests.Session, optional): Session to use. Defaults to the shared pooled session.
+        timeout (float): Timeout in seconds of each request.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        session: Optional["requests.Session"] = None,
+        timeout: float = 30,
+    ):
+        self.cache_dir = cache_dir
+        self.session = session
+        self.timeout = timeout
+        self._responses: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get_session(self):
+        if self.session is None:
+            return get_session()
+        return self.session
+
+    def _entry_path(self, url: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _read_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(url)
+        if path is None or not os.path.isfile(path):
+            return None
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, json.decoder.JSONDecodeError):
+            return None
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def _write_entry(self, url: str, response: "requests.Response", data: Any):
+        path = self._entry_path(url)
+        if path is None:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+        try:
+            atomic_write_json(
+                path,
+                {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "data": data,
+                },
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write http cache entry for {url}: {e}")
+
+    @staticmethod
+    def _revalidation_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        headers = {}
+        if entry is not None:
+            if entry.get("etag") is not None:
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified") is not None:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def _on_failure(
+        url: str, response: "requests.Response", entry: Optional[Dict[str, Any]]
+    ) -> Any:
+        import requests
+
+        if entry is None:
+            response.raise_for_status()
+            raise requests.exceptions.HTTPError(
+                f"Unexpected status {response.status_code} for url: {url}",
+                response=response,
+            )
+        logger.warning(
+            f"Fetching {url} failed with status {response.status_code}, using cached copy."
+        )
+        return entry["data"]
+
+    def is_fetched(self, url: str) -> bool:
+        with self._lock:
+            return url in self._responses
+
+    def fetch(self, url: str) -> Optional[Any]:
+        """Return the parsed json document at url, or None if it does not exist (404).
+
+        Other failures raise requests.exceptions.HTTPError, unless a stored copy is used.
+        """
+        import requests
+
+        with self._lock:
+            if url in self._responses:
+                return self._responses[url]
+
+        entry = self._read_entry(url)
+        headers = self._revalidation_headers(entry)
+        try:
+            response = self._get_session().get(
+                url, headers=headers, timeout=self.timeout
+            )
+        except requests.exceptions.ConnectionError:
+            if entry is None:
+                raise
+            logger.warning(f"Could not reach {url}, using cached copy.")
+            data = entry["data"]
+        else:
+            if response.status_code == 304 and entry is not None:
+                data = entry["data"]
+            elif response.status_code == 200:
+                data = response.json()
+                self._write_entry(url, response, data)
+            elif response.status_code == 404:
+                data = None
+            else:
+                # a failure (e.g., 503 or 429) says nothing about the document, so it
+                # is not remembered, and the next fetch asks again
+                return self._on_failure(url, response, entry)
+
+        with self._lock:
+            self._responses[url] = data
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._responses = {}
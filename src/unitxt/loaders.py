@@ -18,30 +18,73 @@ straight forward.
 Operators in Unitxt catalog:
 LoadHF : loads from Huggingface dataset.
 LoadCSV: loads from csv (comma separated value) files
+LoadJsonl: loads from JSON Lines files
+LoadParquet: loads from Parquet files
+LoadFromSQL: loads the results of SQL queries, from SQLite or any DB-API database
+LoadFromDataFrame, LoadFromArrow: load in-memory pandas DataFrames and pyarrow Tables
 LoadFromKaggle: loads datasets from the kaggle.com community site
 LoadFromIBMCloud: loads a dataset from the IBM cloud.
 ------------------------
 """
+import glob
+import importlib
 import itertools
+import json
+import mmap
 import os
+import re
 import tempfile
+from abc import abstractmethod
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Dict, List, Mapping, Optional, Sequence, Union
-
-import pandas as pd
-from datasets import load_dataset as hf_load_dataset
-from tqdm import tqdm
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+from urllib.parse import urlparse
 
 from .dataclass import InternalField
+from .dataset_cache import DatasetCache, get_dataset_cache
+from .file_utils import (
+    COMPRESSION_EXTENSIONS,
+    decompressed_stream,
+    infer_compression,
+    open_file,
+)
+from .http_utils import download_in_parts
 from .logging_utils import get_logger
+from .memory_profiling import is_memory_profiling, memory_profiled
 from .operator import SourceOperator
+from .random_utils import new_random_generator, reservoir_sample, sample_indices
 from .settings_utils import get_settings
 from .stream import MultiStream, Stream
+from .telemetry import (
+    instrumented_stream,
+    is_telemetry_enabled,
+    record_cache,
+    record_loader_bytes,
+)
 
 logger = get_logger()
 settings = get_settings()
 
+LOADER_SAMPLING_MODES = ["head", "random", "stratified"]
+
 
 class Loader(SourceOperator):
     # The loader_limit an optional parameter used to control the maximum number of instances to load from the the source.
@@ -53,6 +96,25 @@ class Loader(SourceOperator):
     loader_limit: int = None
     streaming: bool = False
 
+    # How the loader_limit instances of every split are chosen: "head" takes the first
+    # ones, "random" a seeded random sample, and "stratified" a seeded random sample
+    # in which every value of loader_sampling_field is as frequent as in the split.
+    # Loaders over random-access data (e.g., non-streamed HF datasets and Parquet files)
+    # read only the sampled rows, and streaming loaders take a reservoir sample.
+    loader_sampling: str = "head"
+    loader_sampling_field: Optional[str] = None
+
+    def verify(self):
+        super().verify()
+        if self.loader_sampling not in LOADER_SAMPLING_MODES:
+            raise ValueError(
+                f"loader_sampling must be one of {LOADER_SAMPLING_MODES}, got '{self.loader_sampling}'"
+            )
+        if self.loader_sampling == "stratified" and self.loader_sampling_field is None:
+            raise ValueError(
+                "loader_sampling='stratified' requires loader_sampling_field, the field to stratify by"
+            )
+
     def get_limit(self):
         if settings.global_loader_limit is not None and self.loader_limit is not None:
             return min(int(settings.global_loader_limit), self.loader_limit)
@@ -70,12 +132,125 @@ class Loader(SourceOperator):
         return f"{self.__class__.__name__}.loader_limit"
 
     def log_limited_loading(self):
-        logger.info(
-            f"\nLoading limited to {self.get_limit()} instances by setting {self.get_limiter()};"
+        message = f"\nLoading limited to {self.get_limit()} instances by setting {self.get_limiter()};"
+        if self.get_sampling() != "head":
+            message += f" sampling: {self.get_sampling()};"
+        logger.info(message)
+
+    def get_sampling(self) -> str:
+        """The loader_sampling mode, or "head" when the loading is not limited."""
+        if self.get_limit() is None:
+            return "head"
+        return self.loader_sampling
+
+    def get_sampling_random_generator(self, split: str):
+        return new_random_generator(sub_seed=f"loader_sampling/{split}")
+
+    def sample_indices(
+        self, num_rows: int, split: str, strata: Optional[Sequence[Any]] = None
+    ) -> List[int]:
+        """The sorted indices of the rows of a random-access split to load.
+
+        strata are the values of loader_sampling_field of the rows, needed
+        for "stratified" sampling only.
+        """
+        limit = self.get_limit()
+        sampling = self.get_sampling()
+        if sampling == "head":
+            return list(range(num_rows if limit is None else min(limit, num_rows)))
+        return sample_indices(
+            num_rows,
+            limit,
+            self.get_sampling_random_generator(split),
+            strata=strata if sampling == "stratified" else None,
+        )
+
+    def sample_stream(
+        self, instances: Iterable[Dict[str, Any]], split: str
+    ) -> Generator:
+        """Yield the instances of a streamed split to load: a reservoir sample, unless sampling is "head"."""
+        limit = self.get_limit()
+        sampling = self.get_sampling()
+        if sampling == "head":
+            yield from itertools.islice(instances, limit)
+            return
+        stratum = None
+        if sampling == "stratified":
+            field = self.loader_sampling_field
+
+            def stratum(instance):
+                return instance.get(field)
+
+        yield from reservoir_sample(
+            instances, limit, self.get_sampling_random_generator(split), stratum
+        )
+
+    def __call__(self, multi_stream: Optional[MultiStream] = None) -> MultiStream:
+        multi_stream = super().__call__(multi_stream)
+        if is_telemetry_enabled():
+            multi_stream = MultiStream(
+                {
+                    name: Stream(
+                        instrumented_stream,
+                        gen_kwargs={
+                            "generator": stream.__iter__,
+                            "gen_kwargs": {},
+                            "instances_counter": "unitxt_loader_rows_total",
+                            "seconds_counter": "unitxt_loader_seconds_total",
+                            "labels": {
+                                "loader": self.__class__.__name__,
+                                "split": name,
+                            },
+                        },
+                    )
+                    for name, stream in multi_stream.items()
+                }
+            )
+        if is_memory_profiling():
+            multi_stream = MultiStream(
+                {
+                    name: memory_profiled(stream, self.__class__, name)
+                    for name, stream in multi_stream.items()
+                }
+            )
+        return multi_stream
+
+
+def load_prepared_dataset(key_parts: Dict[str, Any], prepare, description: str = ""):
+    """Return the (HF) dataset prepare() returns, keeping it in the persistent dataset cache.
+
+    The dataset is saved to the cache under a key made of key_parts, and later
+    calls with the same key_parts load it from the cache (memory mapped) instead of
+    calling prepare(). When the dataset cache is disabled, prepare() is always called.
+    """
+    from datasets import load_from_disk
+
+    dataset_cache = get_dataset_cache()
+    if dataset_cache is None:
+        return prepare()
+    key = DatasetCache.key(**key_parts)
+    entry_dir = dataset_cache.get(key)
+    if entry_dir is None:
+        dataset = prepare()
+        dataset_cache.put(
+            key,
+            lambda directory: dataset.save_to_disk(os.path.join(directory, "dataset")),
+            description=description,
         )
+        return dataset
+    return load_from_disk(os.path.join(entry_dir, "dataset"))
 
 
 class LoadHF(Loader):
+    """Loads a dataset from the Huggingface hub, or with a Huggingface dataset builder.
+
+    Datasets are streamed when possible. Datasets that cannot be streamed (or when
+    streaming=False) are downloaded and prepared once, and kept in the persistent
+    dataset cache (see unitxt.dataset_cache), which also remembers that they cannot
+    be streamed, so later runs do not try streaming them first. Hub datasets without a
+    revision are cached per their current commit on the hub.
+    """
+
     path: str
     name: Optional[str] = None
     data_dir: Optional[str] = None
@@ -83,10 +258,47 @@ class LoadHF(Loader):
     data_files: Optional[
         Union[str, Sequence[str], Mapping[str, Union[str, Sequence[str]]]]
     ] = None
+    revision: Optional[str] = None
     streaming: bool = True
+    # the number of processes preparing the data files of non-streamed datasets
+    num_proc: Optional[int] = None
     _cache: dict = InternalField(default=None)
 
+    def cache_key_parts(self, limited: bool = False) -> Dict[str, Any]:
+        """The arguments determining the loaded dataset, and if limited, also its limit and sampling."""
+        parts = {
+            "loader": self.__class__.__name__,
+            "path": self.path,
+            "name": self.name,
+            "data_dir": self.data_dir,
+            "data_files": self.data_files,
+            "split": self.split,
+            "revision": self.revision,
+            "loader_limit": None,
+        }
+        if limited and self.get_limit() is not None:
+            parts["loader_limit"] = self.get_limit()
+            if self.get_sampling() != "head":
+                parts["loader_sampling"] = self.get_sampling()
+                parts["loader_sampling_field"] = self.loader_sampling_field
+        return parts
+
+    def sample_split(self, dataset, split: str):
+        """The rows of the loaded (random-access) split to keep, per the loader_limit and loader_sampling."""
+        strata = None
+        if self.get_sampling() == "stratified":
+            if self.loader_sampling_field in dataset.column_names:
+                strata = dataset[self.loader_sampling_field]
+            else:
+                logger.warning(
+                    f"Split '{split}' has no field '{self.loader_sampling_field}' to stratify by, sampling it randomly"
+                )
+        return dataset.select(self.sample_indices(len(dataset), split, strata=strata))
+
     def stream_dataset(self):
+        from datasets import load_dataset as hf_load_dataset
+
+        record_cache("load_hf", hit=self._cache is not None)
         if self._cache is None:
             with tempfile.TemporaryDirectory() as dir_to_be_deleted:
                 try:
@@ -95,6 +307,7 @@ class LoadHF(Loader):
                         name=self.name,
                         data_dir=self.data_dir,
                         data_files=self.data_files,
+                        revision=self.revision,
                         streaming=self.streaming,
                         cache_dir=None if self.streaming else dir_to_be_deleted,
                         split=self.split,
@@ -115,26 +328,81 @@ class LoadHF(Loader):
 
         return dataset
 
+    def is_hub_dataset(self) -> bool:
+        """Whether the path names a dataset of the hub (and not a local or packaged builder)."""
+        from datasets.packaged_modules import _PACKAGED_DATASETS_MODULES
+
+        return self.path not in _PACKAGED_DATASETS_MODULES and not os.path.exists(
+            self.path
+        )
+
+    def dataset_cache_key_parts(self) -> Optional[Dict[str, Any]]:
+        """The key parts of the dataset in the dataset cache, or None to not cache it.
+
+        A hub dataset without a revision is keyed by its current commit, so a change of
+        the dataset on the hub is downloaded again. If the commit cannot be found
+        (e.g., offline), the dataset is not cached.
+        """
+        key_parts = self.cache_key_parts(limited=True)
+        if self.revision is None and self.is_hub_dataset():
+            from huggingface_hub import HfApi
+
+            try:
+                key_parts["revision"] = HfApi().dataset_info(self.path).sha
+            except Exception as e:
+                logger.info(
+                    f"Not caching {self.path}, its current revision is unknown: {e}"
+                )
+                return None
+        return key_parts
+
+    def download_dataset(self, revision: Optional[str] = None):
+        """Download and prepare the dataset, at revision if given (and else at self.revision)."""
+        from datasets import load_dataset as hf_load_dataset
+
+        with tempfile.TemporaryDirectory() as dir_to_be_deleted:
+            try:
+                dataset = hf_load_dataset(
+                    self.path,
+                    name=self.name,
+                    data_dir=self.data_dir,
+                    data_files=self.data_files,
+                    revision=revision or self.revision,
+                    streaming=False,
+                    keep_in_memory=True,
+                    cache_dir=dir_to_be_deleted,
+                    split=self.split,
+                    num_proc=self.num_proc,
+                    trust_remote_code=settings.allow_unverified_code,
+                )
+            except ValueError as e:
+                if "trust_remote_code" in str(e):
+                    raise ValueError(
+                        f"{self.__class__.__name__} cannot run remote code from huggingface without setting unitxt.settings.allow_unverified_code=True or by setting environment vairable: UNITXT_ALLOW_UNVERIFIED_CODE."
+                    ) from e
+                raise
+        if self.get_limit() is not None:
+            # only the sampled instances are kept in the dataset cache
+            if self.split is None:
+                for split in dataset.keys():
+                    dataset[split] = self.sample_split(dataset[split], split)
+            else:
+                dataset = self.sample_split(dataset, self.split)
+        return dataset
+
     def load_dataset(self):
+        record_cache("load_hf", hit=self._cache is not None)
         if self._cache is None:
-            with tempfile.TemporaryDirectory() as dir_to_be_deleted:
-                try:
-                    dataset = hf_load_dataset(
-                        self.path,
-                        name=self.name,
-                        data_dir=self.data_dir,
-                        data_files=self.data_files,
-                        streaming=False,
-                        keep_in_memory=True,
-                        cache_dir=dir_to_be_deleted,
-                        split=self.split,
-                        trust_remote_code=settings.allow_unverified_code,
-                    )
-                except ValueError as e:
-                    if "trust_remote_code" in str(e):
-                        raise ValueError(
-                            f"{self.__class__.__name__} cannot run remote code from huggingface without setting unitxt.settings.allow_unverified_code=True or by setting environment vairable: UNITXT_ALLOW_UNVERIFIED_CODE."
-                        ) from e
+            key_parts = self.dataset_cache_key_parts()
+            if key_parts is None:
+                dataset = self.download_dataset()
+            else:
+                # the dataset is downloaded at the revision of its key
+                dataset = load_prepared_dataset(
+                    key_parts,
+                    lambda: self.download_dataset(key_parts["revision"]),
+                    description=f"{self.path} {self.name or ''}".strip(),
+                )
             if self.split is None:
                 for split in dataset.keys():
                     dataset[split] = dataset[split].to_iterable_dataset()
@@ -148,7 +416,7 @@ class LoadHF(Loader):
         return dataset
 
     def split_limited_load(self, split_name):
-        yield from itertools.islice(self._cache[split_name], self.get_limit())
+        yield from self.sample_stream(self._cache[split_name], split_name)
 
     def limited_load(self):
         self.log_limited_loading()
@@ -162,12 +430,20 @@ class LoadHF(Loader):
         )
 
     def process(self):
-        try:
-            dataset = self.stream_dataset()
-        except (
-            NotImplementedError
-        ):  # streaming is not supported for zipped files so we load without streaming
+        dataset_cache = get_dataset_cache()
+        key = DatasetCache.key(**self.cache_key_parts())
+        if not self.streaming or (
+            dataset_cache is not None
+            and dataset_cache.get_flag(key, "streaming") is False
+        ):
             dataset = self.load_dataset()
+        else:
+            try:
+                dataset = self.stream_dataset()
+            except NotImplementedError:  # streaming is not supported for zipped files so we load without streaming
+                if dataset_cache is not None:
+                    dataset_cache.set_flag(key, "streaming", False)
+                dataset = self.load_dataset()
 
         if self.get_limit() is not None:
             return self.limited_load()
@@ -175,57 +451,828 @@ class LoadHF(Loader):
         return MultiStream.from_iterables(dataset)
 
 
+def _import_function(function: Union[str, Callable]) -> Callable:
+    """A function, or the function of an import path (e.g., "json.loads")."""
+    if isinstance(function, str):
+        module_name, function_name = function.rsplit(".", 1)
+        return getattr(importlib.import_module(module_name), function_name)
+    return function
+
+
 class LoadCSV(Loader):
+    """Loads csv files, one per split.
+
+    Args:
+        files: the file of every split.
+        engine: "pandas", or "pyarrow" to stream the files in record batches with
+            pyarrow.csv.open_csv, which is much faster on large files.
+        columns: read only these columns.
+        dtypes: the types of columns, by column name (e.g., {"label": "string"}).
+            Type names are numpy/pandas dtypes for the pandas engine, and pyarrow
+            type aliases (e.g., "string", "int64", "float64", "bool") for the pyarrow engine.
+        converters: functions converting the values of columns, by column name. Every
+            function gets the text of a value, and is given as a function or as its import
+            path (e.g., "json.loads").
+        sep: the delimiter of the fields.
+        compression: the compression of the files (e.g., "gzip", "bz2"). Inferred
+            from the file extensions when not given.
+        chunksize: the rows read at once by the pandas engine.
+        block_size: the bytes read at once by the pyarrow engine.
+
+    Empty values are NaN with the pandas engine, and None with the pyarrow engine.
+
+    The pyarrow engine infers the types of the columns from the first block of a file
+    (block_size bytes), and fails on a later value that does not fit the inferred type
+    (e.g., a text in a column of numbers). Set the dtypes of such columns.
+    """
+
     files: Dict[str, str]
     chunksize: int = 1000
-    _cache = InternalField(default_factory=dict)
+    _cache: dict = InternalField(default_factory=dict)
     loader_limit: int = None
     streaming: bool = True
+    engine: str = "pandas"
+    columns: Optional[List[str]] = None
+    dtypes: Optional[Dict[str, str]] = None
+    converters: Optional[Dict[str, Union[str, Callable[[str], Any]]]] = None
+    sep: str = ","
+    compression: Optional[str] = None
+    block_size: int = 1 << 20
 
-    def stream_csv(self, file):
-        if self.get_limit() is not None:
-            self.log_limited_loading()
-            chunksize = min(self.get_limit(), self.chunksize)
+    def verify(self):
+        super().verify()
+        assert self.engine in [
+            "pandas",
+            "pyarrow",
+        ], f"LoadCSV engine must be 'pandas' or 'pyarrow', got '{self.engine}'"
+
+    def record_file_size(self, file):
+        if is_telemetry_enabled() and isinstance(file, str) and os.path.isfile(file):
+            record_loader_bytes(self.__class__.__name__, os.path.getsize(file))
+
+    def get_converters(self) -> Dict[str, Callable[[str], Any]]:
+        return {
+            column: _import_function(converter)
+            for column, converter in (self.converters or {}).items()
+        }
+
+    def read_csv_kwargs(self):
+        return {
+            "sep": self.sep,
+            "usecols": self.columns,
+            "dtype": self.dtypes,
+            "converters": self.get_converters() or None,
+        }
+
+    @contextmanager
+    def open_csv(self, file):
+        """The source to read a csv file from, and the compression pandas should decompress.
+
+        Local files compressed by one of the compressions of file_utils.open_file (gzip,
+        bz2, xz or zstd) are opened with it, which decompresses them while they are read.
+        Other files (e.g., urls, uncompressed or zip files) are opened by pandas, and with
+        the pyarrow engine, by fsspec (which reads urls and local files alike).
+        """
+        if isinstance(file, str) and os.path.isfile(file):
+            self.record_file_size(file)
+            compression = self.compression or infer_compression(file)
+            if compression in COMPRESSION_EXTENSIONS.values():
+                with open_file(file, compression=compression) as f:
+                    yield f, None
+                return
+        if self.engine == "pyarrow":
+            with self.open_with_fsspec(file) as f:
+                yield f, None
         else:
-            chunksize = self.chunksize
+            yield file, self.compression or "infer"
+
+    @contextmanager
+    def open_with_fsspec(self, file: str):
+        import fsspec
 
+        compression = self.compression or infer_compression(urlparse(file).path)
+        if compression is None and self.compression is None:
+            compression = fsspec.utils.infer_compression(urlparse(file).path)
+        if compression is None or compression in COMPRESSION_EXTENSIONS.values():
+            # read from the start to the end, so servers need not support range requests
+            with fsspec.open(file, "rb", block_size=0) as f, decompressed_stream(
+                f, compression
+            ) as stream:
+                yield stream
+        else:
+            # e.g., zip, which needs random access, and which fsspec decompresses
+            with fsspec.open(file, "rb", compression=compression) as f:
+                yield f
+
+    def read_rows(self, file, limit: Optional[int] = None) -> Generator:
+        """Yield the rows of a csv file, stopping after limit rows."""
+        if self.engine == "pyarrow":
+            yield from self.read_rows_with_pyarrow(file, limit)
+            return
+
+        import pandas as pd
+
+        chunksize = self.chunksize if limit is None else min(limit, self.chunksize)
         row_count = 0
-        for chunk in pd.read_csv(file, chunksize=chunksize):
-            for _, row in chunk.iterrows():
-                if self.get_limit() is not None and row_count >= self.get_limit():
+        with self.open_csv(file) as (source, compression):
+            for chunk in pd.read_csv(
+                source,
+                chunksize=chunksize,
+                compression=compression,
+                **self.read_csv_kwargs(),
+            ):
+                if limit is not None and row_count + len(chunk) > limit:
+                    chunk = chunk.iloc[: limit - row_count]
+                yield from chunk.to_dict("records")
+                row_count += len(chunk)
+                if limit is not None and row_count >= limit:
                     return
-                yield row.to_dict()
-                row_count += 1
 
-    def load_csv(self, file):
+    def pyarrow_convert_options(self, columns: Optional[List[str]]):
+        import pyarrow as pa
+        from pyarrow import csv
+
+        # the converters get the texts of the values
+        dtypes = {column: "string" for column in self.converters or {}}
+        dtypes.update(self.dtypes or {})
+        return csv.ConvertOptions(
+            include_columns=columns,
+            column_types={
+                column: pa.type_for_alias(dtype) for column, dtype in dtypes.items()
+            },
+        )
+
+    def convert_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        converters = self.get_converters()
+        for record in records:
+            for column, converter in converters.items():
+                if column in record:
+                    record[column] = converter(record[column])
+        return records
+
+    def read_rows_with_pyarrow(self, file, limit: Optional[int] = None) -> Generator:
+        import pyarrow as pa
+        from pyarrow import csv
+
+        row_count = 0
+        with self.open_csv(file) as (f, _):
+            try:
+                reader = csv.open_csv(
+                    f,
+                    read_options=csv.ReadOptions(block_size=self.block_size),
+                    parse_options=csv.ParseOptions(delimiter=self.sep),
+                    convert_options=self.pyarrow_convert_options(self.columns),
+                )
+                for batch in reader:
+                    if limit is not None and row_count + batch.num_rows > limit:
+                        batch = batch.slice(0, limit - row_count)
+                    yield from self.convert_records(batch.to_pylist())
+                    row_count += batch.num_rows
+                    if limit is not None and row_count >= limit:
+                        return
+            except pa.ArrowInvalid as e:
+                raise ValueError(
+                    f"Failed to read {file} after {row_count} rows: {e}. The pyarrow "
+                    "engine infers the types of the columns from the first block of "
+                    "the file, set the dtypes of columns with other values later on."
+                ) from e
+
+    def sample_rows(self, file, split: str) -> List[Dict[str, Any]]:
+        """The rows of a csv file sampled per loader_sampling.
+
+        With the pandas engine, a first pass parses only the column to stratify by (or
+        the first column, to count the rows), and the second pass parses only the
+        sampled rows. The pyarrow engine reads the file as a table and takes the
+        sampled rows from it.
+        """
+        field = None
+        if self.get_sampling() == "stratified":
+            field = self.loader_sampling_field
+
+        if self.engine == "pyarrow":
+            from pyarrow import csv
+
+            columns = self.columns
+            if field is not None and columns is not None and field not in columns:
+                columns = [*columns, field]
+            with self.open_csv(file) as (f, _):
+                table = csv.read_csv(
+                    f,
+                    read_options=csv.ReadOptions(block_size=self.block_size),
+                    parse_options=csv.ParseOptions(delimiter=self.sep),
+                    convert_options=self.pyarrow_convert_options(columns),
+                )
+            strata = None if field is None else table.column(field).to_pylist()
+            table = table.take(self.sample_indices(table.num_rows, split, strata))
+            if columns is not self.columns:
+                table = table.select(self.columns)
+            return self.convert_records(table.to_pylist())
+
+        import pandas as pd
+
+        with self.open_csv(file) as (source, compression):
+            index = pd.read_csv(
+                source,
+                usecols=[0] if field is None else [field],
+                sep=self.sep,
+                compression=compression,
+            )
+        strata = None if field is None else index[field].tolist()
+        selected = set(self.sample_indices(len(index), split, strata))
+        with self.open_csv(file) as (source, compression):
+            return pd.read_csv(
+                source,
+                # row 0 is the header
+                skiprows=lambda row: row > 0 and row - 1 not in selected,
+                compression=compression,
+                **self.read_csv_kwargs(),
+            ).to_dict("records")
+
+    def stream_csv(self, file, split: Optional[str] = None):
+        limit = self.get_limit()
+        if limit is not None:
+            self.log_limited_loading()
+        if self.get_sampling() == "head":
+            yield from self.read_rows(file, limit)
+        else:
+            yield from self.sample_stream(self.read_rows(file), split)
+
+    def load_csv(self, file, split: Optional[str] = None):
+        record_cache("load_csv", hit=file in self._cache)
         if file not in self._cache:
-            if self.get_limit() is not None:
+            limit = self.get_limit()
+            if limit is not None:
                 self.log_limited_loading()
-                self._cache[file] = pd.read_csv(file, nrows=self.get_limit()).to_dict(
-                    "records"
-                )
+            if self.get_sampling() != "head":
+                self._cache[file] = self.sample_rows(file, split)
+            elif self.engine == "pyarrow":
+                self._cache[file] = list(self.read_rows_with_pyarrow(file, limit))
             else:
-                self._cache[file] = pd.read_csv(file).to_dict("records")
+                import pandas as pd
+
+                with self.open_csv(file) as (source, compression):
+                    self._cache[file] = pd.read_csv(
+                        source,
+                        nrows=limit,
+                        compression=compression,
+                        **self.read_csv_kwargs(),
+                    ).to_dict("records")
 
         yield from self._cache[file]
 
     def process(self):
-        if self.streaming:
-            return MultiStream(
-                {
-                    name: Stream(generator=self.stream_csv, gen_kwargs={"file": file})
-                    for name, file in self.files.items()
-                }
+        generator = self.stream_csv if self.streaming else self.load_csv
+        return MultiStream(
+            {
+                name: Stream(
+                    generator=generator, gen_kwargs={"file": file, "split": name}
+                )
+                for name, file in self.files.items()
+            }
+        )
+
+
+FILTER_OPERATORS = {
+    "==": lambda value, target: value == target,
+    "!=": lambda value, target: value != target,
+    "<": lambda value, target: value is not None and value < target,
+    "<=": lambda value, target: value is not None and value <= target,
+    ">": lambda value, target: value is not None and value > target,
+    ">=": lambda value, target: value is not None and value >= target,
+    "in": lambda value, target: value in target,
+    "not in": lambda value, target: value not in target,
+}
+
+
+def _read_file(loader: "LoadFromFiles", file: str, limit: Optional[int]) -> List[Dict]:
+    # a module function, to be run by a pool of processes
+    return list(loader.read_file(file, limit))
+
+
+class LoadFromFiles(Loader):
+    """Base class of loaders of local files, with one or more files per split.
+
+    Args:
+        files: the files of every split: a path, a glob pattern (e.g., "data/train-*.jsonl"),
+            or a list of them. The files matching a pattern are read in sorted order.
+        columns: load only these fields of every instance.
+        filters: conditions that the loaded instances must meet, each a list of
+            [field, operator, value] where operator is one of ==, !=, <, <=, >, >=, in, not in.
+            For example: [["split", "==", "dev"], ["length", "<", 512]].
+        num_readers: the number of files decoded concurrently (1 reads the files one by one).
+        reader_type: "thread" to decode the files by a pool of threads, or "process" by a
+            pool of processes (for decoding that holds the GIL, e.g., of json).
+        merge: with num_readers > 1, "file_order" yields the instances in the order of the
+            files (deterministic), and "first_ready" yields the instances of every file as
+            soon as it is decoded (for throughput).
+        num_shards, shard_index: read only the files of shard shard_index out of num_shards,
+            i.e., every num_shards-th file of every split, starting at file shard_index.
+    """
+
+    files: Dict[str, Union[str, List[str]]]
+    columns: Optional[List[str]] = None
+    filters: Optional[List[List[Any]]] = None
+    streaming: bool = True
+    num_readers: int = 1
+    reader_type: str = "thread"
+    merge: str = "file_order"
+    num_shards: int = 1
+    shard_index: int = 0
+
+    def verify(self):
+        super().verify()
+        if self.reader_type not in ["thread", "process"]:
+            raise ValueError(
+                f"reader_type must be 'thread' or 'process', got '{self.reader_type}'"
+            )
+        if self.merge not in ["file_order", "first_ready"]:
+            raise ValueError(
+                f"merge must be 'file_order' or 'first_ready', got '{self.merge}'"
+            )
+        if not 0 <= self.shard_index < self.num_shards:
+            raise ValueError(
+                f"shard_index must be in [0, num_shards), got shard_index={self.shard_index} and num_shards={self.num_shards}"
+            )
+        for condition in self.filters or []:
+            if len(condition) != 3 or condition[1] not in FILTER_OPERATORS:
+                raise ValueError(
+                    f"Filters must be [field, operator, value] with operator in "
+                    f"{list(FILTER_OPERATORS)}, got {condition}"
+                )
+
+    def get_files(self, split: str) -> List[str]:
+        patterns = self.files[split]
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        files = []
+        for pattern in patterns:
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise FileNotFoundError(
+                    f"No files match '{pattern}' for split '{split}' of {self.__class__.__name__}"
+                )
+            files.extend(matches)
+        return files[self.shard_index :: self.num_shards]
+
+    def filter_predicate(self):
+        """A function of an instance, checking it meets the filters, or None when there are no filters."""
+        if not self.filters:
+            return None
+        conditions = [
+            (field, FILTER_OPERATORS[operator], value)
+            for field, operator, value in self.filters
+        ]
+
+        def predicate(instance):
+            return all(
+                check(instance.get(field), value) for field, check, value in conditions
             )
 
+        return predicate
+
+    @abstractmethod
+    def read_file(self, file: str, limit: Optional[int]) -> Generator:
+        """Yield the instances of a file (projected and filtered), stopping after limit instances."""
+        pass
+
+    def record_file_size(self, file: str):
+        if is_telemetry_enabled():
+            record_loader_bytes(self.__class__.__name__, os.path.getsize(file))
+
+    def read_files(self, files: List[str], limit: Optional[int] = None) -> Generator:
+        """Yield the instances of files, stopping after limit instances."""
+        if self.num_readers > 1 and len(files) > 1:
+            yield from itertools.islice(
+                self.read_files_in_parallel(files, limit), limit
+            )
+            return
+        count = 0
+        for file in files:
+            self.record_file_size(file)
+            for instance in self.read_file(
+                file, None if limit is None else limit - count
+            ):
+                yield instance
+                count += 1
+            if limit is not None and count >= limit:
+                return
+
+    def read_files_in_parallel(
+        self, files: List[str], limit: Optional[int] = None
+    ) -> Generator:
+        """Yield the instances of files decoded by a pool of num_readers readers, merged per merge.
+
+        Every file is decoded as a whole (up to limit instances) by a reader, and at
+        most 2 * num_readers files are decoded ahead of the instances yielded.
+        """
+        executor_class = (
+            ThreadPoolExecutor if self.reader_type == "thread" else ProcessPoolExecutor
+        )
+        remaining = iter(files)
+        in_flight = []
+        with executor_class(max_workers=self.num_readers) as executor:
+
+            def submit_next():
+                file = next(remaining, None)
+                if file is not None:
+                    self.record_file_size(file)
+                    in_flight.append(executor.submit(_read_file, self, file, limit))
+
+            for _ in range(2 * self.num_readers):
+                submit_next()
+            try:
+                while in_flight:
+                    if self.merge == "file_order":
+                        future = in_flight[0]
+                    else:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        future = next(f for f in in_flight if f in done)
+                    in_flight.remove(future)
+                    instances = future.result()
+                    submit_next()
+                    yield from instances
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def sample_split(self, split: str) -> Generator:
+        """Yield the instances of a split sampled per loader_sampling (which is not "head").
+
+        A reservoir sample over all the instances of the split by default, and
+        loaders of random-access files read only the sampled instances instead.
+        """
+        yield from self.sample_stream(self.read_files(self.get_files(split)), split)
+
+    def load_split(self, split: str) -> Generator:
+        limit = self.get_limit()
+        if limit is not None:
+            self.log_limited_loading()
+        if self.get_sampling() != "head":
+            yield from self.sample_split(split)
+            return
+        yield from self.read_files(self.get_files(split), limit)
+
+    def process(self):
         return MultiStream(
             {
-                name: Stream(generator=self.load_csv, gen_kwargs={"file": file})
-                for name, file in self.files.items()
+                split: Stream(self.load_split, gen_kwargs={"split": split})
+                for split in self.files.keys()
             }
         )
 
 
+class LoadJsonl(LoadFromFiles):
+    """Loads JSON Lines files, one instance per line.
+
+    The files are memory mapped and decoded line by line, so loading starts
+    immediately and stops reading as soon as loader_limit instances were loaded.
+    Compressed files (.gz, .bz2, .xz or .zst) are decompressed while they are read.
+    The filters are applied to every decoded line.
+
+    Example:
+        LoadJsonl(files={"train": "data/train-*.jsonl.gz", "test": "data/test.jsonl"}, columns=["question", "answer"])
+    """
+
+    def read_lines(self, lines: Iterable[bytes], limit: Optional[int]) -> Generator:
+        predicate = self.filter_predicate()
+        count = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            instance = json.loads(line)
+            if predicate is not None and not predicate(instance):
+                continue
+            if self.columns is not None:
+                instance = {column: instance.get(column) for column in self.columns}
+            yield instance
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+    def read_file(self, file: str, limit: Optional[int]) -> Generator:
+        if limit is not None and limit <= 0:
+            return
+        if infer_compression(file) is not None:
+            with open_file(file) as lines:
+                yield from self.read_lines(lines, limit)
+            return
+        with open(file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as lines:
+                yield from self.read_lines(iter(lines.readline, b""), limit)
+
+
+class LoadParquet(LoadFromFiles):
+    """Loads Parquet files, streaming them in record batches.
+
+    The files are memory mapped and scanned with pyarrow.dataset: only the
+    requested columns are read, the filters are pushed into the scan (skipping
+    row groups whose statistics exclude them), and the scan stops once
+    loader_limit instances were loaded.
+
+    Example:
+        LoadParquet(files={"test": "data/test-*.parquet"}, filters=[["lang", "==", "en"]])
+    """
+
+    batch_size: int = 1024
+
+    def filter_expression(self):
+        if not self.filters:
+            return None
+        import pyarrow.dataset as ds
+
+        expression = None
+        for field, operator, value in self.filters:
+            column = ds.field(field)
+            if operator == "in":
+                condition = column.isin(value)
+            elif operator == "not in":
+                condition = ~column.isin(value)
+            else:
+                condition = {
+                    "==": column.__eq__,
+                    "!=": column.__ne__,
+                    "<": column.__lt__,
+                    "<=": column.__le__,
+                    ">": column.__gt__,
+                    ">=": column.__ge__,
+                }[operator](value)
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def open_dataset(self, files: Union[str, List[str]]):
+        import pyarrow.dataset as ds
+        from pyarrow import fs
+
+        return ds.dataset(
+            files, format="parquet", filesystem=fs.LocalFileSystem(use_mmap=True)
+        )
+
+    def sample_split(self, split: str) -> Generator:
+        """Yield the sampled instances of a split, reading only the row groups holding them."""
+        files = self.get_files(split)
+        for file in files:
+            self.record_file_size(file)
+        dataset = self.open_dataset(files)
+        expression = self.filter_expression()
+        strata = None
+        if self.get_sampling() == "stratified":
+            strata = (
+                dataset.to_table(
+                    columns=[self.loader_sampling_field], filter=expression
+                )
+                .column(0)
+                .to_pylist()
+            )
+            num_rows = len(strata)
+        else:
+            num_rows = dataset.count_rows(filter=expression)
+        indices = self.sample_indices(num_rows, split, strata)
+        table = dataset.take(indices, columns=self.columns, filter=expression)
+        yield from table.to_pylist()
+
+    def read_file(self, file: str, limit: Optional[int]) -> Generator:
+        if limit is not None and limit <= 0:
+            return
+        dataset = self.open_dataset(file)
+        count = 0
+        for batch in dataset.to_batches(
+            columns=self.columns,
+            filter=self.filter_expression(),
+            batch_size=self.batch_size,
+        ):
+            if limit is not None and count + batch.num_rows > limit:
+                batch = batch.slice(0, limit - count)
+            yield from batch.to_pylist()
+            count += batch.num_rows
+            if limit is not None and count >= limit:
+                return
+
+
+class LoadFromSQL(Loader):
+    """Loads the results of SQL queries, one query per split, from SQLite or any DB-API database.
+
+    The rows are fetched in batches of batch_size (with cursor.fetchmany) and
+    streamed as instances, whose fields are the columns of the results, so the
+    result sets are never materialized. The loader_limit is pushed into the queries
+    as a LIMIT clause.
+
+    Args:
+        queries: the query of every split, e.g. {"test": "SELECT question, answer FROM qa WHERE split = 'test'"}.
+        database: the path of a SQLite database.
+        connect: instead of database, a function returning a new DB-API connection, or
+            the import path of such a function (e.g. "my_package.db.connect"), which
+            can be saved to the catalog.
+        batch_size: the number of rows fetched at once.
+        cursor_name: if given, the cursor is created with this name, which makes a
+            server-side cursor in some drivers (e.g. psycopg2), so the database
+            sends the rows in batches too.
+
+    Example:
+        LoadFromSQL(database="data/eval.db", queries={"test": "SELECT * FROM qa"})
+    """
+
+    queries: Dict[str, str]
+    database: Optional[str] = None
+    connect: Optional[Union[str, Callable[[], Any]]] = None
+    batch_size: int = 1000
+    cursor_name: Optional[str] = None
+    streaming: bool = True
+
+    def verify(self):
+        super().verify()
+        if (self.database is None) == (self.connect is None):
+            raise ValueError(
+                f"{self.__class__.__name__} requires either database (a SQLite path) or connect (a connection factory)"
+            )
+
+    def get_connection(self):
+        if self.database is not None:
+            import sqlite3
+
+            return sqlite3.connect(self.database)
+        return _import_function(self.connect)()
+
+    def limited_query(self, query: str) -> str:
+        limit = self.get_limit()
+        if limit is None or self.get_sampling() != "head":
+            return query
+        return f"SELECT * FROM ({query.strip().rstrip(';')}) AS unitxt_query LIMIT {int(limit)}"
+
+    def load_split(self, split: str) -> Generator:
+        if self.get_limit() is not None:
+            self.log_limited_loading()
+        yield from self.sample_stream(self.fetch_rows(split), split)
+
+    def fetch_rows(self, split: str) -> Generator:
+        connection = self.get_connection()
+        try:
+            if self.cursor_name is None:
+                cursor = connection.cursor()
+            else:
+                cursor = connection.cursor(name=self.cursor_name)
+            cursor.arraysize = self.batch_size
+            try:
+                cursor.execute(self.limited_query(self.queries[split]))
+                columns = None
+                while True:
+                    rows = cursor.fetchmany(self.batch_size)
+                    if not rows:
+                        return
+                    if columns is None:
+                        # named cursors have a description only after the first fetch
+                        columns = [column[0] for column in cursor.description]
+                    for row in rows:
+                        yield dict(zip(columns, row))
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+
+    def process(self):
+        return MultiStream(
+            {
+                split: Stream(self.load_split, gen_kwargs={"split": split})
+                for split in self.queries.keys()
+            }
+        )
+
+
+_registered_tables: Dict[str, Any] = {}
+
+
+def register_table(name: str, table: Any):
+    """Register an in-memory table (a pandas DataFrame or a pyarrow Table) under a name.
+
+    LoadFromDataFrame and LoadFromArrow refer to registered tables by their names,
+    so the loaders can be saved to the catalog without the data.
+    """
+    _registered_tables[name] = table
+
+
+def unregister_table(name: str):
+    _registered_tables.pop(name, None)
+
+
+def get_registered_table(name: str) -> Any:
+    if name not in _registered_tables:
+        raise ValueError(
+            f"No table is registered as '{name}'; register it with unitxt.loaders.register_table"
+        )
+    return _registered_tables[name]
+
+
+class LoadFromTables(Loader):
+    """Base class of loaders of in-memory tables, one per split.
+
+    The tables are not copied: their rows are converted to instances lazily, batch_size
+    rows at a time, and random or stratified loader_sampling takes only the sampled rows.
+
+    Args:
+        tables: the table of every split, or the name it was registered under with
+            register_table (which lets the loader be saved to the catalog).
+        batch_size: the number of rows converted to instances at once.
+    """
+
+    tables: Dict[str, Any]
+    batch_size: int = 1024
+
+    def get_table(self, split: str) -> Any:
+        table = self.tables[split]
+        if isinstance(table, str):
+            return get_registered_table(table)
+        return table
+
+    @abstractmethod
+    def num_rows(self, table: Any) -> int:
+        pass
+
+    @abstractmethod
+    def column(self, table: Any, field: str) -> List[Any]:
+        pass
+
+    @abstractmethod
+    def rows(self, table: Any, start: int, stop: int) -> List[Dict[str, Any]]:
+        """The rows start to stop (exclusive) of a table, as instances."""
+        pass
+
+    @abstractmethod
+    def take(self, table: Any, indices: List[int]) -> List[Dict[str, Any]]:
+        """The rows of the given indices of a table, as instances."""
+        pass
+
+    def load_split(self, split: str) -> Generator:
+        table = self.get_table(split)
+        num_rows = self.num_rows(table)
+        limit = self.get_limit()
+        if limit is not None:
+            self.log_limited_loading()
+        if self.get_sampling() != "head":
+            strata = None
+            if self.get_sampling() == "stratified":
+                strata = self.column(table, self.loader_sampling_field)
+            indices = self.sample_indices(num_rows, split, strata)
+            for start in range(0, len(indices), self.batch_size):
+                yield from self.take(table, indices[start : start + self.batch_size])
+            return
+        if limit is not None:
+            num_rows = min(num_rows, limit)
+        for start in range(0, num_rows, self.batch_size):
+            yield from self.rows(table, start, min(start + self.batch_size, num_rows))
+
+    def process(self):
+        return MultiStream(
+            {
+                split: Stream(self.load_split, gen_kwargs={"split": split})
+                for split in self.tables.keys()
+            }
+        )
+
+
+class LoadFromDataFrame(LoadFromTables):
+    """Loads pandas DataFrames, one per split, converting their rows to instances lazily.
+
+    Example:
+        register_table("my_eval_set", df)
+        LoadFromDataFrame(tables={"test": "my_eval_set"})
+    """
+
+    def num_rows(self, table) -> int:
+        return len(table)
+
+    def column(self, table, field: str) -> List[Any]:
+        return table[field].tolist()
+
+    def rows(self, table, start: int, stop: int) -> List[Dict[str, Any]]:
+        return table.iloc[start:stop].to_dict("records")
+
+    def take(self, table, indices: List[int]) -> List[Dict[str, Any]]:
+        return table.iloc[indices].to_dict("records")
+
+
+class LoadFromArrow(LoadFromTables):
+    """Loads pyarrow Tables, one per split, converting their rows to instances lazily.
+
+    Example:
+        register_table("my_eval_set", pyarrow.parquet.read_table("eval.parquet"))
+        LoadFromArrow(tables={"test": "my_eval_set"})
+    """
+
+    def num_rows(self, table) -> int:
+        return table.num_rows
+
+    def column(self, table, field: str) -> List[Any]:
+        return table.column(field).to_pylist()
+
+    def rows(self, table, start: int, stop: int) -> List[Dict[str, Any]]:
+        # slicing a table does not copy it
+        return table.slice(start, stop - start).to_pylist()
+
+    def take(self, table, indices: List[int]) -> List[Dict[str, Any]]:
+        return table.take(indices).to_pylist()
+
+
 class MissingKaggleCredentialsError(ValueError):
     pass
 
@@ -252,14 +1299,53 @@ class LoadFromKaggle(Loader):
         self.downloader = download
 
     def process(self):
-        with TemporaryDirectory() as temp_directory:
-            self.downloader(self.url, temp_directory)
-            dataset = hf_load_dataset(temp_directory, streaming=False)
+        from datasets import load_dataset as hf_load_dataset
 
+        def download_dataset():
+            with TemporaryDirectory() as temp_directory:
+                self.downloader(self.url, temp_directory)
+                return hf_load_dataset(
+                    temp_directory, streaming=False, keep_in_memory=True
+                )
+
+        dataset = load_prepared_dataset(
+            {"loader": self.__class__.__name__, "url": self.url},
+            download_dataset,
+            description=self.url,
+        )
         return MultiStream.from_iterables(dataset)
 
 
+def _strip_compression_extension(file_name: str) -> str:
+    if infer_compression(file_name) is not None:
+        return os.path.splitext(file_name)[0]
+    return file_name
+
+
+def _split_of_file_name(file_name: str) -> Optional[str]:
+    """The split of a data file, by the split keywords in its name (as the HF datasets builders do)."""
+    from datasets.data_files import SPLIT_KEYWORDS
+
+    words = re.split(r"[-._ 0-9/]+", file_name.lower())
+    for split, keywords in SPLIT_KEYWORDS.items():
+        if any(keyword in words for keyword in keywords):
+            return str(split)
+    return None
+
+
 class LoadFromIBMCloud(Loader):
+    """Loads data files from a bucket of IBM Cloud Object Storage (or any S3 compatible storage).
+
+    The files are downloaded concurrently, by up to max_workers ranged GETs at a time,
+    and objects larger than part_size are downloaded in parts of part_size bytes.
+    The downloads are kept in a local cache (under the directory given by the
+    UNITXT_IBM_COS_CACHE environment variable, or the current directory), and an
+    interrupted download continues with its missing parts.
+
+    With streaming=True, .jsonl and .csv files (optionally compressed) are not
+    downloaded, but read (and decompressed) directly from the bodies of the responses.
+    """
+
     endpoint_url_env: str
     aws_access_key_id_env: str
     aws_secret_access_key_env: str
@@ -272,47 +1358,83 @@ class LoadFromIBMCloud(Loader):
     # 3. Mapping: split -> file_names, e.g. {"test" : ["test1.json", "test2.json"], "train": ["train.json"]}
     data_files: Union[Sequence[str], Mapping[str, Union[str, Sequence[str]]]]
     caching: bool = True
+    max_workers: int = 8
+    part_size: int = 16 << 20
     _requirements_list: List[str] = ["ibm_boto3"]
 
-    def _download_from_cos(self, cos, bucket_name, item_name, local_file):
-        logger.info(f"Downloading {item_name} from {bucket_name} COS")
+    def object_key(self, data_file: str) -> str:
+        # Build object key based on parameters. Slash character is not
+        # allowed to be part of object key in IBM COS.
+        return (
+            self.data_dir + "/" + data_file if self.data_dir is not None else data_file
+        )
+
+    def get_object(self, cos, bucket_name, item_name):
         try:
-            response = cos.Object(bucket_name, item_name).get()
-            size = response["ContentLength"]
-            body = response["Body"]
+            cos_object = cos.Object(bucket_name, item_name)
+            # loads the metadata of the object, checking it is accessible
+            cos_object.content_length  # noqa: B018
+            return cos_object
         except Exception as e:
             raise Exception(
                 f"Unabled to access {item_name} in {bucket_name} in COS", e
             ) from e
 
-        if self.get_limit() is not None:
-            if item_name.endswith(".jsonl"):
-                first_lines = list(
-                    itertools.islice(body.iter_lines(), self.get_limit())
-                )
-                with open(local_file, "wb") as downloaded_file:
-                    for line in first_lines:
-                        downloaded_file.write(line)
-                        downloaded_file.write(b"\n")
-                logger.info(
-                    f"\nDownload successful limited to {self.get_limit()} lines"
-                )
-                return
+    def _download_from_cos(
+        self, cos, bucket_name, item_name, local_file, executor=None
+    ):
+        logger.info(f"Downloading {item_name} from {bucket_name} COS")
+        cos_object = self.get_object(cos, bucket_name, item_name)
 
-        progress_bar = tqdm(total=size, unit="iB", unit_scale=True)
+        if (
+            self.get_limit() is not None
+            and self.get_sampling() == "head"
+            and item_name.endswith(".jsonl")
+        ):
+            body = cos_object.get()["Body"]
+            first_lines = list(itertools.islice(body.iter_lines(), self.get_limit()))
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(local_file), delete=False
+            ) as downloaded_file:
+                for line in first_lines:
+                    downloaded_file.write(line)
+                    downloaded_file.write(b"\n")
+            # Downloaded to a temporary file in same file partition, and then atomically moved
+            os.replace(downloaded_file.name, local_file)
+            record_loader_bytes(self.__class__.__name__, os.path.getsize(local_file))
+            logger.info(f"\nDownload successful limited to {self.get_limit()} lines")
+            return
 
-        def upload_progress(chunk):
-            progress_bar.update(chunk)
+        from tqdm import tqdm
 
-        try:
-            cos.Bucket(bucket_name).download_file(
-                item_name, local_file, Callback=upload_progress
-            )
-            logger.info("\nDownload Successful")
-        except Exception as e:
-            raise Exception(
-                f"Unabled to download {item_name} in {bucket_name}", e
-            ) from e
+        size = cos_object.content_length
+
+        # every part is of the version of the object whose size is downloaded; a part
+        # of a replaced object fails, instead of being stitched to the parts of the old one
+        conditions = {"IfMatch": cos_object.e_tag} if cos_object.e_tag else {}
+
+        def read_range(start, end):
+            response = cos_object.get(Range=f"bytes={start}-{end}", **conditions)
+            return response["Body"].iter_chunks(chunk_size=1 << 20)
+
+        with tqdm(total=size, unit="iB", unit_scale=True) as progress_bar:
+            try:
+                download_in_parts(
+                    read_range,
+                    size,
+                    local_file,
+                    version=cos_object.e_tag or "",
+                    part_size=self.part_size,
+                    max_workers=self.max_workers,
+                    executor=executor,
+                    progress=progress_bar.update,
+                )
+            except Exception as e:
+                raise Exception(
+                    f"Unabled to download {item_name} in {bucket_name}", e
+                ) from e
+        logger.info("\nDownload Successful")
+        record_loader_bytes(self.__class__.__name__, size)
 
     def prepare(self):
         super().prepare()
@@ -337,54 +1459,135 @@ class LoadFromIBMCloud(Loader):
             self.aws_secret_access_key is not None
         ), f"Please set {self.aws_secret_access_key_env} environmental variable"
         if self.streaming:
-            raise NotImplementedError("LoadFromKaggle cannot load with streaming.")
+            for split, data_files in self.split_files().items():
+                if split is None:
+                    raise ValueError(
+                        f"{self.__class__.__name__} cannot determine the split of {data_files} to stream it; give data_files as a mapping from splits to files"
+                    )
+                for data_file in data_files:
+                    if not _strip_compression_extension(data_file).endswith(
+                        (".jsonl", ".csv")
+                    ):
+                        raise ValueError(
+                            f"{self.__class__.__name__} can stream only .jsonl and .csv files (optionally compressed), got {data_file}"
+                        )
 
-    def process(self):
+    def get_cos(self):
         import ibm_boto3
 
-        cos = ibm_boto3.resource(
+        return ibm_boto3.resource(
             "s3",
             aws_access_key_id=self.aws_access_key_id,
             aws_secret_access_key=self.aws_secret_access_key,
             endpoint_url=self.endpoint_url,
         )
-        local_dir = os.path.join(
-            self.cache_dir,
-            self.bucket_name,
-            self.data_dir,
-            f"loader_limit_{self.get_limit()}",
-        )
-        if not os.path.exists(local_dir):
-            Path(local_dir).mkdir(parents=True, exist_ok=True)
-        if isinstance(self.data_files, Mapping):
-            data_files_names = list(self.data_files.values())
-            if not isinstance(data_files_names[0], str):
-                data_files_names = list(itertools.chain(*data_files_names))
+
+    def split_files(self) -> Dict[Optional[str], List[str]]:
+        """The data files of every split."""
+        if not isinstance(self.data_files, Mapping):
+            files = {}
+            for data_file in self.data_files:
+                files.setdefault(_split_of_file_name(data_file), []).append(data_file)
+            return files
+        return {
+            split: [data_files] if isinstance(data_files, str) else list(data_files)
+            for split, data_files in self.data_files.items()
+        }
+
+    def stream_file(self, cos, data_file: str) -> Generator:
+        """Yield the instances of a .jsonl or .csv file, read from the body of its GET response."""
+        cos_object = self.get_object(cos, self.bucket_name, self.object_key(data_file))
+        body = cos_object.get()["Body"]
+        record_loader_bytes(self.__class__.__name__, cos_object.content_length)
+        try:
+            with decompressed_stream(body, infer_compression(data_file)) as stream:
+                if _strip_compression_extension(data_file).endswith(".jsonl"):
+                    for line in stream:
+                        if line.strip():
+                            yield json.loads(line)
+                else:
+                    from pyarrow import csv
+
+                    for batch in csv.open_csv(stream):
+                        yield from batch.to_pylist()
+        finally:
+            body.close()
+
+    def stream_split(self, split: str) -> Generator:
+        cos = self.get_cos()
+
+        def instances():
+            for data_file in self.split_files()[split]:
+                yield from self.stream_file(cos, data_file)
+
+        if self.get_limit() is not None:
+            self.log_limited_loading()
+            yield from self.sample_stream(instances(), split)
         else:
-            data_files_names = self.data_files
+            yield from instances()
 
+    def download_files(self, local_dir: str):
+        """Download the data files missing in local_dir, concurrently."""
+        cos = self.get_cos()
+        data_files_names = list(itertools.chain(*self.split_files().values()))
+        missing = []
         for data_file in data_files_names:
             local_file = os.path.join(local_dir, data_file)
+            record_cache(
+                "ibm_cloud_files", hit=self.caching and os.path.exists(local_file)
+            )
             if not self.caching or not os.path.exists(local_file):
-                # Build object key based on parameters. Slash character is not
-                # allowed to be part of object key in IBM COS.
-                object_key = (
-                    self.data_dir + "/" + data_file
-                    if self.data_dir is not None
-                    else data_file
-                )
-                with tempfile.NamedTemporaryFile() as temp_file:
-                    # Download to  a temporary file in same file partition, and then do an atomic move
-                    self._download_from_cos(
+                missing.append(data_file)
+        if not missing:
+            return
+
+        # the files are downloaded by one pool, and their parts by another, so the
+        # ranged GETs in flight are bounded by max_workers
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as part_executor, ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as file_executor:
+            futures = []
+            for data_file in missing:
+                local_file = os.path.join(local_dir, data_file)
+                os.makedirs(os.path.dirname(local_file), exist_ok=True)
+                futures.append(
+                    file_executor.submit(
+                        self._download_from_cos,
                         cos,
                         self.bucket_name,
-                        object_key,
-                        local_dir + "/" + os.path.basename(temp_file.name),
-                    )
-                    os.rename(
-                        local_dir + "/" + os.path.basename(temp_file.name),
-                        local_dir + "/" + data_file,
+                        self.object_key(data_file),
+                        local_file,
+                        part_executor,
                     )
+                )
+            for future in futures:
+                future.result()
+
+    def process(self):
+        from datasets import load_dataset as hf_load_dataset
+
+        if self.streaming:
+            return MultiStream(
+                {
+                    split: Stream(self.stream_split, gen_kwargs={"split": split})
+                    for split in self.split_files().keys()
+                }
+            )
+
+        # only the first lines are downloaded when loading is limited to the head
+        # of the files, and the whole files are downloaded to sample from
+        downloaded_limit = self.get_limit() if self.get_sampling() == "head" else None
+        local_dir = os.path.join(
+            self.cache_dir,
+            self.bucket_name,
+            self.data_dir,
+            f"loader_limit_{downloaded_limit}",
+        )
+        if not os.path.exists(local_dir):
+            Path(local_dir).mkdir(parents=True, exist_ok=True)
+        self.download_files(local_dir)
 
         if isinstance(self.data_files, list):
             dataset = hf_load_dataset(local_dir, streaming=False)
@@ -393,4 +1596,14 @@ class LoadFromIBMCloud(Loader):
                 local_dir, streaming=False, data_files=self.data_files
             )
 
+        if self.get_limit() is not None:
+            return MultiStream(
+                {
+                    split: Stream(
+                        self.sample_stream,
+                        gen_kwargs={"instances": dataset[split], "split": split},
+                    )
+                    for split in dataset.keys()
+                }
+            )
         return MultiStream.from_iterables(dataset)
@@ -0,0 +1,315 @@
+"""Attribution of the memory of unitxt pipelines to the operators that allocate it.
+
+The profiler is opt-in, and costs a single check of a module level flag when it is
+not running. Run a recipe or an evaluation inside it:
+
+.. code-block:: python
+
+    from unitxt.memory_profiling import MemoryProfiler
+
+    with MemoryProfiler() as profiler:
+        dataset = load_dataset("card=cards.wnli,template_card_index=0")
+    print(profiler.format_report())
+
+While the profiler runs, ``tracemalloc`` traces the allocations of the process, and
+the streams of every operator and loader are wrapped, so the memory allocated (and
+freed) while an operator produces an instance is charged to that operator and split.
+Operators of a streaming pipeline interleave, every instance passing through all of
+them, so the memory allocated by the operators upstream of an operator is charged to
+them and not to the operator reading from them.
+
+In addition, snapshots of the traced memory are sampled every ``interval`` seconds,
+and the snapshot taken at the highest traced memory, and the one taken when the
+profiler stops, are attributed to the operators whose code allocated the memory
+that is still alive. This shows what holds the memory at the peak and what is
+retained at the end of the run (e.g., demos pools, caches or metric accumulators).
+
+The report has:
+
+* operators: per operator and split, the instances produced, the net bytes allocated
+  while producing them (allocations minus frees), and the peak of that value.
+* peak: the highest traced memory, and the bytes alive at the sampled peak per operator.
+* retained: the bytes still alive when the profiler stops, per operator.
+"""
+import dis
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .stream import Stream
+
+_active_profiler = None
+
+
+def is_memory_profiling() -> bool:
+    return _active_profiler is not None
+
+
+class OperatorMemory:
+    """The memory allocated by one operator on one split."""
+
+    def __init__(self, operator: str, split: Optional[str]):
+        self.operator = operator
+        self.split = split
+        self.instances = 0
+        self.net_bytes = 0
+        self.peak_bytes = 0
+
+    def add(self, size: int):
+        self.net_bytes += size
+        if self.net_bytes > self.peak_bytes:
+            self.peak_bytes = self.net_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "operator": self.operator,
+            "split": self.split,
+            "instances": self.instances,
+            "net_bytes": self.net_bytes,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+def _last_line(code) -> int:
+    return max(
+        (line for _, line in dis.findlinestarts(code) if line is not None),
+        default=code.co_firstlineno,
+    )
+
+
+class _CodeIndex:
+    """Maps the source lines of the methods of operator classes to the operators."""
+
+    def __init__(self, operator_classes):
+        from .operator import Operator
+
+        self.ranges: Dict[str, List[Tuple[int, int, str]]] = {}
+        users: Dict[Any, List[type]] = {}
+        for operator_class in operator_classes:
+            for base in operator_class.__mro__:
+                if not issubclass(base, Operator):
+                    continue
+                for attribute in vars(base).values():
+                    function = getattr(attribute, "__func__", attribute)
+                    function = getattr(function, "fget", function)
+                    code = getattr(function, "__code__", None)
+                    if code is not None:
+                        users.setdefault(code, [base])
+                        if operator_class not in users[code]:
+                            users[code].append(operator_class)
+        for code, (base, *operator_classes_using) in users.items():
+            # charge the memory to the operator, rather than to the base class
+            # defining the method, when a single profiled operator uses it
+            owner = (
+                operator_classes_using[0].__name__
+                if len(operator_classes_using) == 1
+                else base.__name__
+            )
+            self.ranges.setdefault(code.co_filename, []).append(
+                (code.co_firstlineno, _last_line(code), owner)
+            )
+
+    def owner(self, traceback) -> Optional[str]:
+        for frame in reversed(traceback):
+            for first, last, owner in self.ranges.get(frame.filename, ()):
+                if first <= frame.lineno <= last:
+                    return owner
+        return None
+
+
+class MemoryProfiler:
+    """Attribute the memory allocated while it runs to operators and splits.
+
+    Args:
+        interval: seconds between samples of the traced memory. A snapshot is taken
+            when a sample is higher than all previous samples.
+        nframes: frames stored per traced allocation, which need to reach from the
+            allocating code to the operator that called it.
+        top: operators listed in each part of format_report().
+    """
+
+    def __init__(self, interval: float = 1.0, nframes: int = 25, top: int = 10):
+        self.interval = interval
+        self.nframes = nframes
+        self.top = top
+        self.operators: Dict[Tuple[str, Optional[str]], OperatorMemory] = {}
+        self.operator_classes = set()
+        self.peak_bytes = 0
+        self.at_peak: Dict[str, int] = {}
+        self.retained: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracing = False
+        self._last_sample = 0.0
+        self._sampled_peak = -1
+        self._peak_snapshot = None
+
+    @property
+    def active(self) -> bool:
+        return _active_profiler is self
+
+    def start(self):
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("Another MemoryProfiler is already running.")
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        self._last_sample = time.perf_counter()
+        _active_profiler = self
+
+    def stop(self):
+        global _active_profiler
+        if not self.active:
+            return
+        _active_profiler = None
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+        index = _CodeIndex(self.operator_classes)
+        snapshot = self._take_snapshot()
+        self.retained = self._attribute(snapshot, index)
+        if self._peak_snapshot is not None:
+            self.at_peak = self._attribute(self._peak_snapshot, index)
+            self._peak_snapshot = None
+        else:
+            self.at_peak = dict(self.retained)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+
+    @staticmethod
+    def _attribute(snapshot, index: _CodeIndex) -> Dict[str, int]:
+        result = {}
+        for statistic in snapshot.statistics("traceback"):
+            owner = index.owner(statistic.traceback)
+            if owner is not None:
+                result[owner] = result.get(owner, 0) + statistic.size
+        return dict(sorted(result.items(), key=lambda item: -item[1]))
+
+    def _stack(self) -> List[int]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _memory_of(self, operator_class: type, split: Optional[str]) -> OperatorMemory:
+        key = (operator_class.__name__, split)
+        with self._lock:
+            self.operator_classes.add(operator_class)
+            if key not in self.operators:
+                self.operators[key] = OperatorMemory(*key)
+            return self.operators[key]
+
+    def _sample(self, current: int):
+        now = time.perf_counter()
+        if now - self._last_sample < self.interval or current <= self._sampled_peak:
+            return
+        with self._lock:
+            self._last_sample = now
+            self._sampled_peak = current
+            self._peak_snapshot = self._take_snapshot()
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "operators": [
+                memory.to_dict()
+                for memory in sorted(
+                    self.operators.values(), key=lambda memory: -memory.peak_bytes
+                )
+            ],
+            "peak": {"bytes": self.peak_bytes, "operators": self.at_peak},
+            "retained": self.retained,
+        }
+
+    def format_report(self) -> str:
+        lines = [f"Peak traced memory: {_format_size(self.peak_bytes)}", ""]
+        lines.append("Allocated while producing instances (peak / net / instances):")
+        for memory in sorted(
+            self.operators.values(), key=lambda memory: -memory.peak_bytes
+        )[: self.top]:
+            lines.append(
+                f"  {memory.operator} [{memory.split}]: {_format_size(memory.peak_bytes)}"
+                f" / {_format_size(memory.net_bytes)} / {memory.instances}"
+            )
+        for title, sizes in (
+            ("Alive at the sampled peak:", self.at_peak),
+            ("Retained at the end:", self.retained),
+        ):
+            lines.extend(["", title])
+            for owner, size in list(sizes.items())[: self.top]:
+                lines.append(f"  {owner}: {_format_size(size)}")
+        return "\n".join(lines)
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def memory_profiled_stream(
+    generator: Callable,
+    gen_kwargs: Dict[str, Any],
+    operator_class: type,
+    split: Optional[str],
+):
+    """Run generator(**gen_kwargs), charging the memory allocated while it runs to the operator.
+
+    The memory allocated in profiled streams that the generator reads from is not
+    charged, so the operators of an interleaving pipeline are charged only for
+    their own allocations.
+    """
+    profiler = _active_profiler
+    iterator = iter(generator(**gen_kwargs))
+    if profiler is None:
+        yield from iterator
+        return
+    memory = profiler._memory_of(operator_class, split)
+    stack = profiler._stack()
+    while profiler.active:
+        stack.append(0)
+        start = tracemalloc.get_traced_memory()[0]
+        try:
+            instance = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            current = tracemalloc.get_traced_memory()[0]
+            allocated = current - start
+            memory.add(allocated - stack.pop())
+            if stack:
+                stack[-1] += allocated
+            profiler._sample(current)
+        memory.instances += 1
+        yield instance
+    yield from iterator
+
+
+def memory_profiled(stream: Stream, operator_class: type, split: Optional[str]):
+    return Stream(
+        memory_profiled_stream,
+        gen_kwargs={
+            "generator": stream.__iter__,
+            "gen_kwargs": {},
+            "operator_class": operator_class,
+            "split": split,
+        },
+    )
@@ -3,22 +3,29 @@ from typing import Dict, Iterable, List
 import evaluate
 
 from .artifact import __file__ as _
+from .artifact_types_manifest import __file__ as _
 from .blocks import __file__ as _
 from .card import __file__ as _
 from .catalog import __file__ as _
+from .catalog_index import __file__ as _
 from .collections import __file__ as _
 from .dataclass import __file__ as _
+from .dataset_cache import __file__ as _
 from .dataset_utils import __file__ as _
 from .dict_utils import __file__ as _
 from .eval_utils import __file__ as _
+from .evaluation_service import __file__ as _
+from .explain import __file__ as _
 from .file_utils import __file__ as _
 from .formats import __file__ as _
 from .fusion import __file__ as _
 from .generator_utils import __file__ as _
 from .hf_utils import __file__ as _
+from .http_utils import __file__ as _
 from .instructions import __file__ as _
 from .loaders import __file__ as _
 from .logging_utils import __file__ as _
+from .memory_profiling import __file__ as _
 from .metric_utils import UNITXT_METRIC_SCHEMA, _compute
 from .metrics import __file__ as _
 from .normalizers import __file__ as _
@@ -29,6 +36,7 @@ from .processors import __file__ as _
 from .random_utils import __file__ as _
 from .recipe import __file__ as _
 from .register import __file__ as _
+from .renderer import __file__ as _
 from .schema import __file__ as _
 from .settings_utils import get_constants
 from .split_utils import __file__ as _
@@ -38,12 +46,14 @@ from .stream import __file__ as _
 from .struct_data_operators import __file__ as _
 from .system_prompts import __file__ as _
 from .task import __file__ as _
+from .telemetry import __file__ as _
 from .templates import __file__ as _
 from .text_utils import __file__ as _
 from .type_utils import __file__ as _
 from .utils import is_package_installed
 from .validate import __file__ as _
 from .version import __file__ as _
+from .worker_pool import __file__ as _
 
 constants = get_constants()
 
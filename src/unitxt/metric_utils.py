@@ -1,7 +1,6 @@
+from functools import lru_cache
 from typing import Iterable, List
 
-from datasets import Features, Value
-
 from .operator import (
     MultiStreamOperator,
     SequentialOperatorInitilizer,
@@ -16,7 +15,7 @@ from .operators import (
     SplitByValue,
 )
 from .register import _reset_env_local_catalogs, register_all_artifacts
-from .schema import UNITXT_DATASET_SCHEMA
+from .schema import get_unitxt_dataset_schema
 from .stream import MultiStream, Stream
 
 
@@ -114,9 +113,23 @@ class MetricRecipe(SequentialOperatorInitilizer):
         ]
 
 
-UNITXT_METRIC_SCHEMA = Features(
-    {"predictions": Value("string"), "references": dict(UNITXT_DATASET_SCHEMA)}
-)
+@lru_cache(maxsize=None)
+def get_unitxt_metric_schema():
+    from datasets import Features, Value
+
+    return Features(
+        {
+            "predictions": Value("string"),
+            "references": dict(get_unitxt_dataset_schema()),
+        }
+    )
+
+
+def __getattr__(name):
+    # UNITXT_METRIC_SCHEMA is built on first access, so importing this module does not import datasets
+    if name == "UNITXT_METRIC_SCHEMA":
+        return get_unitxt_metric_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _compute(
@@ -8,11 +8,8 @@ from dataclasses import field
 from statistics import mean
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
-import evaluate
 import numpy
 import numpy as np
-from scipy.stats import bootstrap
-from scipy.stats._warnings_errors import DegenerateDataWarning
 
 from .artifact import Artifact
 from .dataclass import InternalField, OptionalField
@@ -27,15 +24,26 @@ from .operators import CopyFields
 from .random_utils import get_seed
 from .settings_utils import get_settings
 from .stream import MultiStream, Stream
+from .telemetry import (
+    is_telemetry_enabled,
+    metric_bootstrap_resamples,
+    metric_bootstrap_seconds,
+    metric_compute_seconds,
+    timer,
+)
 from .type_utils import isoftype, to_float_or_default
 
 logger = get_logger()
 settings = get_settings()
 
-warnings.filterwarnings("ignore", category=DegenerateDataWarning)
 
+def bootstrap(*args, **kwargs):
+    # scipy.stats is slow to import, so it is imported on first use
+    from scipy.stats import bootstrap as scipy_bootstrap
+    from scipy.stats._warnings_errors import DegenerateDataWarning
 
-warnings.filterwarnings("ignore", category=DegenerateDataWarning)
+    warnings.filterwarnings("ignore", category=DegenerateDataWarning)
+    return scipy_bootstrap(*args, **kwargs)
 
 
 def abstract_factory():
@@ -113,6 +121,21 @@ class MetricWithConfidenceInterval(Metric):
             and num_predictions > 1
         )
 
+    def confidence_interval(self, data, statistic, random_state):
+        """Run the bootstrap of scipy with the settings of the metric, and return the confidence interval."""
+        if is_telemetry_enabled():
+            metric_bootstrap_resamples.inc(
+                self.n_resamples, metric=self.__class__.__name__
+            )
+        with timer(metric_bootstrap_seconds, metric=self.__class__.__name__):
+            return bootstrap(
+                data,
+                statistic=statistic,
+                n_resamples=self.n_resamples,
+                confidence_level=self.confidence_level,
+                random_state=random_state,
+            ).confidence_interval
+
     @staticmethod
     def average_item_scores(instances: List[dict], score_name: str):
         """Calculate mean of a set of instance scores (given by score_name), omitting NaN values.
@@ -175,13 +198,11 @@ class MetricWithConfidenceInterval(Metric):
                 return self.resample_from_non_nan(scores)
 
             # apply bootstrap only on the relevant field
-            ci = bootstrap(
+            ci = self.confidence_interval(
                 (instances,),
                 statistic=statistic,
-                n_resamples=self.n_resamples,
-                confidence_level=self.confidence_level,
                 random_state=self.new_random_generator(),
-            ).confidence_interval
+            )
             full_score_name = ci_score_prefix + score_name
             result[f"{full_score_name}_ci_low"] = ci.low
             result[f"{full_score_name}_ci_high"] = ci.high
@@ -264,13 +285,9 @@ class MetricWithConfidenceInterval(Metric):
         num_predictions = len(predictions)
         if self._can_compute_confidence_intervals(num_predictions=num_predictions):
             identifiers = list(range(num_predictions))
-            ci = bootstrap(
-                (identifiers,),
-                statistic=statistic,
-                n_resamples=self.n_resamples,
-                confidence_level=self.confidence_level,
-                random_state=random_gen,
-            ).confidence_interval
+            ci = self.confidence_interval(
+                (identifiers,), statistic=statistic, random_state=random_gen
+            )
             result["score_ci_low"] = ci.low
             result["score_ci_high"] = ci.high
             result[f"{score_name}_ci_low"] = ci.low
@@ -322,11 +339,12 @@ class GlobalMetric(SingleStreamOperator, MetricWithConfidenceInterval):
             no_score_value = np.nan
             if self.process_single_instances:
                 try:
-                    instance_score = self._compute(
-                        [instance_references],
-                        [instance_prediction],
-                        [instance_task_data],
-                    )
+                    with timer(metric_compute_seconds, metric=self.__class__.__name__):
+                        instance_score = self._compute(
+                            [instance_references],
+                            [instance_prediction],
+                            [instance_task_data],
+                        )
                 except:
                     no_score_value = None
             if not instance_score:
@@ -340,7 +358,8 @@ class GlobalMetric(SingleStreamOperator, MetricWithConfidenceInterval):
 
             instance["score"]["instance"].update(instance_score)
 
-        result = self._compute(references, predictions, task_data)
+        with timer(metric_compute_seconds, metric=self.__class__.__name__):
+            result = self._compute(references, predictions, task_data)
 
         global_score.update(result)
 
@@ -405,11 +424,12 @@ class BulkInstanceMetric(SingleStreamOperator, MetricWithConfidenceInterval):
         ]
 
         # compute the metric over all refs and preds
-        instance_scores = self.compute(
-            references=references,
-            predictions=predictions,
-            task_data=task_data,
-        )
+        with timer(metric_compute_seconds, metric=self.__class__.__name__):
+            instance_scores = self.compute(
+                references=references,
+                predictions=predictions,
+                task_data=task_data,
+            )
 
         # add the score and score_name fields
         for instance_score in instance_scores:
@@ -670,9 +690,10 @@ class InstanceMetric(SingleStreamOperator, MetricWithConfidenceInterval):
             refs, pred = instance["references"], instance["prediction"]
             task_data = instance["task_data"] if "task_data" in instance else {}
 
-            instance_score = self.compute(
-                references=refs, prediction=pred, task_data=task_data
-            )
+            with timer(metric_compute_seconds, metric=self.__class__.__name__):
+                instance_score = self.compute(
+                    references=refs, prediction=pred, task_data=task_data
+                )
             instance_score["score"] = instance_score[self.main_score]
             instance_score["score_name"] = self.main_score
             if "score" not in instance:
@@ -788,6 +809,8 @@ class Squad(GlobalMetric):
 
     def prepare(self):
         super().prepare()
+        import evaluate
+
         self._metric = evaluate.load(self.metric)
 
     def compute(
@@ -919,6 +942,8 @@ class HuggingfaceMetric(GlobalMetric):
 
     def prepare(self):
         super().prepare()
+        import evaluate
+
         self.metric = evaluate.load(
             self.hf_metric_name, experiment_id=self.experiment_id
         )
@@ -993,6 +1018,8 @@ class HuggingfaceBulkMetric(BulkInstanceMetric):
 
     def prepare(self):
         super().prepare()
+        import evaluate
+
         self.metric = evaluate.load(self.hf_metric_name)
 
     def compute(
@@ -1037,6 +1064,8 @@ class F1(GlobalMetric):
 
     def prepare(self):
         super().prepare()
+        import evaluate
+
         self._metric = evaluate.load(self.metric)
 
     def get_str_id(self, str):
@@ -1102,6 +1131,8 @@ class F1MultiLabel(GlobalMetric):
 
     def prepare(self):
         super().prepare()
+        import evaluate
+
         self._metric = evaluate.load(self.metric, "multilabel")
 
     def add_str_to_id(self, str):
@@ -1237,9 +1268,11 @@ class Rouge(HuggingfaceMetric):
     def prepare(self):
         super().prepare()
 
-        self.hf_compute_args.update(
-            {"use_aggregator": self.use_aggregator, "rouge_types": self.rouge_types}
-        )
+        self.hf_compute_args = {
+            **self.hf_compute_args,
+            "use_aggregator": self.use_aggregator,
+            "rouge_types": self.rouge_types,
+        }
 
         import nltk
 
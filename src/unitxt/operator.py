@@ -5,7 +5,9 @@ from typing import Any, Dict, Generator, List, Optional
 
 from .artifact import Artifact
 from .dataclass import InternalField, NonPositionalField
+from .memory_profiling import is_memory_profiling, memory_profiled
 from .stream import MultiStream, Stream
+from .telemetry import instrumented_stream, is_telemetry_enabled
 from .utils import is_module_available
 
 
@@ -214,10 +216,28 @@ class SingleStreamOperator(MultiStreamOperator):
     def _process_single_stream(
         self, stream: Stream, stream_name: Optional[str] = None
     ) -> Stream:
-        return Stream(
-            self._process_stream,
-            gen_kwargs={"stream": stream, "stream_name": stream_name},
-        )
+        if is_telemetry_enabled():
+            result = Stream(
+                instrumented_stream,
+                gen_kwargs={
+                    "generator": self._process_stream,
+                    "gen_kwargs": {"stream": stream, "stream_name": stream_name},
+                    "instances_counter": "unitxt_operator_instances_total",
+                    "seconds_counter": "unitxt_operator_seconds_total",
+                    "labels": {
+                        "operator": self.__class__.__name__,
+                        "split": stream_name,
+                    },
+                },
+            )
+        else:
+            result = Stream(
+                self._process_stream,
+                gen_kwargs={"stream": stream, "stream_name": stream_name},
+            )
+        if is_memory_profiling():
+            result = memory_profiled(result, self.__class__, stream_name)
+        return result
 
     def _is_should_be_processed(self, stream_name):
         if (
@@ -477,6 +497,20 @@ class SourceSequentialOperator(SequentialOperator):
     def __call__(self) -> MultiStream:
         return super().__call__()
 
+    def explain(self, sample_size: int = 100, full_size=None, measure_memory=True):
+        """Run the steps on a sample of the loaded instances, and report the cost of every step.
+
+        See unitxt.explain.explain for the details of the returned plan.
+        """
+        from .explain import explain
+
+        return explain(
+            self,
+            sample_size=sample_size,
+            full_size=full_size,
+            measure_memory=measure_memory,
+        )
+
     def process(self, multi_stream: Optional[MultiStream] = None) -> MultiStream:
         assert (
             self.num_steps() > 0
@@ -33,12 +33,17 @@ General Operaotrs List:
 ------------------------
 """
 import collections
+import hashlib
+import json
 import operator
 import os
+import shutil
+import tempfile
 import uuid
 import zipfile
 from abc import abstractmethod
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import field
 from itertools import zip_longest
@@ -54,12 +59,14 @@ from typing import (
     Tuple,
     Union,
 )
-
-import requests
+from urllib.parse import urlparse
 
 from .artifact import Artifact, fetch_artifact
 from .dataclass import NonPositionalField, OptionalField
 from .dict_utils import dict_delete, dict_get, dict_set, is_subpath
+from .file_utils import file_checksum, file_lock, get_cache_dir
+from .http_utils import atomic_write_json, get_session
+from .logging_utils import get_logger
 from .operator import (
     MultiStream,
     MultiStreamOperator,
@@ -77,10 +84,12 @@ from .operator import (
 from .random_utils import new_random_generator
 from .settings_utils import get_settings
 from .stream import Stream
+from .telemetry import record_cache
 from .text_utils import nested_tuple_to_string
 from .type_utils import isoftype
 from .utils import flatten_dict
 
+logger = get_logger()
 settings = get_settings()
 
 
@@ -1092,6 +1101,7 @@ class ArtifactFetcherMixin:
 
     @classmethod
     def get_artifact(cls, artifact_identifier: str) -> Artifact:
+        record_cache("artifact_fetcher", hit=artifact_identifier in cls.cache)
         if artifact_identifier not in cls.cache:
             artifact, artifactory = fetch_artifact(artifact_identifier)
             cls.cache[artifact_identifier] = artifact
@@ -1823,39 +1833,195 @@ class DownloadError(Exception):
         self,
         message,
     ):
-        self.__super__(message)
+        super().__init__(message)
 
 
 class UnexpectedHttpCodeError(Exception):
     def __init__(self, http_code):
-        self.__super__(f"unexpected http code {http_code}")
+        super().__init__(f"unexpected http code {http_code}")
+        self.http_code = http_code
+
+
+def _remove_files(*paths: str):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _split_checksum(checksum: str) -> Tuple[str, str]:
+    # "sha256:<hex digest>", or a sha256 hex digest
+    algorithm, _, digest = checksum.rpartition(":")
+    return algorithm or "sha256", digest.lower()
 
 
 class DownloadOperator(SideEffectOperator):
     """Operator for downloading a file from a given URL to a specified local path.
 
+    The file is streamed to disk in chunks. Downloads are kept in a download cache (under
+    the unitxt cache dir), keyed by the URL and the expected checksum, so every file is
+    downloaded once, and an interrupted download is resumed by an HTTP range request.
+
     Attributes:
         source (str): URL of the file to be downloaded.
         target (str): Local path where the downloaded file should be saved.
+        checksum (str, optional): The expected checksum of the file, as "<algorithm>:<hex digest>"
+            (e.g., "sha256:9f86d0...") or a sha256 hex digest. A download with another checksum fails.
+        caching (bool): Whether to keep the download in the download cache.
+        chunk_size (int): The number of bytes written at once.
+        timeout (float): Timeout in seconds of connecting and of each read.
     """
 
     source: str
     target: str
+    checksum: Optional[str] = None
+    caching: bool = True
+    chunk_size: int = 1 << 20
+    timeout: float = 60
+
+    def cache_file(self) -> str:
+        key = hashlib.sha256(
+            json.dumps([self.source, self.checksum]).encode()
+        ).hexdigest()[:32]
+        name = os.path.basename(urlparse(self.source).path) or "download"
+        return os.path.join(get_cache_dir("downloads"), key, name)
+
+    def verify_checksum(self, path: str):
+        if self.checksum is None:
+            return
+        algorithm, expected = _split_checksum(self.checksum)
+        actual = file_checksum(path, algorithm)
+        if actual != expected:
+            os.remove(path)
+            raise DownloadError(
+                f"The {algorithm} checksum of {self.source} is {actual}, expected {expected}"
+            )
 
-    def process(self):
+    @staticmethod
+    def response_validator(response) -> Optional[str]:
+        # If-Range accepts a strong ETag or a Last-Modified date
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return response.headers.get("Last-Modified")
+
+    @staticmethod
+    def read_validator(state_file: str) -> Optional[str]:
         try:
-            response = requests.get(self.source, allow_redirects=True)
-        except Exception as e:
-            raise DownloadError(f"Unabled to download {self.source}") from e
-        if response.status_code != 200:
+            with open(state_file) as f:
+                return json.load(f).get("validator")
+        except (OSError, ValueError):
+            return None
+
+    def write_response(self, response, part_file: str, offset: int) -> bool:
+        """Write the body of a response to part_file, or return False to restart the download."""
+        if offset and response.status_code == 416:
+            # a complete partial download has nothing left to request
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+            return total == str(offset)
+        if offset and response.status_code == 206:
+            logger.info(f"Resuming the download of {self.source} at byte {offset}")
+            mode = "ab"
+        elif response.status_code == 200:
+            # a full response also answers a resumption of a file that has changed since
+            mode = "wb"
+            validator = self.response_validator(response)
+            _remove_files(part_file + ".json")
+            if validator is not None:
+                atomic_write_json(part_file + ".json", {"validator": validator})
+        else:
             raise UnexpectedHttpCodeError(response.status_code)
-        with open(self.target, "wb") as f:
-            f.write(response.content)
+        with open(part_file, mode) as f:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                f.write(chunk)
+        return True
+
+    def download(self, path: str):
+        """Download the source to path, through path + ".part", resuming a partial download.
+
+        The ETag (or Last-Modified date) of the source is kept next to the partial download,
+        and a resumption asks for the rest of the file only if the source has not changed.
+        """
+        part_file = path + ".part"
+        state_file = part_file + ".json"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        offset, headers = 0, {}
+        validator = self.read_validator(state_file)
+        if validator is not None and os.path.exists(part_file):
+            offset = os.path.getsize(part_file)
+            headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+        try:
+            with get_session().get(
+                self.source,
+                headers=headers,
+                stream=True,
+                allow_redirects=True,
+                timeout=self.timeout,
+            ) as response:
+                completed = self.write_response(response, part_file, offset)
+        except UnexpectedHttpCodeError:
+            raise
+        except Exception as e:
+            raise DownloadError(f"Unable to download {self.source}") from e
+        if not completed:
+            _remove_files(part_file, state_file)
+            self.download(path)
+            return
+        _remove_files(state_file)
+        self.verify_checksum(part_file)
+        os.replace(part_file, path)
+
+    def process(self):
+        if not self.caching:
+            self.download(self.target)
+            return
+        cache_file = self.cache_file()
+        # concurrent downloads of the same file wait for the first one
+        with file_lock(cache_file + ".lock"):
+            hit = os.path.exists(cache_file)
+            record_cache("downloads", hit=hit)
+            if not hit:
+                self.download(cache_file)
+        if os.path.exists(self.target) and os.path.samefile(cache_file, self.target):
+            return
+        target_dir = os.path.dirname(os.path.abspath(self.target))
+        os.makedirs(target_dir, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(dir=target_dir, prefix=".tmp-")
+        os.close(fd)
+        try:
+            shutil.copyfile(cache_file, temp_file)
+            # temporary files are created readable only by their owner
+            os.chmod(temp_file, 0o644)
+            os.replace(temp_file, self.target)
+        except BaseException:
+            _remove_files(temp_file)
+            raise
+
+
+class DownloadFiles(SideEffectOperator):
+    """Operator for downloading several files concurrently.
+
+    Attributes:
+        downloads (List[DownloadOperator]): The downloads.
+        max_workers (int): The number of files downloaded at once.
+    """
+
+    downloads: List[DownloadOperator]
+    max_workers: int = 8
+
+    def process(self):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(download.process) for download in self.downloads]
+            for future in futures:
+                future.result()
 
 
 class ExtractZipFile(SideEffectOperator):
     """Operator for extracting files from a zip archive.
 
+    A marker holding the checksum of the archive is written into the target directory
+    after the extraction, and the extraction is skipped when the target directory
+    already holds the contents of the same archive.
+
     Attributes:
         zip_file (str): Path of the zip file to be extracted.
         target_dir (str): Directory where the contents of the zip file will be extracted.
@@ -1865,5 +2031,20 @@ class ExtractZipFile(SideEffectOperator):
     target_dir: str
 
     def process(self):
+        marker_file = os.path.join(self.target_dir, ".unitxt_extracted")
+        archive_checksum = file_checksum(self.zip_file)
+        try:
+            with open(marker_file) as f:
+                extracted = f.read().strip() == archive_checksum
+        except OSError:
+            extracted = False
+        record_cache("extract_zip", hit=extracted)
+        if extracted:
+            logger.info(
+                f"{self.target_dir} already holds the contents of {self.zip_file}"
+            )
+            return
         with zipfile.ZipFile(self.zip_file) as zf:
             zf.extractall(self.target_dir)
+        with open(marker_file, "w") as f:
+            f.write(archive_checksum)
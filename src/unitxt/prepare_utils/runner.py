@@ -0,0 +1,467 @@
+"""Incremental, parallel runner of the catalog preparation scripts under ``prepare/``.
+
+Every script is fingerprinted by its source and the source of the unitxt modules it
+imports (directly or through other unitxt modules). A script is run only if its
+fingerprint changed since its last successful run, or if one of the catalog
+artifacts it saved was removed or modified. Scripts that need to run are executed
+concurrently, each in a fresh python process, so a failing or crashing script does
+not affect the others. The state of the last run is kept in a json file, and a
+summary with the time of every script (slowest first) is logged and optionally
+written to a json file.
+
+Note that fingerprints are computed from static imports, so changes of installed
+packages or of remote data are not detected. Use ``--force`` to run everything.
+
+Usage:
+    python -m src.unitxt.prepare_utils.runner
+    python -m src.unitxt.prepare_utils.runner --jobs 8 --summary prepare_summary.json
+    python -m src.unitxt.prepare_utils.runner --only "prepare/cards/*" --force
+"""
+import argparse
+import ast
+import fnmatch
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from ..http_utils import atomic_write_json
+from ..logging_utils import get_logger
+from ..settings_utils import get_constants, get_settings
+
+logger = get_logger()
+constants = get_constants()
+settings = get_settings()
+
+# Bump to invalidate the fingerprints of all the scripts.
+RUNNER_VERSION = "1"
+PACKAGE_NAMES = ["src.unitxt", "unitxt"]
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_DIR = os.path.dirname(os.path.dirname(PACKAGE_DIR))
+STATE_FILE_NAME = ".prepare_state.json"
+
+
+def _module_path(parts: List[str], package_dir: str) -> Optional[str]:
+    base = os.path.join(package_dir, *parts)
+    if os.path.isfile(base + ".py"):
+        return base + ".py"
+    init_path = os.path.join(base, "__init__.py")
+    if os.path.isfile(init_path):
+        return init_path
+    return None
+
+
+def _package_relative_parts(module_name: str) -> Optional[List[str]]:
+    for package_name in PACKAGE_NAMES:
+        if module_name == package_name:
+            return []
+        if module_name.startswith(package_name + "."):
+            return module_name[len(package_name) + 1 :].split(".")
+    return None
+
+
+def _import_from_parts(
+    node: ast.ImportFrom, current_package: Optional[List[str]]
+) -> Optional[List[str]]:
+    if node.level == 0:
+        return _package_relative_parts(node.module)
+    if current_package is None or node.level > len(current_package) + 1:
+        return None
+    parts = current_package[: len(current_package) - node.level + 1]
+    if node.module is not None:
+        parts = parts + node.module.split(".")
+    return parts
+
+
+def _imported_parts(file_path: str, package_dir: str) -> List[List[str]]:
+    """Return the package relative names of the unitxt modules imported by a file."""
+    with open(file_path) as f:
+        tree = ast.parse(f.read(), filename=file_path)
+
+    current_package = None
+    relative_path = os.path.relpath(file_path, package_dir)
+    if not relative_path.startswith(os.pardir):
+        current_package = os.path.dirname(relative_path).split(os.sep)
+        current_package = [part for part in current_package if part]
+
+    imported = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                parts = _package_relative_parts(alias.name)
+                if parts is not None:
+                    imported.append(parts)
+        elif isinstance(node, ast.ImportFrom):
+            parts = _import_from_parts(node, current_package)
+            if parts is None:
+                continue
+            imported.append(parts)
+            # "from package import module" imports a module as well
+            imported.extend([*parts, alias.name] for alias in node.names)
+    return imported
+
+
+def get_dependencies(file_path: str, package_dir: str = PACKAGE_DIR) -> List[str]:
+    """Return the unitxt source files imported by a file, directly or transitively.
+
+    Importing a module runs the ``__init__.py`` of its parent packages, so these are
+    included as well.
+    """
+    dependencies = set()
+    frontier = [file_path]
+    while frontier:
+        current = frontier.pop()
+        # The modified time is part of the cache key, so edited files are parsed again
+        mtime = os.stat(current).st_mtime_ns
+        for path in _direct_dependencies(current, package_dir, mtime):
+            if path not in dependencies:
+                dependencies.add(path)
+                frontier.append(path)
+    dependencies.discard(file_path)
+    return sorted(dependencies)
+
+
+@lru_cache(maxsize=None)
+def _direct_dependencies(file_path: str, package_dir: str, mtime: int) -> List[str]:
+    paths = set()
+    for parts in _imported_parts(file_path, package_dir):
+        for i in range(len(parts) + 1):
+            paths.add(_module_path(parts[:i], package_dir))
+    paths.discard(None)
+    return sorted(paths)
+
+
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _source_hash(path: str, mtime: int) -> str:
+    return _file_hash(path)
+
+
+def compute_fingerprint(file_path: str, package_dir: str = PACKAGE_DIR) -> str:
+    fingerprint = hashlib.sha256(RUNNER_VERSION.encode())
+    for path in [file_path, *get_dependencies(file_path, package_dir)]:
+        fingerprint.update(os.path.relpath(path, package_dir).encode())
+        fingerprint.update(_source_hash(path, os.stat(path).st_mtime_ns).encode())
+    return fingerprint.hexdigest()
+
+
+def load_state(state_path: str) -> Dict[str, Dict]:
+    if not os.path.isfile(state_path):
+        return {}
+    try:
+        with open(state_path) as f:
+            return json.load(f)
+    except (OSError, json.decoder.JSONDecodeError):
+        logger.warning(f"Ignoring unreadable preparation state file {state_path}")
+        return {}
+
+
+def _artifacts_unchanged(artifacts: Dict[str, str], catalog_dir: str) -> bool:
+    for relative_path, artifact_hash in artifacts.items():
+        path = os.path.join(catalog_dir, relative_path)
+        if not os.path.isfile(path) or _file_hash(path) != artifact_hash:
+            return False
+    return True
+
+
+def is_up_to_date(
+    script_state: Optional[Dict], fingerprint: str, catalog_dir: str
+) -> bool:
+    return (
+        script_state is not None
+        and script_state.get("status") == "passed"
+        and script_state.get("fingerprint") == fingerprint
+        and _artifacts_unchanged(script_state.get("artifacts", {}), catalog_dir)
+    )
+
+
+def run_script(file_path: str, report_path: str):
+    """Run a preparation script in this process and write a json report of the run.
+
+    The settings are the ones used by the catalog preparation tests.
+    """
+    from ..catalog import record_saved_artifacts
+    from ..loaders import MissingKaggleCredentialsError
+    from ..test_utils.catalog import register_local_catalog_for_tests
+
+    settings.allow_unverified_code = True
+    settings.use_only_local_catalogs = True
+    settings.global_loader_limit = 300
+    register_local_catalog_for_tests()
+
+    report = {"status": "passed", "error": None}
+    with record_saved_artifacts() as saved_paths:
+        try:
+            module_name = os.path.splitext(os.path.basename(file_path))[0]
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            spec.loader.exec_module(importlib.util.module_from_spec(spec))
+        except MissingKaggleCredentialsError as e:
+            report = {"status": "skipped", "error": str(e)}
+        except Exception as e:
+            report = {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+    report["saved_paths"] = [os.path.abspath(path) for path in saved_paths]
+    atomic_write_json(report_path, report)
+
+
+def _run_script_in_worker(
+    file_path: str, project_dir: str, timeout: Optional[float]
+) -> Dict:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_path = os.path.join(temp_dir, "report.json")
+        command = [
+            sys.executable,
+            "-m",
+            "src.unitxt.prepare_utils.runner",
+            "--worker",
+            file_path,
+            "--report",
+            report_path,
+        ]
+        start_time = time.time()
+        try:
+            result = subprocess.run(
+                command,
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return {
+                "status": "failed",
+                "error": f"Timed out after {timeout} seconds",
+                "saved_paths": [],
+                "time": time.time() - start_time,
+            }
+        elapsed_time = time.time() - start_time
+        if not os.path.isfile(report_path):
+            output = (result.stderr or result.stdout).strip().splitlines()
+            return {
+                "status": "failed",
+                "error": f"Worker exited with code {result.returncode}: "
+                + "\n".join(output[-20:]),
+                "saved_paths": [],
+                "time": elapsed_time,
+            }
+        with open(report_path) as f:
+            report = json.load(f)
+        report["time"] = elapsed_time
+        return report
+
+
+def _find_conflicts(state: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """Return the artifacts saved by more than one script, with the scripts that saved them."""
+    savers = {}
+    for script, script_state in state.items():
+        for artifact in script_state.get("artifacts", {}):
+            savers.setdefault(artifact, []).append(script)
+    return {
+        artifact: sorted(scripts)
+        for artifact, scripts in savers.items()
+        if len(scripts) > 1
+    }
+
+
+def _list_scripts(
+    prepare_dir: str, project_dir: str, only: Optional[List[str]]
+) -> List[str]:
+    scripts = sorted(glob.glob(os.path.join(prepare_dir, "**", "*.py"), recursive=True))
+    if not only:
+        return scripts
+    return [
+        script
+        for script in scripts
+        if any(
+            fnmatch.fnmatch(os.path.relpath(script, project_dir), pattern)
+            for pattern in only
+        )
+    ]
+
+
+def _run_scripts(
+    to_run: Dict[str, str],
+    project_dir: str,
+    catalog_dir: str,
+    jobs: int,
+    timeout: Optional[float],
+) -> Dict[str, Dict]:
+    """Run scripts in parallel workers, and return their reports keyed like to_run."""
+    reports = {}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(_run_script_in_worker, script, project_dir, timeout): key
+            for key, script in to_run.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            report = future.result()
+            report["artifacts"] = {
+                os.path.relpath(path, catalog_dir): _file_hash(path)
+                for path in report.pop("saved_paths")
+                if os.path.commonpath([path, catalog_dir]) == catalog_dir
+                and os.path.isfile(path)
+            }
+            error = f"\n{report['error']}" if report["error"] else ""
+            logger.info(f"{report['status']:8} {report['time']:8.2f}s  {key}{error}")
+            reports[key] = report
+    return reports
+
+
+def run_preparation(
+    prepare_dir: str = os.path.join(PROJECT_DIR, "prepare"),
+    catalog_dir: str = constants.default_catalog_path,
+    state_path: Optional[str] = None,
+    project_dir: str = PROJECT_DIR,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    only: Optional[List[str]] = None,
+    timeout: Optional[float] = None,
+    dry_run: bool = False,
+) -> Dict:
+    """Run the preparation scripts that changed since their last successful run.
+
+    Args:
+        prepare_dir (str): Directory of the preparation scripts (searched recursively).
+        catalog_dir (str): The catalog the scripts save their artifacts to. Only artifacts saved there are tracked.
+        state_path (str, optional): Json file that keeps the state between runs. Defaults to ``.prepare_state.json`` in project_dir.
+        project_dir (str): Directory the scripts are run from.
+        jobs (int, optional): Number of scripts run concurrently. Defaults to the number of cpus.
+        force (bool): Run all the scripts, even if they are up to date.
+        only (List[str], optional): Glob patterns (relative to project_dir); only matching scripts are considered.
+        timeout (float, optional): Seconds after which a running script is stopped and marked as failed.
+        dry_run (bool): Only report which scripts would run.
+
+    Returns:
+        A summary dict with the results of the scripts that ran, slowest first.
+    """
+    if state_path is None:
+        state_path = os.path.join(project_dir, STATE_FILE_NAME)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    catalog_dir = os.path.abspath(catalog_dir)
+    scripts = _list_scripts(prepare_dir, project_dir, only)
+
+    state = load_state(state_path)
+    fingerprints = {}
+    to_run = {}
+    for script in scripts:
+        key = os.path.relpath(script, project_dir)
+        fingerprints[key] = compute_fingerprint(script)
+        if force or not is_up_to_date(state.get(key), fingerprints[key], catalog_dir):
+            to_run[key] = script
+    logger.info(
+        f"{len(to_run)} preparation scripts to run, "
+        f"{len(scripts) - len(to_run)} are up to date."
+    )
+
+    start_time = time.time()
+    reports = {}
+    if not dry_run and to_run:
+        reports = _run_scripts(to_run, project_dir, catalog_dir, jobs, timeout)
+        for key, report in reports.items():
+            state[key] = {
+                "fingerprint": fingerprints[key],
+                "status": report["status"],
+                "time": round(report["time"], 3),
+                "artifacts": report["artifacts"],
+            }
+        if not only:
+            # Forget scripts that were removed
+            state = {key: value for key, value in state.items() if key in fingerprints}
+        atomic_write_json(state_path, state)
+
+    results = {
+        key: {
+            "status": report["status"],
+            "time": round(report["time"], 3),
+            "error": report["error"],
+        }
+        for key, report in sorted(reports.items(), key=lambda item: -item[1]["time"])
+    }
+    return {
+        "ran": len(results),
+        "up_to_date": len(scripts) - len(to_run),
+        "failed": sorted(
+            key for key, result in results.items() if result["status"] == "failed"
+        ),
+        "to_run": sorted(to_run) if dry_run else [],
+        "wall_time": round(time.time() - start_time, 3),
+        "scripts_time": round(sum(result["time"] for result in results.values()), 3),
+        "conflicts": _find_conflicts(state),
+        "scripts": results,
+    }
+
+
+def log_summary(summary: Dict, slowest: int = 10):
+    lines = [
+        f"Ran {summary['ran']} preparation scripts in {summary['wall_time']:.2f}s "
+        f"({summary['scripts_time']:.2f}s in total), "
+        f"{summary['up_to_date']} were up to date."
+    ]
+    if summary["scripts"]:
+        lines.append(f"Slowest {slowest} scripts:")
+        for key, result in list(summary["scripts"].items())[:slowest]:
+            lines.append(f"    {result['time']:8.2f}s  {result['status']:8} {key}")
+    for artifact, scripts in summary["conflicts"].items():
+        lines.append(f"Artifact {artifact} is saved by several scripts: {scripts}")
+    if summary["failed"]:
+        lines.append(f"Failed scripts: {', '.join(summary['failed'])}")
+    logger.info("\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--prepare-dir", default=os.path.join(PROJECT_DIR, "prepare"))
+    parser.add_argument("--catalog-dir", default=constants.default_catalog_path)
+    parser.add_argument("--state", help="Json file with the state between runs.")
+    parser.add_argument("--jobs", type=int, help="Number of concurrent scripts.")
+    parser.add_argument("--force", action="store_true", help="Run all the scripts.")
+    parser.add_argument("--only", nargs="+", help="Glob patterns of scripts to run.")
+    parser.add_argument("--timeout", type=float, help="Timeout of each script.")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--summary", help="Write the summary as json to this file.")
+    parser.add_argument("--slowest", type=int, default=10)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--report", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        run_script(args.worker, args.report)
+        return
+
+    summary = run_preparation(
+        prepare_dir=args.prepare_dir,
+        catalog_dir=args.catalog_dir,
+        state_path=args.state,
+        jobs=args.jobs,
+        force=args.force,
+        only=args.only,
+        timeout=args.timeout,
+        dry_run=args.dry_run,
+    )
+    if args.dry_run:
+        scripts = "\n".join(summary["to_run"])
+        logger.info(f"Scripts to run:\n{scripts}")
+    else:
+        log_summary(summary, slowest=args.slowest)
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=4)
+    if summary["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
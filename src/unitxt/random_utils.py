@@ -3,7 +3,7 @@ import random as python_random
 
 __default_seed__ = 42
 
-from typing import Any, Hashable
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
 
 
 def get_seed():
@@ -32,3 +32,113 @@ def new_random_generator(sub_seed: Any) -> python_random.Random:
 
     sub_default_seed = str(__default_seed__) + "/" + sub_seed
     return python_random.Random(sub_default_seed)
+
+
+def _stratum_key(value: Any) -> Hashable:
+    return value if isinstance(value, Hashable) else str(value)
+
+
+def stratum_sizes(counts: Dict[Hashable, int], size: int) -> Dict[Hashable, int]:
+    """Split a sample size among strata, proportionally to their counts.
+
+    The sizes are rounded by the largest remainder, and every stratum gets at least
+    one item when the size allows it.
+    """
+    total = sum(counts.values())
+    if size >= total:
+        return dict(counts)
+    quotas = {stratum: size * count / total for stratum, count in counts.items()}
+    sizes = {stratum: int(quota) for stratum, quota in quotas.items()}
+    if size >= len(counts):
+        for stratum in sizes:
+            sizes[stratum] = max(sizes[stratum], 1)
+    # the strata ordered by their rounding loss, largest first
+    order = sorted(counts, key=lambda stratum: sizes[stratum] - quotas[stratum])
+    missing = size - sum(sizes.values())
+    while missing > 0:
+        for stratum in order:
+            if missing > 0 and sizes[stratum] < counts[stratum]:
+                sizes[stratum] += 1
+                missing -= 1
+    while missing < 0:
+        for stratum in reversed(order):
+            if missing < 0 and sizes[stratum] > 1:
+                sizes[stratum] -= 1
+                missing += 1
+    return sizes
+
+
+def sample_indices(
+    num_items: int,
+    size: int,
+    random_generator: python_random.Random,
+    strata: Optional[Sequence[Any]] = None,
+) -> List[int]:
+    """The sorted indices of a random sample of size items out of num_items.
+
+    When strata (the stratum of every item) is given, the sample is stratified:
+    every stratum is sampled in proportion to its number of items.
+    """
+    if size >= num_items:
+        return list(range(num_items))
+    if strata is None:
+        return sorted(random_generator.sample(range(num_items), size))
+    groups = {}
+    for index, stratum in enumerate(strata):
+        groups.setdefault(_stratum_key(stratum), []).append(index)
+    sizes = stratum_sizes(
+        {stratum: len(group) for stratum, group in groups.items()}, size
+    )
+    indices = []
+    for stratum, group in groups.items():
+        indices.extend(random_generator.sample(group, sizes[stratum]))
+    return sorted(indices)
+
+
+def _add_to_reservoir(reservoir, count, size, item, random_generator):
+    if count < size:
+        reservoir.append(item)
+    else:
+        index = random_generator.randint(0, count)
+        if index < size:
+            reservoir[index] = item
+
+
+def reservoir_sample(
+    items: Iterable[Any],
+    size: int,
+    random_generator: python_random.Random,
+    stratum: Optional[Callable[[Any], Any]] = None,
+) -> List[Any]:
+    """A random sample of size items, in one pass over items, keeping at most size items in memory.
+
+    The sampled items are returned in their original order. When stratum (a function
+    of an item) is given, the sample is stratified: a reservoir is kept for every
+    stratum, and every stratum is sampled in proportion to its number of items.
+    """
+    if stratum is None:
+        reservoir = []
+        for position, item in enumerate(items):
+            _add_to_reservoir(
+                reservoir, position, size, (position, item), random_generator
+            )
+        return [item for _, item in sorted(reservoir, key=lambda entry: entry[0])]
+
+    reservoirs = {}
+    counts = {}
+    for position, item in enumerate(items):
+        key = _stratum_key(stratum(item))
+        count = counts.get(key, 0)
+        _add_to_reservoir(
+            reservoirs.setdefault(key, []),
+            count,
+            size,
+            (position, item),
+            random_generator,
+        )
+        counts[key] = count + 1
+    sizes = stratum_sizes(counts, size)
+    sample = []
+    for key, reservoir in reservoirs.items():
+        sample.extend(random_generator.sample(reservoir, sizes[key]))
+    return [item for _, item in sorted(sample, key=lambda entry: entry[0])]
@@ -69,26 +69,52 @@ def _reset_env_local_catalogs():
             _register_catalog(EnvironmentLocalCatalog(location=path))
 
 
-def _register_all_artifacts():
+def _get_registered_modules_names():
     dir = os.path.dirname(__file__)
     file_name = os.path.basename(__file__)
 
-    for file in os.listdir(dir):
+    for file in sorted(os.listdir(dir)):
         if (
             file.endswith(".py")
             and file not in constants.non_registered_files
             and file != file_name
         ):
-            module_name = file.replace(".py", "")
-
-            module = importlib.import_module("." + module_name, __package__)
-
-            for _name, obj in inspect.getmembers(module):
-                # Make sure the object is a class
-                if inspect.isclass(obj):
-                    # Make sure the class is a subclass of Artifact (but not Artifact itself)
-                    if issubclass(obj, Artifact) and obj is not Artifact:
-                        Artifact.register_class(obj)
+            yield file.replace(".py", "")
+
+
+def generate_artifact_types_manifest():
+    """Map every artifact type defined in the package to the module defining it."""
+    manifest = {}
+    for module_name in _get_registered_modules_names():
+        module = importlib.import_module("." + module_name, __package__)
+
+        for _name, obj in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(obj, Artifact)
+                and obj is not Artifact
+                and obj.__module__ == module.__name__
+            ):
+                manifest[obj.get_artifact_type()] = module_name
+
+    return dict(sorted(manifest.items()))
+
+
+def write_artifact_types_manifest(path=None):
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), "artifact_types_manifest.py")
+    lines = [
+        "# This file is generated by `make artifacts-manifest`. Do not edit it by hand.",
+        "# It maps each artifact type to the module (relative to the unitxt package)",
+        "# defining it, so modules are imported only when their types are first loaded.",
+        "ARTIFACT_TYPES_MODULES = {",
+        *[
+            f'    "{type}": "{module_name}",'
+            for type, module_name in generate_artifact_types_manifest().items()
+        ],
+        "}",
+    ]
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
 
 
 class ProjectArtifactRegisterer(metaclass=Singleton):
@@ -97,8 +123,8 @@ class ProjectArtifactRegisterer(metaclass=Singleton):
             self._registered = False
 
         if not self._registered:
+            # Artifact types are registered lazily, when first loaded (see artifact_types_manifest.py)
             _register_all_catalogs()
-            _register_all_artifacts()
             self._registered = True
 
 
@@ -0,0 +1,146 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .logging_utils import get_logger
+from .operator import SourceSequentialOperator, StreamInstanceOperator
+from .random_utils import new_random_generator
+from .splitters import Sampler, SpreadSplit
+
+logger = get_logger()
+
+
+def _instance_steps(steps, what: str) -> List[StreamInstanceOperator]:
+    for step in steps:
+        if not isinstance(step, StreamInstanceOperator):
+            raise ValueError(
+                f"Can not render single instances: {what} contains {step.__class__.__name__}, which is not an instance operator."
+            )
+    return list(steps)
+
+
+class InstanceRenderer:
+    """Renders single instances with the task, template, demos, system prompt and format of a recipe.
+
+    The renderer is built once from a prepared recipe (e.g. a ``StandardRecipe``), and
+    then turns the fields of one instance into the model input the recipe would have
+    produced for it, without building streams. The demos pool is loaded and rendered
+    with the template once, when the renderer is built, and the operators of the
+    recipe are frozen into a list of ``process`` calls.
+
+    The demos of every instance are sampled with a random generator seeded by the
+    instance inputs, so the same instance always gets the same demos, regardless of
+    the order of the calls. ``render`` can be called concurrently from many threads.
+
+    Args:
+        recipe (BaseRecipe): The recipe to render instances with.
+        demos_pool (Iterable[Dict], optional): Instances (with the fields the task expects) to use as the demos
+            pool, instead of loading the demos pool of the recipe from its card.
+        apply_preprocess_steps (bool): Whether ``render`` gets raw instances of the card loader, and applies the
+            preprocess steps of the card to them. This requires all the preprocess steps to be instance operators.
+
+    Example:
+        renderer = InstanceRenderer(StandardRecipe(card="cards.sst2", template_card_index=0))
+        renderer.render({"text": "a great movie", "label": "positive"})["source"]
+    """
+
+    def __init__(
+        self,
+        recipe,
+        demos_pool: Optional[Iterable[Dict[str, Any]]] = None,
+        apply_preprocess_steps: bool = False,
+    ):
+        self.recipe = recipe
+        steps = recipe.steps
+        task_index = steps.index(recipe.card.task)
+        template_index = steps.index(recipe.template, task_index)
+
+        preprocess_steps = []
+        if apply_preprocess_steps and recipe.card.preprocess_steps is not None:
+            preprocess_steps = _instance_steps(
+                recipe.card.preprocess_steps, "the card preprocess steps"
+            )
+        # the steps between the task and the template also include the demos pool
+        # creation and the refiners, which work on whole streams
+        task_steps = [
+            step
+            for step in steps[task_index:template_index]
+            if isinstance(step, StreamInstanceOperator)
+        ]
+        self.demos_step = None
+        format_steps = []
+        for step in steps[template_index + 1 :]:
+            if isinstance(step, SpreadSplit):
+                self.demos_step = step
+            else:
+                format_steps.append(step)
+
+        self._input_processors = self._processors([*task_steps, recipe.template])
+        self._preprocessors = self._processors(preprocess_steps)
+        self._format_processors = self._processors(
+            _instance_steps(format_steps, "the recipe after the template")
+        )
+
+        self.demos_pool = None
+        self.sampler: Optional[Sampler] = None
+        self._sampler_lock = threading.Lock()
+        if self.demos_step is not None:
+            self.sampler = self.demos_step.sampler
+            if demos_pool is None:
+                self.demos_pool = self._load_demos_pool(template_index)
+            else:
+                self.demos_pool = [self._render_input(dict(d)) for d in demos_pool]
+            if len(self.demos_pool) < self.sampler.sample_size:
+                raise ValueError(
+                    f"The demos pool has {len(self.demos_pool)} instances, but {self.sampler.sample_size} demos are required."
+                )
+            # build the caches of samplers (e.g. the labels of DiverseLabelsSampler) now
+            self._sample_demos({})
+
+    @staticmethod
+    def _processors(steps) -> List[Callable]:
+        return [step.process for step in steps]
+
+    def _load_demos_pool(self, template_index: int) -> List[Dict[str, Any]]:
+        logger.info(
+            f"Loading demos pool '{self.recipe.demos_pool_name}' for the renderer"
+        )
+        multi_stream = SourceSequentialOperator(
+            steps=self.recipe.steps[: template_index + 1]
+        )()
+        return list(multi_stream[self.recipe.demos_pool_name])
+
+    def _render_input(self, instance: Dict[str, Any]) -> Dict[str, Any]:
+        for process in self._preprocessors:
+            instance = process(instance)
+        for process in self._input_processors:
+            instance = process(instance)
+        return instance
+
+    def _sample_demos(self, inputs) -> List[Dict[str, Any]]:
+        random_generator = new_random_generator(sub_seed=inputs)
+        with self._sampler_lock:
+            self.sampler.random_generator = random_generator
+            return self.sampler.sample(self.demos_pool)
+
+    def render(self, instance_fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Render one instance.
+
+        Args:
+            instance_fields (Dict[str, Any]): The fields of the instance that the task expects (or the raw fields,
+                if the renderer applies the card preprocess steps). The dict is not changed.
+
+        Returns:
+            The instance as it appears in the recipe output, with "source", "target", "references",
+            "task_data", "metrics", "group" and "postprocessors".
+        """
+        instance = self._render_input(dict(instance_fields))
+        if self.demos_step is not None:
+            instance[self.demos_step.target_field] = self._sample_demos(
+                instance.get("inputs")
+            )
+        for process in self._format_processors:
+            instance = process(instance)
+        return instance
+
+    def render_many(self, instances: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self.render(instance) for instance in instances]
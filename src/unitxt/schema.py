@@ -1,22 +1,34 @@
 import json
 from dataclasses import field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-from datasets import Features, Sequence, Value
-
 from .operator import StreamInstanceOperatorValidator
 
-UNITXT_DATASET_SCHEMA = Features(
-    {
-        "source": Value("string"),
-        "target": Value("string"),
-        "references": Sequence(Value("string")),
-        "metrics": Sequence(Value("string")),
-        "group": Value("string"),
-        "postprocessors": Sequence(Value("string")),
-        "task_data": Value(dtype="string"),
-    }
-)
+
+@lru_cache(maxsize=None)
+def get_unitxt_dataset_schema():
+    from datasets import Features, Sequence, Value
+
+    return Features(
+        {
+            "source": Value("string"),
+            "target": Value("string"),
+            "references": Sequence(Value("string")),
+            "metrics": Sequence(Value("string")),
+            "group": Value("string"),
+            "postprocessors": Sequence(Value("string")),
+            "task_data": Value(dtype="string"),
+        }
+    )
+
+
+def __getattr__(name):
+    # UNITXT_DATASET_SCHEMA is built on first access, so importing this module does not import datasets
+    if name == "UNITXT_DATASET_SCHEMA":
+        return get_unitxt_dataset_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # UNITXT_METRIC_SCHEMA = Features({
 #     "predictions": Value("string", id="sequence"),
@@ -47,10 +59,11 @@ class ToUnitxtGroup(StreamInstanceOperatorValidator):
         instance["task_data"] = json.dumps(task_data)
 
         if self.remove_unnecessary_fields:
+            schema = get_unitxt_dataset_schema()
             keys_to_delete = []
 
             for key in instance.keys():
-                if key not in UNITXT_DATASET_SCHEMA:
+                if key not in schema:
                     keys_to_delete.append(key)
 
             for key in keys_to_delete:
@@ -68,7 +81,8 @@ class ToUnitxtGroup(StreamInstanceOperatorValidator):
         assert isinstance(
             instance, dict
         ), f"Instance should be a dict, got {type(instance)}"
+        schema = get_unitxt_dataset_schema()
         assert all(
-            key in instance for key in UNITXT_DATASET_SCHEMA
-        ), f"Instance should have the following keys: {UNITXT_DATASET_SCHEMA}. Instance is: {instance}"
-        UNITXT_DATASET_SCHEMA.encode_example(instance)
+            key in instance for key in schema
+        ), f"Instance should have the following keys: {schema}. Instance is: {instance}"
+        schema.encode_example(instance)
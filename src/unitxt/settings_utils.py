@@ -1,14 +1,21 @@
+import importlib.util
 import os
 
-import pkg_resources
-
 from .version import version
 
 
+def is_true(value) -> bool:
+    """Whether a setting is on, for a bool or a string (e.g., from an environment variable) value."""
+    if isinstance(value, str):
+        return value.lower() in ("1", "true", "yes")
+    return bool(value)
+
+
 class Settings:
     _instance = None
     _settings = {}
     _logger = None
+    _listeners = {}
 
     @classmethod
     def is_uninitilized(cls):
@@ -20,7 +27,7 @@ class Settings:
         return cls._instance
 
     def __setattr__(self, key, value):
-        if key.endswith("_key") or key in {"_instance", "_settings"}:
+        if key.endswith("_key") or key in {"_instance", "_settings", "_listeners"}:
             raise AttributeError(f"Modifying '{key}' is not allowed.")
         if key in self._settings:
             if self._logger is not None:
@@ -28,6 +35,8 @@ class Settings:
                     f"unitxt.settings.{key} changed: {self._settings[key]} -> {value}"
                 )
         self._settings[key] = value
+        for listener in self._listeners.get(key, []):
+            listener()
 
     def __getattr__(self, key):
         if key.endswith("_key"):
@@ -44,6 +53,10 @@ class Settings:
 
         raise AttributeError(f"'{key}' not found")
 
+    def add_listener(self, key, listener):
+        """Call listener() whenever the setting key is set, e.g., to update a value derived from it."""
+        self._listeners.setdefault(key, []).append(listener)
+
     def environment_variable_key_name(self, key):
         return "UNITXT_" + key.upper()
 
@@ -90,17 +103,25 @@ if Settings.is_uninitilized():
     settings.artifactories = None
     settings.default_recipe = "standard_recipe"
     settings.default_verbosity = "debug"
+    settings.cache_dir = None
+    settings.telemetry = False
+    settings.telemetry_file = None
+    settings.dataset_cache = True
+    settings.dataset_cache_dir = None
+    settings.dataset_cache_max_size_gb = 50
 
 if Constants.is_uninitilized():
     constants = Constants()
     constants.dataset_file = os.path.join(os.path.dirname(__file__), "dataset.py")
     constants.metric_file = os.path.join(os.path.dirname(__file__), "metric.py")
     constants.local_catalog_path = os.path.join(os.path.dirname(__file__), "catalog")
-    try:
-        constants.default_catalog_path = pkg_resources.resource_filename(
-            "unitxt", "catalog"
+    # The catalog of the installed unitxt package (if any), found without importing it
+    unitxt_spec = importlib.util.find_spec("unitxt")
+    if unitxt_spec is not None and unitxt_spec.origin is not None:
+        constants.default_catalog_path = os.path.join(
+            os.path.dirname(unitxt_spec.origin), "catalog"
         )
-    except ModuleNotFoundError:
+    else:
         constants.default_catalog_path = constants.local_catalog_path
     constants.catalog_dir = constants.local_catalog_path
     constants.dataset_url = "unitxt/data"
@@ -111,12 +132,16 @@ if Constants.is_uninitilized():
     constants.non_registered_files = [
         "__init__.py",
         "artifact.py",
+        "artifact_types_manifest.py",
         "utils.py",
         "register.py",
         "metric.py",
         "dataset.py",
         "blocks.py",
     ]
+    constants.default_cache_dir = os.path.join(
+        os.path.expanduser("~"), ".cache", "unitxt"
+    )
     constants.codebase_url = "https://github.com/IBM/unitxt"
     constants.website_url = "https://www.unitxt.org"
 
@@ -35,6 +35,7 @@ class BaseRecipe(Recipe, SourceSequentialOperator):
     format: Format = Field(default_factory=SystemFormat)
 
     loader_limit: int = None
+    loader_sampling: str = None
 
     max_train_instances: int = None
     max_validation_instances: int = None
@@ -110,16 +111,22 @@ class BaseRecipe(Recipe, SourceSequentialOperator):
         self.test_refiner.apply_to_streams = ["test"]
         self.steps.append(self.test_refiner)
 
-    def prepare(self):
-        self.steps = [
-            self.card.loader,
-        ]
+    def prepare_loader(self):
+        self.steps.append(self.card.loader)
 
         if self.loader_limit:
             self.card.loader.loader_limit = self.loader_limit
             logger.info(f"Loader line limit was set to  {self.loader_limit}")
             self.steps.append(StreamRefiner(max_instances=self.loader_limit))
 
+        if self.loader_sampling:
+            self.card.loader.loader_sampling = self.loader_sampling
+            self.card.loader.verify()
+
+    def prepare(self):
+        self.steps = []
+        self.prepare_loader()
+
         if self.card.preprocess_steps is not None:
             self.steps.extend(self.card.preprocess_steps)
 
@@ -213,6 +220,7 @@ class StandardRecipe(StandardRecipeWithIndexes):
         template (Template, optional): Template object to be used for the recipe.
         system_prompt (SystemPrompt, optional): SystemPrompt object to be used for the recipe.
         loader_limit (int, optional): Specifies the maximum number of instances per stream to be returned from the loader (used to reduce loading time in large datasets)
+        loader_sampling (str, optional): How the loader chooses the loader_limit instances of every stream: "head" (the first ones), "random" or "stratified" (see Loader.loader_sampling).
         format (SystemFormat, optional): SystemFormat object to be used for the recipe.
         train_refiner (StreamRefiner, optional): Train refiner to be used in the recipe.
         max_train_instances (int, optional): Maximum training instances for the refiner.
@@ -1,11 +1,12 @@
 import tempfile
-from typing import Dict, Iterable
-
-from datasets import Dataset, DatasetDict, IterableDataset, IterableDatasetDict
+from typing import TYPE_CHECKING, Dict, Iterable
 
 from .dataclass import Dataclass, OptionalField
 from .generator_utils import CopyingReusableGenerator, ReusableGenerator
 
+if TYPE_CHECKING:
+    from datasets import DatasetDict, IterableDatasetDict
+
 
 class Stream(Dataclass):
     """A class for handling streaming data in a customizable way.
@@ -30,6 +31,8 @@ class Stream(Dataclass):
             function: The correct initiator function.
         """
         if self.caching:
+            from datasets import Dataset
+
             return Dataset.from_generator
 
         if self.copying:
@@ -100,7 +103,9 @@ class MultiStream(dict):
         for stream in self.values():
             stream.copying = copying
 
-    def to_dataset(self, disable_cache=True, cache_dir=None) -> DatasetDict:
+    def to_dataset(self, disable_cache=True, cache_dir=None) -> "DatasetDict":
+        from datasets import Dataset, DatasetDict
+
         with tempfile.TemporaryDirectory() as dir_to_be_deleted:
             cache_dir = dir_to_be_deleted if disable_cache else cache_dir
             return DatasetDict(
@@ -115,7 +120,9 @@ class MultiStream(dict):
                 }
             )
 
-    def to_iterable_dataset(self) -> IterableDatasetDict:
+    def to_iterable_dataset(self) -> "IterableDatasetDict":
+        from datasets import IterableDataset, IterableDatasetDict
+
         return IterableDatasetDict(
             {
                 key: IterableDataset.from_generator(
@@ -0,0 +1,457 @@
+"""Runtime counters and histograms of unitxt pipelines and metrics.
+
+Telemetry is disabled by default, and then recording costs a single check of a
+module level flag, which follows the telemetry setting. Enable it with ``unitxt.settings.telemetry = True``, the environment
+variable ``UNITXT_TELEMETRY=True``, or ``enable_telemetry()``.
+
+When enabled, unitxt records:
+
+* unitxt_operator_instances_total / unitxt_operator_seconds_total: instances produced
+  by every stream operator, per split, and the time spent in the operator itself
+  (excluding the operators upstream of it).
+* unitxt_loader_rows_total / unitxt_loader_bytes_total: rows produced by loaders and
+  bytes of the files they read.
+* unitxt_cache_requests_total: hits and misses of the artifact caches and the loader caches.
+* unitxt_metric_compute_seconds: the time of the compute calls of every metric.
+* unitxt_metric_bootstrap_seconds / unitxt_metric_bootstrap_resamples_total: the
+  confidence interval computations of every metric.
+
+The values can be exported with ``write_prometheus`` (in the Prometheus text format,
+e.g. for the textfile collector of the node exporter) or ``write_json``. When
+``unitxt.settings.telemetry_file`` (env: UNITXT_TELEMETRY_FILE) is set, the values are
+written to that file when the process exits, as json if the file name ends with
+".json" and in the Prometheus text format otherwise.
+"""
+import atexit
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .settings_utils import get_settings, is_true
+
+settings = get_settings()
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    60.0,
+)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+        + "}"
+    )
+
+
+class Counter:
+    """A value per combination of label values, that only goes up."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def set(self, value: float, **labels):
+        """Set the value, for counters that mirror a count kept elsewhere (e.g. by a cache)."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [
+            {"labels": labels, "value": value} for _, labels, value in self.samples()
+        ]
+
+
+class Gauge(Counter):
+    """A value per combination of label values, that can go up and down (e.g. a cache size)."""
+
+    type = "gauge"
+
+
+class Histogram(Counter):
+    """Counts of observed values in buckets, with their sum and count, per combination of label values."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def get(self, **labels) -> Dict[str, float]:
+        state = self._values.get(self._key(labels))
+        if state is None:
+            return {"count": 0, "sum": 0.0}
+        return {"count": state[2], "sum": state[1]}
+
+    def samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            values = [
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self._values.items()
+            ]
+        for key, (counts, total, count) in values:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield self.name + "_bucket", {**labels, "le": repr(bound)}, cumulative
+            yield self.name + "_bucket", {**labels, "le": "+Inf"}, count
+            yield self.name + "_sum", labels, total
+            yield self.name + "_count", labels, count
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            {
+                "labels": dict(zip(self.labelnames, key)),
+                "count": count,
+                "sum": total,
+                "buckets": dict(zip(map(repr, self.buckets), counts)),
+            }
+            for key, (counts, total, count) in values
+        ]
+
+
+class TelemetryRegistry:
+    """Holds the counters, gauges and histograms, and exports them."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Counter] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, help, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError(
+                    f"Telemetry metric '{name}' is already registered as a {metric.type}"
+                )
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Counter:
+        return self._metrics[name]
+
+    def add_collector(self, collector: Callable[[], None]):
+        """Add a function that updates gauges, called before every export."""
+        self._collectors.append(collector)
+
+    def collect(self) -> List[Counter]:
+        for collector in self._collectors:
+            collector()
+        with self._lock:
+            return sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+    def reset(self):
+        for metric in self.collect():
+            metric.reset()
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            metric.name: {
+                "type": metric.type,
+                "help": metric.help,
+                "values": metric.snapshot(),
+            }
+            for metric in self.collect()
+        }
+
+    def write_prometheus(self, path: str):
+        """Write the Prometheus text format to path, replacing it atomically (as the textfile collector expects)."""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+    def write_json(self, path: str):
+        from .http_utils import atomic_write_json
+
+        atomic_write_json(path, {"time": time.time(), "metrics": self.snapshot()})
+
+
+registry = TelemetryRegistry()
+
+
+_enabled = False
+
+
+def _update_enabled():
+    global _enabled
+    _enabled = is_true(settings.telemetry)
+
+
+_update_enabled()
+# the flag follows changes of the setting after import
+settings.add_listener("telemetry", _update_enabled)
+
+
+def is_telemetry_enabled() -> bool:
+    return _enabled
+
+
+def enable_telemetry():
+    settings.telemetry = True
+
+
+def disable_telemetry():
+    settings.telemetry = False
+
+
+def to_prometheus() -> str:
+    return registry.to_prometheus()
+
+
+def snapshot() -> Dict[str, Any]:
+    return registry.snapshot()
+
+
+def write_prometheus(path: str):
+    registry.write_prometheus(path)
+
+
+def write_json(path: str):
+    registry.write_json(path)
+
+
+def reset():
+    registry.reset()
+
+
+operator_instances = registry.counter(
+    "unitxt_operator_instances_total",
+    "Instances produced by stream operators.",
+    ["operator", "split"],
+)
+operator_seconds = registry.counter(
+    "unitxt_operator_seconds_total",
+    "Seconds spent in stream operators, excluding the operators upstream of them.",
+    ["operator", "split"],
+)
+loader_rows = registry.counter(
+    "unitxt_loader_rows_total", "Rows produced by loaders.", ["loader", "split"]
+)
+loader_seconds = registry.counter(
+    "unitxt_loader_seconds_total",
+    "Seconds spent in loaders producing rows.",
+    ["loader", "split"],
+)
+loader_bytes = registry.counter(
+    "unitxt_loader_bytes_total", "Bytes of the files read by loaders.", ["loader"]
+)
+cache_requests = registry.counter(
+    "unitxt_cache_requests_total",
+    "Hits and misses of unitxt caches.",
+    ["cache", "result"],
+)
+metric_compute_seconds = registry.histogram(
+    "unitxt_metric_compute_seconds",
+    "Seconds of metric compute calls.",
+    ["metric"],
+)
+metric_bootstrap_seconds = registry.histogram(
+    "unitxt_metric_bootstrap_seconds",
+    "Seconds of metric confidence interval computations.",
+    ["metric"],
+)
+metric_bootstrap_resamples = registry.counter(
+    "unitxt_metric_bootstrap_resamples_total",
+    "Bootstrap resamples drawn for metric confidence intervals.",
+    ["metric"],
+)
+
+
+def record_cache(cache: str, hit: bool):
+    if _enabled:
+        cache_requests.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_loader_bytes(loader: str, size: int):
+    if _enabled:
+        loader_bytes.inc(size, loader=loader)
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+def timer(histogram: Histogram, **labels):
+    """A context manager that observes its duration in histogram, when telemetry is enabled."""
+    if _enabled:
+        return _Timer(histogram, labels)
+    return _null_timer
+
+
+_local = threading.local()
+
+
+def _child_times() -> List[float]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def instrumented_stream(
+    generator: Callable,
+    gen_kwargs: Dict[str, Any],
+    instances_counter: str,
+    seconds_counter: Optional[str],
+    labels: Dict[str, Any],
+):
+    """Run generator(**gen_kwargs), counting the instances it yields and the time spent in it.
+
+    The time spent in instrumented streams that the generator reads from is not
+    counted, so every operator is charged only for its own work, even when the
+    operators of a pipeline interleave. The counters are given by name, so the
+    arguments of the stream can be pickled when it is cached.
+    """
+    stack = _child_times()
+    iterator = iter(generator(**gen_kwargs))
+    count = 0
+    own_time = 0.0
+    try:
+        while True:
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                instance = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed = time.perf_counter() - start
+                children = stack.pop()
+                own_time += elapsed - children
+                if stack:
+                    stack[-1] += elapsed
+            count += 1
+            yield instance
+    finally:
+        registry.get(instances_counter).inc(count, **labels)
+        if seconds_counter is not None:
+            registry.get(seconds_counter).inc(own_time, **labels)
+
+
+def _write_at_exit():
+    path = getattr(settings, "telemetry_file", None)
+    if not path or not _enabled:
+        return
+    if path.endswith(".json"):
+        registry.write_json(path)
+    else:
+        registry.write_prometheus(path)
+
+
+atexit.register(_write_at_exit)
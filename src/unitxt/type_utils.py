@@ -4,16 +4,21 @@ import itertools
 import typing
 
 
-def isoftype(object, type):
+def isoftype(object, type, sample_size: typing.Optional[int] = None):
     """Checks if an object is of a certain typing type, including nested types.
 
     This function supports simple types (like `int`, `str`), typing types
     (like `List[int]`, `Tuple[str, int]`, `Dict[str, int]`), and nested typing
     types (like `List[List[int]]`, `Tuple[List[str], int]`, `Dict[str, List[int]]`).
 
+    The typing type is compiled once into a checker function, which is cached
+    per type (see `get_type_checker`).
+
     Args:
         object: The object to check.
         type: The typing type to check against.
+        sample_size (int, optional): If set, only the first `sample_size` elements of
+            each list, set and dict are checked. Useful for large containers in hot paths.
 
     Returns:
         bool: True if the object is of the specified type, False otherwise.
@@ -27,35 +32,118 @@ def isoftype(object, type):
         isoftype([1, 2, 3], typing.List[str]) # False
         isoftype([[1, 2], [3, 4]], typing.List[typing.List[int]]) # True
     """
-    if type == typing.Any:
+    return get_type_checker(type, sample_size)(object)
+
+
+_type_checkers = {}
+
+
+def get_type_checker(type, sample_size: typing.Optional[int] = None):
+    """Returns a function that checks if an object is of the given typing type.
+
+    Checkers are cached per (type, sample_size), so the typing type is analyzed
+    only the first time it is checked against.
+    """
+    key = (type, sample_size)
+    try:
+        return _type_checkers[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable type annotation
+        return _compile_type_checker(type, sample_size)
+
+    checker = _compile_type_checker(type, sample_size)
+    _type_checkers[key] = checker
+    return checker
+
+
+def _is_any(object):
+    return True
+
+
+def _sample(elements, sample_size):
+    if sample_size is None:
+        return elements
+    return itertools.islice(elements, sample_size)
+
+
+def _compile_elements_checker(origin, element_type, sample_size):
+    element_checker = get_type_checker(element_type, sample_size)
+    if element_checker is _is_any:
+        return lambda object: isinstance(object, origin)
+
+    def check_elements(object):
+        if not isinstance(object, origin):
+            return False
+        for element in _sample(object, sample_size):
+            if not element_checker(element):
+                return False
         return True
 
-    if hasattr(type, "__origin__"):
-        origin = type.__origin__
-        type_args = typing.get_args(type)
+    return check_elements
+
 
-        if origin is typing.Union:
-            return any(isoftype(object, sub_type) for sub_type in type_args)
+def _compile_items_checker(origin, key_type, value_type, sample_size):
+    key_checker = get_type_checker(key_type, sample_size)
+    value_checker = get_type_checker(value_type, sample_size)
+    if key_checker is _is_any and value_checker is _is_any:
+        return lambda object: isinstance(object, origin)
 
+    def check_items(object):
         if not isinstance(object, origin):
             return False
+        for key, value in _sample(object.items(), sample_size):
+            if not (key_checker(key) and value_checker(value)):
+                return False
+        return True
 
-        if origin is list or origin is set:
-            return all(isoftype(element, type_args[0]) for element in object)
+    return check_items
 
-        if origin is dict:
-            return all(
-                isoftype(key, type_args[0]) and isoftype(value, type_args[1])
-                for key, value in object.items()
-            )
-        if origin is tuple:
-            return all(
-                isoftype(element, type_arg)
-                for element, type_arg in zip(object, type_args)
-            )
-        return None
 
-    return isinstance(object, type)
+def _compile_tuple_checker(origin, elements_types, sample_size):
+    checkers = [get_type_checker(type, sample_size) for type in elements_types]
+
+    def check_tuple(object):
+        if not isinstance(object, origin):
+            return False
+        for element, checker in zip(object, checkers):
+            if not checker(element):
+                return False
+        return True
+
+    return check_tuple
+
+
+def _compile_type_checker(type, sample_size):
+    if type == typing.Any:
+        return _is_any
+
+    if not hasattr(type, "__origin__"):
+        return lambda object: isinstance(object, type)
+
+    origin = type.__origin__
+    type_args = typing.get_args(type)
+
+    if origin is typing.Union:
+        checkers = [get_type_checker(sub_type, sample_size) for sub_type in type_args]
+        return lambda object: any(checker(object) for checker in checkers)
+
+    if len(type_args) == 0 and origin in (list, set, dict, tuple):
+        return lambda object: isinstance(object, origin)
+
+    if origin is list or origin is set:
+        return _compile_elements_checker(origin, type_args[0], sample_size)
+
+    if origin is dict:
+        return _compile_items_checker(origin, type_args[0], type_args[1], sample_size)
+
+    if origin is tuple:
+        if len(type_args) == 2 and type_args[1] is Ellipsis:
+            return _compile_elements_checker(origin, type_args[0], sample_size)
+        return _compile_tuple_checker(origin, type_args, sample_size)
+
+    # other generic types (e.g. Callable[..], Sequence[..]) are only checked for their origin
+    return lambda object: None if isinstance(object, origin) else False
 
 
 # copied from: https://github.com/bojiang/typing_utils/blob/main/typing_utils/__init__.py
@@ -443,6 +531,9 @@ def _is_normal_subtype(
     return False
 
 
+_issubtype_cache = {}
+
+
 def issubtype(
     left: Type,
     right: Type,
@@ -452,6 +543,7 @@ def issubtype(
 
     For unions, check if the type arguments of the left is a subset of the right.
     Also works for nested types including ForwardRefs.
+    Results are memoized per (left, right) pair when no forward_refs are given.
 
     Examples:
         Here are some code examples using `issubtype` from the `typing_utils` module:
@@ -480,7 +572,20 @@ def issubtype(
             issubtype(typing.Dict[str, str], JSON, forward_refs={'JSON': JSON})  # True
             issubtype(typing.Dict[str, bytes], JSON, forward_refs={'JSON': JSON})  # False
     """
-    return _is_normal_subtype(normalize(left), normalize(right), forward_refs)
+    if forward_refs is not None:
+        return _is_normal_subtype(normalize(left), normalize(right), forward_refs)
+
+    key = (left, right)
+    try:
+        return _issubtype_cache[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable types
+        return _is_normal_subtype(normalize(left), normalize(right), forward_refs)
+
+    result = _is_normal_subtype(normalize(left), normalize(right), forward_refs)
+    _issubtype_cache[key] = result
+    return result
 
 
 def to_float_or_default(v, failure_default=0):
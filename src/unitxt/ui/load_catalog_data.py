@@ -1,6 +1,7 @@
 import os
+from collections.abc import Mapping
 
-from ..file_utils import get_all_files_in_dir
+from ..catalog_index import get_catalog_index, query_entries, templates_of
 from ..utils import load_json
 from .settings import AUGMENTABLE_STR, CATALOG_DIR
 
@@ -29,73 +30,49 @@ def safe_load_json(file):
     return json
 
 
-def get_templates(template_data):
-    def get_from_str(template_str):
-        if template_data.endswith(".all"):
-            template_file = get_file_from_item_name(template_str)
-            return set(load_json(template_file)["items"])
-        return {template_str}
-
-    if isinstance(template_data, str):
-        templates = get_from_str(template_data)
-    else:
-        templates = set()
-        for item in template_data:
-            if isinstance(item, str):
-                templates.update(get_from_str(item))
-    # templates.add("templates.key_val_with_new_lines")
-    templates_jsons = {
-        template: safe_load_json(get_file_from_item_name(template))
-        for template in templates
-    }
-    return templates, templates_jsons
+class CatalogJsons(Mapping):
+    """The jsons of catalog items by name. A json is read only when it is accessed."""
 
+    def __init__(self, names):
+        self.names = set(names)
+
+    def __getitem__(self, name):
+        if name not in self.names:
+            raise KeyError(name)
+        return safe_load_json(get_file_from_item_name(name))
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+def get_index_entries():
+    """Return the catalog index entries, where private items take precedence over unitxt items."""
+    entries = {}
+    for dir in [PRIVATE_DIR, UNITXT_DIR]:
+        if dir:
+            for name, entry in get_catalog_index(dir).entries.items():
+                entries.setdefault(name, entry)
+    return entries
 
-def load_cards_data():
-    def is_valid_data(data):
-        for item in ["task", "templates"]:
-            if isinstance(data[item], dict):
-                return False
-        return True
 
+def load_cards_data():
+    entries = get_index_entries()
     cards_data = {}
-    json_data = {}
-    unitxt_card_jsons = get_catalog_items_from_dir("cards", UNITXT_DIR)
-    private_card_jsons = {}
-    if PRIVATE_DIR:
-        private_card_jsons = get_catalog_items_from_dir("cards", PRIVATE_DIR)
-    card_jsons = private_card_jsons
-    for card in unitxt_card_jsons:
-        if card not in card_jsons:
-            card_jsons[card] = unitxt_card_jsons[card]
-
-    cards = card_jsons.keys()
-    json_data.update(card_jsons)
-    for card in cards:
-        data = card_jsons[card]
-        if not is_valid_data(data):
+    for card in query_entries(entries, prefix="cards."):
+        entry = entries[card]
+        if "task" not in entry or "templates" not in entry:
             continue
-        task = data["task"].split("[")[0]
-        if task not in cards_data:
-            is_augmentable = check_augmentable(task)
-        else:
-            is_augmentable = cards_data[task][AUGMENTABLE_STR]
-        templates, templates_jsons = get_templates(data["templates"])
-        json_data.update(templates_jsons)
+        task = entry["task"]
+        is_augmentable = entries.get(task, {}).get("augmentable", False)
         cards_data.setdefault(task, {}).update(
-            {card: templates, AUGMENTABLE_STR: is_augmentable}
+            {card: templates_of(entries, card), AUGMENTABLE_STR: is_augmentable}
         )
-    formats, formats_jsons = get_catalog_items("formats")
-    json_data.update(formats_jsons)
-    system_prompts, system_prompts_jsons = get_catalog_items("system_prompts")
-    json_data.update(system_prompts_jsons)
-    return cards_data, json_data, formats, system_prompts
-
-
-def check_augmentable(task_name):
-    task_file = get_file_from_item_name(task_name)
-    task_data = load_json(task_file)
-    return AUGMENTABLE_STR in task_data
+    formats = query_entries(entries, prefix="formats.")
+    system_prompts = query_entries(entries, prefix="system_prompts.")
+    return cards_data, CatalogJsons(entries), formats, system_prompts
 
 
 def get_file_from_item_name(item_name):
@@ -112,32 +89,9 @@ def get_file_from_item_name(item_name):
     return os.path.join(CATALOG_DIR, item_name.replace(".", os.sep) + ".json")
 
 
-def get_catalog_items_from_dir(items_type, dir):
-    jsons = {}
-    items_dir = os.path.join(dir, items_type)
-    files = get_all_files_in_dir(items_dir, recursive=True)
-    for file in files:
-        if "DS_Store" in file:
-            continue
-        key = file.split(os.sep)
-        start_index = key.index(items_type)
-        key = key[start_index:]
-        key = ".".join(key).replace(".json", "")
-        jsons[key] = safe_load_json(file)
-    return jsons
-
-
 def get_catalog_items(items_type):
-    unitxt_items_to_jsons = get_catalog_items_from_dir(items_type, UNITXT_DIR)
-    if not PRIVATE_DIR:
-        items_to_jsons = unitxt_items_to_jsons
-    else:
-        items_to_jsons = get_catalog_items_from_dir(items_type, PRIVATE_DIR)
-        for item in unitxt_items_to_jsons:
-            if item not in items_to_jsons:
-                items_to_jsons[item] = unitxt_items_to_jsons[item]
-    items = items_to_jsons.keys()
-    return sorted(items), items_to_jsons
+    items = query_entries(get_index_entries(), prefix=items_type + ".")
+    return items, CatalogJsons(items)
 
 
 if __name__ == "__main__":
@@ -151,7 +105,7 @@ if __name__ == "__main__":
     for bla in stuff:
         with open(f"{bla}.txt", "w") as file:
             bla = stuff[bla]
-            if isinstance(bla, dict):
+            if isinstance(bla, Mapping):
                 for key, value in bla.items():
                     file.write(f"{key}: {value}\n\n")
             else:
@@ -1,8 +1,6 @@
 import json
 from typing import Any, Dict
 
-import pkg_resources
-
 
 class Singleton(type):
     _instances = {}
@@ -55,10 +53,12 @@ def is_package_installed(package_name):
     Returns:
     - bool: True if the package is installed, False otherwise.
     """
+    import importlib.metadata
+
     try:
-        pkg_resources.get_distribution(package_name)
+        importlib.metadata.distribution(package_name)
         return True
-    except pkg_resources.DistributionNotFound:
+    except importlib.metadata.PackageNotFoundError:
         return False
 
 
@@ -0,0 +1,167 @@
+import importlib
+import multiprocessing
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .logging_utils import get_logger
+
+logger = get_logger()
+
+DEFAULT_WARM_MODULES = [
+    "datasets",
+    "unitxt.api",
+    "unitxt.blocks",
+    "unitxt.metrics",
+    "unitxt.standard",
+]
+
+
+def warm_up(
+    artifacts: Iterable[str] = (),
+    metrics: Iterable[str] = (),
+    modules: Iterable[str] = DEFAULT_WARM_MODULES,
+):
+    """Bring the current process to the state unitxt jobs need, so it does not have to be paid per job.
+
+    Imports the given modules, registers the catalogs, and fetches the given artifacts
+    and metrics into the caches used when recipes and metrics are run. Fetching a
+    metric runs its ``prepare``, which loads the models of model based metrics.
+
+    Args:
+        artifacts (Iterable[str]): Names of catalog artifacts to fetch (e.g. cards and templates).
+        metrics (Iterable[str]): Names of metrics to fetch.
+        modules (Iterable[str]): Modules to import. Names starting with "unitxt." refer to this package.
+    """
+    for module in modules:
+        if module.startswith("unitxt."):
+            module = __package__ + module[len("unitxt") :]
+        importlib.import_module(module)
+
+    from .artifact import fetch_artifact
+    from .operators import ArtifactFetcherMixin
+    from .register import _reset_env_local_catalogs, register_all_artifacts
+
+    _reset_env_local_catalogs()
+    register_all_artifacts()
+    for name in artifacts:
+        fetch_artifact(name)
+    for name in metrics:
+        ArtifactFetcherMixin.get_artifact(name)
+
+
+def run_recipe(query: str, splits: Optional[Sequence[str]] = None):
+    """Run the recipe of a dataset query (as given to ``load_dataset``) and return its instances by split."""
+    from .dataset_utils import get_dataset_artifact
+
+    multi_stream = get_dataset_artifact(query.replace("sys_prompt", "instruction"))()
+    return {
+        split: list(stream)
+        for split, stream in multi_stream.items()
+        if splits is None or split in splits
+    }
+
+
+def run_evaluate(predictions: List[str], data: Iterable[Dict[str, Any]]):
+    """Same as ``unitxt.api.evaluate``."""
+    from .metric_utils import _compute
+
+    return _compute(predictions=predictions, references=data)
+
+
+class WarmWorkerPool:
+    """A pool of worker processes forked from a parent that was warmed up once.
+
+    Before the workers start, the parent process runs ``warm_up``: heavy modules are
+    imported, catalogs are registered, and the given artifacts and metrics (with
+    their models) are loaded. The workers are then forked, so they inherit this state
+    copy-on-write instead of paying for it in every job. Jobs are recipe queries
+    (``load_dataset``), ``evaluate`` calls, or any picklable function.
+
+    Requires the "fork" start method (Linux and macOS).
+
+    Args:
+        processes (int, optional): Number of workers. Defaults to the number of cpus.
+        artifacts (Iterable[str]): Catalog artifacts to fetch in the parent.
+        metrics (Iterable[str]): Metrics to fetch (and whose models to load) in the parent.
+        modules (Iterable[str]): Modules to import in the parent.
+        maxtasksperchild (int, optional): Number of jobs after which a worker is replaced by a fresh fork of the parent.
+
+    Example:
+        with WarmWorkerPool(processes=4, metrics=["metrics.accuracy"]) as pool:
+            results = pool.map_evaluate([(predictions, data), ...])
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        artifacts: Iterable[str] = (),
+        metrics: Iterable[str] = (),
+        modules: Iterable[str] = DEFAULT_WARM_MODULES,
+        maxtasksperchild: Optional[int] = None,
+    ):
+        self.processes = processes or os.cpu_count() or 1
+        self.artifacts = list(artifacts)
+        self.metrics = list(metrics)
+        self.modules = list(modules)
+        self.maxtasksperchild = maxtasksperchild
+        self._pool = None
+
+    def start(self):
+        if self._pool is not None:
+            return
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError(
+                "WarmWorkerPool requires the 'fork' start method, which is not available on this platform."
+            )
+        warm_up(artifacts=self.artifacts, metrics=self.metrics, modules=self.modules)
+        self._pool = multiprocessing.get_context("fork").Pool(
+            self.processes, maxtasksperchild=self.maxtasksperchild
+        )
+        logger.info(f"Started a warm pool of {self.processes} workers")
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, function: Callable, *args, **kwargs):
+        """Run function(*args, **kwargs) in a worker, and return a ``multiprocessing.pool.AsyncResult``."""
+        self.start()
+        return self._pool.apply_async(function, args, kwargs)
+
+    def load_dataset(self, query: str, splits: Optional[Sequence[str]] = None):
+        return self.submit(run_recipe, query, splits).get()
+
+    def evaluate(self, predictions: List[str], data: Iterable[Dict[str, Any]]):
+        return self.submit(run_evaluate, predictions, list(data)).get()
+
+    def map_load_dataset(
+        self, queries: Iterable[str], splits: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """Run the recipes of many queries concurrently, and return their instances in the order of the queries."""
+        results = [self.submit(run_recipe, query, splits) for query in queries]
+        return [result.get() for result in results]
+
+    def map_evaluate(
+        self, jobs: Iterable[Tuple[List[str], Iterable[Dict[str, Any]]]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Run many (predictions, data) evaluations concurrently, and return their results in order."""
+        results = [
+            self.submit(run_evaluate, predictions, list(data))
+            for predictions, data in jobs
+        ]
+        return [result.get() for result in results]
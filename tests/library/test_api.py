@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from src.unitxt.api import evaluate, load_dataset
 from tests.utils import UnitxtTestCase
 
@@ -26,3 +29,14 @@ class TestAPI(UnitxtTestCase):
         predictions = ["2.5", "2.5", "2.2", "3", "4"]
         results = evaluate(predictions, dataset["train"])
         self.assertAlmostEqual(results[0]["score"]["global"]["score"], 0.026, 3)
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        code = (
+            "import sys, src.unitxt.api;"
+            "print(','.join(m for m in ['datasets', 'evaluate', 'pandas', 'numpy', "
+            "'scipy', 'requests', 'pkg_resources'] if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "")
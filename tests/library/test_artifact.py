@@ -6,6 +6,7 @@ from src.unitxt.catalog import add_to_catalog, get_from_catalog
 from src.unitxt.dataclass import UnexpectedArgumentError
 from src.unitxt.logging_utils import get_logger
 from src.unitxt.operator import SequentialOperator
+from src.unitxt.operators import MapInstanceValues
 from src.unitxt.processors import StringOrNotString
 from src.unitxt.test_utils.catalog import temp_catalog
 from tests.utils import UnitxtTestCase
@@ -70,3 +71,29 @@ class TestArtifact(UnitxtTestCase):
         )
         artifact, _ = fetch_artifact(artifact_identifier)
         self.assertEqual(artifact.metrics, ["metrics.rouge", "metrics.accuracy"])
+
+    def test_constructor_arguments_are_not_copied(self):
+        mapping = {str(i): i for i in range(1000)}
+        operator = MapInstanceValues(mappers={"a": mapping})
+        self.assertIs(operator._init_dict["mappers"]["a"], mapping)
+        self.assertDictEqual(
+            operator.to_dict(),
+            {"type": "map_instance_values", "mappers": {"a": mapping}},
+        )
+        self.assertIsNot(operator.to_dict()["mappers"]["a"], mapping)
+
+    def test_recovered_artifacts_are_serialized_by_name(self):
+        with temp_catalog() as catalog_path:
+            add_to_catalog(
+                StringOrNotString(string="yes", field="a_field"),
+                "test3.processor",
+                catalog_path=catalog_path,
+            )
+            steps = ["test3.processor"]
+            operator = SequentialOperator(steps=steps)
+            self.assertIsInstance(operator.steps[0], StringOrNotString)
+            self.assertEqual(steps, ["test3.processor"])
+            self.assertDictEqual(
+                operator.to_dict(),
+                {"type": "sequential_operator", "steps": ["test3.processor"]},
+            )
@@ -1,4 +1,6 @@
-from src.unitxt.artifact import Artifact
+from src.unitxt.artifact import Artifact, UnrecognizedArtifactTypeError
+from src.unitxt.artifact_types_manifest import ARTIFACT_TYPES_MODULES
+from src.unitxt.register import generate_artifact_types_manifest
 from tests.utils import UnitxtTestCase
 
 
@@ -9,3 +11,15 @@ class TestArtifactRegistration(UnitxtTestCase):
 
         assert Artifact.is_registered_type("dummy_should_be_registered")
         assert Artifact.is_registered_class(DummyShouldBeRegistered)
+
+    def test_artifact_types_manifest_is_up_to_date(self):
+        self.assertDictEqual(
+            ARTIFACT_TYPES_MODULES,
+            generate_artifact_types_manifest(),
+            "The artifact types manifest is outdated, run 'make artifacts-manifest'.",
+        )
+
+    def test_unrecognized_type_suggestion(self):
+        with self.assertRaises(UnrecognizedArtifactTypeError) as e:
+            Artifact.from_dict({"type": "add_feilds"})
+        self.assertIn("Did you mean 'add_fields'?", str(e.exception))
@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+
+from tests.utils import UnitxtTestCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# runs a metric case and then its bootstrap case, and prints their global scores
+SCRIPT = """
+import json
+from benchmarks.cases import CASES
+
+scores = {}
+for name in ["metrics/instance", "metrics/instance/bootstrap",
+             "metrics/global", "metrics/global/bootstrap"]:
+    run, _ = CASES[name](50)
+    scores[name] = run()[0]["score"]["global"]
+print(json.dumps(scores))
+"""
+
+
+class TestBenchmarks(UnitxtTestCase):
+    def test_bootstrap_case_computes_confidence_intervals(self):
+        # the benchmarks import unitxt, so they run in their own process instead of
+        # next to the src.unitxt of the tests
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join([os.path.join(ROOT, "src"), ROOT]),
+            "UNITXT_DEFAULT_VERBOSITY": "error",
+        }
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        scores = json.loads(output.strip().splitlines()[-1])
+        for kind in ["instance", "global"]:
+            self.assertNotIn("score_ci_low", scores[f"metrics/{kind}"])
+            # the case without bootstrap does not disable it for the next case
+            self.assertIn("score_ci_low", scores[f"metrics/{kind}/bootstrap"])
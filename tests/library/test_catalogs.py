@@ -1,10 +1,20 @@
+import functools
+import hashlib
+import http.server
 import json
 import os
 import tempfile
+import threading
+from contextlib import contextmanager
+
+import requests
 
 from src import unitxt
 from src.unitxt import add_to_catalog
 from src.unitxt.artifact import Artifact, Artifactories
+from src.unitxt.catalog import GithubCatalog, ls, query_catalog
+from src.unitxt.catalog_index import CatalogIndex, get_catalog_index
+from src.unitxt.operators import AddFields
 from src.unitxt.register import (
     _reset_env_local_catalogs,
     register_local_catalog,
@@ -51,3 +61,217 @@ class TestCatalogs(UnitxtTestCase):
                 content = json.load(f)
 
             self.assertDictEqual(content, {"type": "class_to_save", "t": 1})
+
+
+def write_catalog_files(catalog_dir, artifacts):
+    for name, data in artifacts.items():
+        path = os.path.join(catalog_dir, *name.split(".")) + ".json"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+
+class TestCatalogIndex(UnitxtTestCase):
+    artifacts = {
+        "tasks.qa": {"type": "form_task", "metrics": ["metrics.rouge"]},
+        "templates.qa.simple": {"type": "input_output_template"},
+        "templates.qa.all": {
+            "type": "templates_list",
+            "items": ["templates.qa.simple"],
+        },
+        "cards.first": {
+            "type": "task_card",
+            "task": "tasks.qa",
+            "templates": "templates.qa.all",
+        },
+        "cards.second": {
+            "type": "task_card",
+            "task": {"type": "form_task", "metrics": ["metrics.accuracy[n=2]"]},
+            "templates": ["templates.qa.other"],
+        },
+    }
+
+    def test_query(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_catalog_files(tmp_dir, self.artifacts)
+            index = CatalogIndex(tmp_dir)
+
+            self.assertListEqual(
+                index.query(type="task_card"), ["cards.first", "cards.second"]
+            )
+            self.assertListEqual(index.query(task="tasks.qa"), ["cards.first"])
+            self.assertListEqual(
+                index.query(metric="metrics.rouge"), ["cards.first", "tasks.qa"]
+            )
+            self.assertListEqual(
+                index.query(metric="metrics.accuracy"), ["cards.second"]
+            )
+            self.assertListEqual(
+                index.query(template="templates.qa.simple"), ["cards.first"]
+            )
+            self.assertListEqual(
+                index.query(references="templates.qa.all"), ["cards.first"]
+            )
+            self.assertListEqual(
+                index.names(prefix="templates."),
+                ["templates.qa.all", "templates.qa.simple"],
+            )
+            self.assertDictEqual(
+                index.summary(), {"cards": 2, "tasks": 1, "templates": 2}
+            )
+
+    def test_index_is_persisted_and_refreshed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_catalog_files(tmp_dir, self.artifacts)
+            entries = CatalogIndex(tmp_dir).entries
+            self.assertTrue(os.path.isfile(CatalogIndex(tmp_dir).path))
+            self.assertDictEqual(CatalogIndex(tmp_dir).entries, entries)
+
+            write_catalog_files(tmp_dir, {"tasks.qa": {"type": "other_task"}})
+            os.remove(os.path.join(tmp_dir, "cards", "second.json"))
+            index = CatalogIndex(tmp_dir)
+            self.assertEqual(index.entries["tasks.qa"]["type"], "other_task")
+            self.assertNotIn("cards.second", index.entries)
+            self.assertListEqual(index.query(metric="metrics.rouge"), [])
+
+    def test_add_to_catalog_updates_index(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index = get_catalog_index(tmp_dir)
+            self.assertListEqual(index.names(), [])
+            add_to_catalog(
+                AddFields(fields={"a": "b"}),
+                "operators.add_a",
+                catalog_path=tmp_dir,
+                verbose=False,
+            )
+            self.assertListEqual(index.names(), ["operators.add_a"])
+            self.assertListEqual(CatalogIndex(tmp_dir).names(), ["operators.add_a"])
+
+            register_local_catalog(tmp_dir)
+            try:
+                self.assertIn("operators.add_a", ls())
+                self.assertListEqual(
+                    query_catalog(type="add_fields", prefix="operators.add_"),
+                    ["operators.add_a"],
+                )
+            finally:
+                unregister_local_catalog(tmp_dir)
+
+
+class CatalogRequestHandler(http.server.SimpleHTTPRequestHandler):
+    requests_log = []
+    # the number of the next requests answered with 503
+    failures = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):  # noqa: N802
+        self.requests_log.append((self.command, self.path))
+        if CatalogRequestHandler.failures > 0:
+            CatalogRequestHandler.failures -= 1
+            self.send_error(503)
+            return
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            content = f.read()
+        etag = '"' + hashlib.md5(content).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@contextmanager
+def serve_directory(directory):
+    handler = functools.partial(CatalogRequestHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestGithubCatalog(UnitxtTestCase):
+    def setUp(self):
+        super().setUp()
+        CatalogRequestHandler.requests_log = []
+        CatalogRequestHandler.failures = 0
+
+    def test_load_with_single_request_and_revalidation(self):
+        with tempfile.TemporaryDirectory() as catalog_dir, tempfile.TemporaryDirectory() as cache_dir:
+            add_to_catalog(
+                AddFields(fields={"a": 1}), "remote.add_a", catalog_path=catalog_dir
+            )
+            with serve_directory(catalog_dir) as url:
+                catalog = GithubCatalog(location=url, cache_dir=cache_dir)
+                self.assertIn("remote.add_a", catalog)
+                artifact = catalog.load("remote.add_a")
+                self.assertDictEqual(artifact.fields, {"a": 1})
+                self.assertEqual(len(CatalogRequestHandler.requests_log), 1)
+                self.assertNotIn("remote.missing", catalog)
+
+                CatalogRequestHandler.requests_log = []
+                catalog = GithubCatalog(location=url, cache_dir=cache_dir)
+                artifact = catalog.load("remote.add_a")
+                self.assertDictEqual(artifact.fields, {"a": 1})
+                self.assertEqual(len(CatalogRequestHandler.requests_log), 1)
+
+            # server is down: the revalidated copy on disk is used
+            catalog = GithubCatalog(location=url, cache_dir=cache_dir)
+            self.assertIn("remote.add_a", catalog)
+
+    def test_server_errors_are_not_remembered(self):
+        with tempfile.TemporaryDirectory() as catalog_dir, tempfile.TemporaryDirectory() as cache_dir:
+            add_to_catalog(
+                AddFields(fields={"a": 1}), "remote.add_a", catalog_path=catalog_dir
+            )
+            with serve_directory(catalog_dir) as url:
+                catalog = GithubCatalog(location=url, cache_dir=cache_dir)
+                CatalogRequestHandler.failures = 1
+                with self.assertRaisesRegex(requests.exceptions.HTTPError, "503"):
+                    "remote.add_a" in catalog  # noqa: B015
+                self.assertIn("remote.add_a", catalog)
+
+                # a stored copy is used when the server fails
+                catalog = GithubCatalog(location=url, cache_dir=cache_dir)
+                CatalogRequestHandler.failures = 1
+                self.assertIn("remote.add_a", catalog)
+                self.assertEqual(len(CatalogRequestHandler.requests_log), 3)
+
+    def test_prefetch_references(self):
+        with tempfile.TemporaryDirectory() as catalog_dir:
+            add_to_catalog(
+                AddFields(fields={"a": 1}), "remote.add_a", catalog_path=catalog_dir
+            )
+            add_to_catalog(
+                AddFields(fields={"b": 2}), "remote.add_b", catalog_path=catalog_dir
+            )
+            with open(os.path.join(catalog_dir, "remote", "pipeline.json"), "w") as f:
+                json.dump(
+                    {
+                        "type": "sequential_operator",
+                        "steps": ["remote.add_a", "remote.add_b"],
+                    },
+                    f,
+                )
+            with serve_directory(catalog_dir) as url:
+                catalog = GithubCatalog(location=url, use_cache=False)
+                data = catalog._fetcher.fetch(catalog.path("remote.pipeline"))
+                catalog.prefetch_references(data)
+                self.assertEqual(len(CatalogRequestHandler.requests_log), 3)
+                self.assertIn("remote.add_a", catalog)
+                self.assertIn("remote.add_b", catalog)
+                self.assertEqual(len(CatalogRequestHandler.requests_log), 3)
@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from datasets import Dataset
+
+from src.unitxt.dataset_cache import DatasetCache, get_dataset_cache
+from src.unitxt.loaders import LoadHF
+from src.unitxt.settings_utils import get_settings
+from tests.utils import UnitxtTestCase
+
+settings = get_settings()
+
+
+def write_file(name, content):
+    def write(directory):
+        with open(os.path.join(directory, name), "w") as f:
+            f.write(content)
+
+    return write
+
+
+class TestDatasetCache(UnitxtTestCase):
+    def setUp(self):
+        super().setUp()
+        self.saved_settings = {
+            name: getattr(settings, name)
+            for name in [
+                "dataset_cache",
+                "dataset_cache_dir",
+                "dataset_cache_max_size_gb",
+            ]
+        }
+
+    def tearDown(self):
+        for name, value in self.saved_settings.items():
+            setattr(settings, name, value)
+        super().tearDown()
+
+    def test_put_and_get(self):
+        with tempfile.TemporaryDirectory() as root:
+            cache = DatasetCache(root)
+            key = DatasetCache.key(path="a", split="train", loader_limit=None)
+            self.assertEqual(
+                key, DatasetCache.key(loader_limit=None, split="train", path="a")
+            )
+            self.assertNotEqual(
+                key, DatasetCache.key(path="a", split="train", loader_limit=10)
+            )
+            self.assertIsNone(cache.get(key))
+
+            entry_dir = cache.put(key, write_file("data.txt", "abc"), description="a")
+            self.assertEqual(cache.get(key), entry_dir)
+            with open(os.path.join(entry_dir, "data.txt")) as f:
+                self.assertEqual(f.read(), "abc")
+            self.assertEqual([entry["key"] for entry in cache.entries()], [key])
+
+            # a second put of the same key keeps the first entry
+            cache.put(key, write_file("data.txt", "def"))
+            with open(os.path.join(cache.get(key), "data.txt")) as f:
+                self.assertEqual(f.read(), "abc")
+            self.assertEqual(len(os.listdir(root)), 1)
+
+            cache.clear()
+            self.assertIsNone(cache.get(key))
+
+    def test_failed_put_leaves_no_entry(self):
+        with tempfile.TemporaryDirectory() as root:
+            cache = DatasetCache(root)
+
+            def write(directory):
+                write_file("data.txt", "abc")(directory)
+                raise RuntimeError("failed")
+
+            with self.assertRaises(RuntimeError):
+                cache.put("key", write)
+            self.assertIsNone(cache.get("key"))
+            self.assertEqual(os.listdir(root), [])
+
+    def test_least_recently_used_entries_are_evicted(self):
+        with tempfile.TemporaryDirectory() as root:
+            cache = DatasetCache(root, max_size=2500)
+            for key in ["a", "b"]:
+                cache.put(key, write_file("data.txt", "x" * 1000))
+            past = time.time() - 100
+            os.utime(os.path.join(root, "a", "unitxt_cache_entry.json"), (past, past))
+            os.utime(os.path.join(root, "b", "unitxt_cache_entry.json"), (past, past))
+            self.assertIsNotNone(cache.get("a"))  # "a" is now the last used
+
+            cache.put("c", write_file("data.txt", "x" * 1000))
+            self.assertEqual(
+                sorted(entry["key"] for entry in cache.entries()), ["a", "c"]
+            )
+            self.assertLessEqual(cache.size(), 2500)
+
+    def test_flags(self):
+        with tempfile.TemporaryDirectory() as root:
+            cache = DatasetCache(root)
+            self.assertIsNone(cache.get_flag("key", "streaming"))
+            cache.set_flag("key", "streaming", False)
+            cache.set_flag("key", "other", 1)
+            self.assertIs(cache.get_flag("key", "streaming"), False)
+            self.assertEqual(cache.get_flag("key", "other"), 1)
+
+    def test_settings(self):
+        with tempfile.TemporaryDirectory() as root:
+            settings.dataset_cache_dir = root
+            settings.dataset_cache_max_size_gb = 1
+            cache = get_dataset_cache()
+            self.assertEqual(cache.root, root)
+            self.assertEqual(cache.max_size, 1 << 30)
+            settings.dataset_cache = False
+            self.assertIsNone(get_dataset_cache())
+
+    def test_load_hf_uses_the_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_file = os.path.join(tmp_dir, "data.jsonl")
+            with open(data_file, "w") as f:
+                for i in range(5):
+                    f.write(json.dumps({"x": i}) + "\n")
+            settings.dataset_cache_dir = os.path.join(tmp_dir, "cache")
+
+            loader = LoadHF(
+                path="json", data_files={"test": data_file}, streaming=False
+            )
+            self.assertEqual(
+                [instance["x"] for instance in loader()["test"]], list(range(5))
+            )
+            self.assertEqual(len(get_dataset_cache().entries()), 1)
+
+            os.remove(data_file)
+            loader = LoadHF(
+                path="json", data_files={"test": data_file}, streaming=False
+            )
+            self.assertEqual(
+                [instance["x"] for instance in loader()["test"]], list(range(5))
+            )
+
+    def test_unpinned_hub_datasets_are_cached_per_commit(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            settings.dataset_cache_dir = tmp_dir
+            commit = SimpleNamespace(sha="a")
+
+            def dataset_info(api, path):
+                if commit.sha is None:
+                    raise ConnectionError("offline")
+                return SimpleNamespace(sha=commit.sha)
+
+            def download_dataset(loader, revision=None):
+                return Dataset.from_dict({"x": [revision]})
+
+            with patch(
+                "huggingface_hub.HfApi.dataset_info", dataset_info
+            ), patch.object(
+                LoadHF, "download_dataset", autospec=True, side_effect=download_dataset
+            ) as download:
+                for sha, downloads in [("a", 1), ("a", 1), ("b", 2), (None, 3)]:
+                    commit.sha = sha
+                    loader = LoadHF(path="org/data", split="test", streaming=False)
+                    self.assertEqual(list(loader()["test"]), [{"x": sha}])
+                    self.assertEqual(download.call_count, downloads)
+                # an unknown commit is not cached
+                self.assertEqual(len(get_dataset_cache().entries()), 2)
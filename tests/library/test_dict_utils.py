@@ -1,4 +1,6 @@
-from src.unitxt.dict_utils import dict_get, dict_set
+import dpath
+
+from src.unitxt.dict_utils import compile_query, dict_get, dict_set
 from tests.utils import UnitxtTestCase
 
 
@@ -57,6 +59,16 @@ class TestDictUtils(UnitxtTestCase):
             dic, {"a": [{"b": 1}, {"b": 5}], "c": [{"b": 3}, {"b": 6}]}
         )
 
+    def test_set_failure_is_reported(self):
+        dic = {"a": (1, 2), "b": [{"c": 1}, {"c": 2}]}
+        with self.assertRaisesRegex(
+            ValueError,
+            r"matched the item at \['a', 0\], but it cannot be set .* TypeError",
+        ):
+            dict_set(dic, "a/0", 3, use_dpath=True)
+        with self.assertRaisesRegex(ValueError, "matched 2 items"):
+            dict_set(dic, "b/*/c", 3, use_dpath=True)
+
     def test_query_set_with_multiple_non_existing(self):
         dic = {"a": [{"b": 1}, {"b": 2}]}
         with self.assertRaises(ValueError):
@@ -80,3 +92,42 @@ class TestDictUtils(UnitxtTestCase):
         dic = {"d": 0}
         dict_set(dic, "/a/b/d", 1, use_dpath=True)
         self.assertDictEqual(dic, {"a": {"b": {"d": 1}}, "d": 0})
+
+    def test_compiled_query_matches_dpath(self):
+        dic = {
+            "a": [{"b": 1, "c": {"b": 2}}, {"b": 3}],
+            "b": {"a": {"b": 4}, "1": [5, {"b": 6}]},
+            "c": "leaf",
+        }
+        for query in [
+            "a",
+            "/a/0/b",
+            "a/-1/b",
+            "b/1/1",
+            "*/b",
+            "a/*/b",
+            "?/[01]",
+            "**/b",
+            "a/**",
+            "**",
+            "b/**/b",
+            "c/0",
+            "x/y",
+        ]:
+            with self.subTest(query=query):
+                expected = list(dpath.search(dic, query, yielded=True))
+                actual = [
+                    ("/".join(str(key) for key in path), value)
+                    for path, value in compile_query(query).search(dic)
+                ]
+                self.assertListEqual(actual, expected)
+
+    def test_compiled_query_is_cached(self):
+        self.assertIs(compile_query("a/*/b"), compile_query("a/*/b"))
+
+    def test_set_new_list_items(self):
+        dic = {"a": []}
+        dict_set(dic, "a/1/b", 1)
+        self.assertDictEqual(dic, {"a": [None, {"b": 1}]})
+        dict_set(dic, "c/0", 2)
+        self.assertDictEqual(dic, {"a": [None, {"b": 1}], "c": [2]})
@@ -0,0 +1,70 @@
+import json
+import threading
+
+from src.unitxt.api import evaluate
+from src.unitxt.evaluation_service import EvaluationClient, EvaluationService
+from tests.utils import UnitxtTestCase
+
+
+def make_job(index, size):
+    data = [
+        {
+            "metrics": ["metrics.accuracy"],
+            "source": f"question {i}",
+            "target": "yes",
+            "references": ["yes"],
+            "task_data": json.dumps({"index": i}),
+            "group": "unitxt" if i % 3 else "other",
+            "postprocessors": ["processors.to_string_stripped"],
+        }
+        for i in range(size)
+    ]
+    predictions = ["yes" if (i + index) % 2 else "no" for i in range(size)]
+    return predictions, data
+
+
+class TestEvaluationService(UnitxtTestCase):
+    def test_concurrent_requests(self):
+        jobs = [make_job(index, 4 + index) for index in range(5)]
+        results = [None] * len(jobs)
+
+        with EvaluationService(
+            port=0, metrics=["metrics.accuracy"], batch_wait=0.1
+        ) as service:
+            client = EvaluationClient(service.url)
+
+            def run(index):
+                results[index] = client.evaluate(*jobs[index])
+
+            threads = [
+                threading.Thread(target=run, args=(index,))
+                for index in range(len(jobs))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            health = client.health()
+
+        self.assertEqual(health["evaluated_requests"], len(jobs))
+        self.assertLess(health["evaluated_batches"], len(jobs))
+        for job, result in zip(jobs, results):
+            expected = evaluate(*job)
+            self.assertEqual(len(result), len(expected))
+            for instance, expected_instance in zip(result, expected):
+                self.assertEqual(instance["origin"], expected_instance["origin"])
+                self.assertDictEqual(
+                    instance["score"]["instance"],
+                    expected_instance["score"]["instance"],
+                )
+                self.assertDictEqual(
+                    instance["score"]["global"], expected_instance["score"]["global"]
+                )
+
+    def test_bad_request(self):
+        with EvaluationService(port=0) as service:
+            client = EvaluationClient(service.url)
+            predictions, data = make_job(0, 3)
+            with self.assertRaises(RuntimeError) as e:
+                client.evaluate(predictions[:2], data)
+            self.assertIn("400", str(e.exception))
@@ -0,0 +1,101 @@
+import os
+import tempfile
+
+import pandas as pd
+
+from src.unitxt.card import TaskCard
+from src.unitxt.loaders import LoadCSV
+from src.unitxt.operator import SourceSequentialOperator
+from src.unitxt.operators import AddFields, FilterByCondition, SplitByValue
+from src.unitxt.splitters import RandomSampler
+from src.unitxt.standard import StandardRecipe
+from src.unitxt.task import FormTask
+from src.unitxt.templates import InputOutputTemplate
+from tests.utils import UnitxtTestCase
+
+
+class TestExplain(UnitxtTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.files = {}
+        for split, size in [("train", 40), ("test", 8)]:
+            path = os.path.join(self.tmp_dir.name, f"{split}.csv")
+            pd.DataFrame(
+                {
+                    "text": [f"{split} sentence {i}" for i in range(size)],
+                    "label": ["positive" if i % 2 else "negative" for i in range(size)],
+                    "group": [i % 4 for i in range(size)],
+                }
+            ).to_csv(path, index=False)
+            self.files[split] = path
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_explain_steps(self):
+        operator = SourceSequentialOperator(
+            steps=[
+                LoadCSV(files=self.files),
+                AddFields(fields={"extra": 1}),
+                FilterByCondition(values={"group": 0}, condition="ne"),
+                SplitByValue(fields=["group"]),
+            ]
+        )
+        plan = operator.explain(sample_size=20, full_size={"train": 40})
+        loader, add_fields, filter_by_condition, split_by_value = plan.steps
+
+        self.assertEqual(loader.instances_out, 28)
+        self.assertEqual(loader.splits_out, ["train", "test"])
+        self.assertEqual(loader.fields_added, ["group", "label", "text"])
+        self.assertEqual(add_fields.fields_added, ["extra"])
+        self.assertEqual(add_fields.passes, 1)
+        self.assertEqual(filter_by_condition.selectivity, 21 / 28)
+        self.assertEqual(split_by_value.passes, 4)
+        self.assertEqual(
+            split_by_value.new_splits,
+            [
+                "train_1",
+                "train_2",
+                "train_3",
+                "test_1",
+                "test_2",
+                "test_3",
+            ],
+        )
+        self.assertEqual(plan.hotspots(), [split_by_value])
+        self.assertGreater(split_by_value.peak_bytes, 0)
+
+        # the size of the test split is known, since it is smaller than the sample
+        self.assertEqual(plan.full_instances, 48)
+        self.assertAlmostEqual(plan.estimated_seconds, plan.seconds * 48 / 28, places=6)
+        self.assertIn("3 (SplitByValue)", str(plan))
+
+        plan = operator.explain(sample_size=20, full_size=280, measure_memory=False)
+        self.assertEqual(plan.scale, 10)
+        self.assertIsNone(plan.steps[1].peak_bytes)
+
+    def test_explain_recipe(self):
+        recipe = StandardRecipe(
+            card=TaskCard(
+                loader=LoadCSV(files=self.files),
+                task=FormTask(
+                    inputs=["text"], outputs=["label"], metrics=["metrics.accuracy"]
+                ),
+                sampler=RandomSampler(),
+            ),
+            template=InputOutputTemplate(
+                input_format="{text}", output_format="{label}"
+            ),
+            num_demos=2,
+            demos_pool_size=10,
+        )
+        plan = recipe.explain(sample_size=50, measure_memory=False)
+        self.assertEqual(len(plan.steps), len(recipe.steps))
+        self.assertIsNone(plan.steps[0].peak_bytes)
+        self.assertEqual(plan.steps[0].instances_out, 48)
+        self.assertEqual(plan.full_instances, 48)
+        demos_pool = plan.steps[
+            [step.step for step in plan.steps].index("CreateDemosPool")
+        ]
+        self.assertEqual(demos_pool.new_splits, ["demos_pool"])
+        self.assertEqual(plan.steps[-1].fields_removed, ["inputs", "outputs"])
@@ -0,0 +1,64 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+
+import pyarrow as pa
+
+from src.unitxt.file_utils import decompressed_stream, infer_compression, open_file
+from tests.utils import UnitxtTestCase
+
+CONTENT = b"".join(f"line {i}\n".encode() for i in range(1000))
+
+
+def write_compressed(path, compression):
+    if compression == "gzip":
+        opener = gzip.open
+    elif compression == "bz2":
+        opener = bz2.open
+    elif compression == "xz":
+        opener = lzma.open
+    elif compression == "zstd":
+        with pa.CompressedOutputStream(path, "zstd") as f:
+            f.write(CONTENT)
+        return
+    else:
+        opener = open
+    with opener(path, "wb") as f:
+        f.write(CONTENT)
+
+
+class TestFileUtils(UnitxtTestCase):
+    def test_infer_compression(self):
+        self.assertEqual(infer_compression("data/train.jsonl.gz"), "gzip")
+        self.assertEqual(infer_compression("train.csv.ZST"), "zstd")
+        self.assertIsNone(infer_compression("train.csv"))
+
+    def test_open_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for extension, compression in [
+                ("", None),
+                (".gz", "gzip"),
+                (".bz2", "bz2"),
+                (".xz", "xz"),
+                (".zst", "zstd"),
+            ]:
+                path = os.path.join(tmp_dir, "data.txt" + extension)
+                write_compressed(path, compression)
+                with open_file(path, buffer_size=4096) as f:
+                    lines = list(f)
+                self.assertEqual(b"".join(lines), CONTENT)
+                self.assertEqual(len(lines), 1000)
+                self.assertTrue(f.closed)
+
+            with self.assertRaises(ValueError):
+                open_file(path, compression="rar")
+
+    def test_decompressed_stream(self):
+        body = io.BytesIO(gzip.compress(CONTENT))
+        with decompressed_stream(body, "gzip") as stream:
+            self.assertEqual(stream.readline(), b"line 0\n")
+            self.assertEqual(stream.read(), CONTENT[len(b"line 0\n") :])
+        self.assertFalse(body.closed)
@@ -1,48 +1,116 @@
+import bz2
+import functools
+import gzip
+import hashlib
+import http.server
+import io
 import json
+import lzma
 import os
+import sqlite3
 import tempfile
+import threading
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import ibm_boto3
 import pandas as pd
+import pyarrow as pa
 
-from src.unitxt.loaders import LoadCSV, LoadFromIBMCloud, LoadHF
+from src.unitxt.artifact import Artifact
+from src.unitxt.loaders import (
+    LoadCSV,
+    LoadFromArrow,
+    LoadFromDataFrame,
+    LoadFromIBMCloud,
+    LoadFromSQL,
+    LoadHF,
+    LoadJsonl,
+    LoadParquet,
+    register_table,
+    unregister_table,
+)
 from src.unitxt.logging_utils import get_logger
 from tests.utils import UnitxtTestCase
 
+
+class QuietRequestHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_directory(directory):
+    handler = functools.partial(QuietRequestHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 logger = get_logger()
 
 
 CONTENT = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
 
 
-class DummyBody:
-    def iter_lines():
-        for line in CONTENT:
-            line_as_str = json.dumps(line)
-            line_as_bytes = line_as_str.encode()
-            yield line_as_bytes
+class DummyBody(io.BytesIO):
+    def iter_lines(self):
+        yield from self.read().splitlines()
 
+    def iter_chunks(self, chunk_size):
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
 
-class DummyObject:
-    def get(self):
-        return {"ContentLength": 1, "Body": DummyBody}
 
+class DummyObject:
+    def __init__(self, s3, item_name):
+        self.s3 = s3
+        self.item_name = item_name
+        self.content = s3.objects.get(
+            item_name, b"".join(json.dumps(line).encode() + b"\n" for line in CONTENT)
+        )
+        self.content_length = len(self.content)
+        self.e_tag = hashlib.md5(self.content).hexdigest()
 
-class DummyBucket:
-    def download_file(self, item_name, local_file, Callback):
-        with open(local_file, "w") as f:
-            logger.info(local_file)
-            for line in CONTENT:
-                f.write(json.dumps(line) + "\n")
+    def get(self, Range=None, IfMatch=None):
+        # the current content, which may have been replaced since the object was loaded
+        content = self.s3.objects.get(self.item_name, self.content)
+        if IfMatch is not None and IfMatch != hashlib.md5(content).hexdigest():
+            raise ConnectionError("PreconditionFailed")
+        if Range is not None:
+            start, end = map(int, Range[len("bytes=") :].split("-"))
+            self.s3.ranges.append((self.item_name, start, end))
+            if (self.item_name, start) in self.s3.failing_ranges:
+                self.s3.failing_ranges.remove((self.item_name, start))
+                raise ConnectionError("connection reset")
+            if self.item_name in self.s3.replacements:
+                self.s3.objects[self.item_name] = self.s3.replacements.pop(
+                    self.item_name
+                )
+            content = content[start : end + 1]
+        return {"ContentLength": len(content), "Body": DummyBody(content)}
 
 
 class DummyS3:
-    def Object(self, bucket_name, item_name):
-        return DummyObject()
+    """An in memory stand-in of an S3 (COS) resource, supporting ranged GETs."""
 
-    def Bucket(self, bucket_name):
-        return DummyBucket()
+    def __init__(self, objects=None):
+        self.objects = objects or {}
+        self.ranges = []
+        self.failing_ranges = []
+        # objects replaced after their next ranged GET
+        self.replacements = {}
+
+    def Object(self, bucket_name, item_name):
+        return DummyObject(self, item_name)
 
 
 class TestLoaders(UnitxtTestCase):
@@ -68,6 +136,414 @@ class TestLoaders(UnitxtTestCase):
                 ):
                     self.assertEqual(saved_instance[1].to_dict(), loaded_instance)
 
+    def test_load_csv_engines(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            df = pd.DataFrame(
+                {
+                    "text": [f"sentence {i}" for i in range(10)],
+                    "label": [i % 3 for i in range(10)],
+                }
+            )
+            files = {
+                "train": os.path.join(tmp_dir, "train.csv"),
+                "test": os.path.join(tmp_dir, "test.tsv.gz"),
+            }
+            df.to_csv(files["train"], index=False)
+            df.to_csv(files["test"], index=False, sep="\t")
+
+            for engine in ["pandas", "pyarrow"]:
+                for streaming in [True, False]:
+                    ms = LoadCSV(
+                        files={"train": files["train"]},
+                        engine=engine,
+                        streaming=streaming,
+                    )()
+                    self.assertEqual(list(ms["train"]), df.to_dict("records"))
+
+                ms = LoadCSV(
+                    files={"test": files["test"]},
+                    engine=engine,
+                    sep="\t",
+                    columns=["label"],
+                    dtypes={"label": "string" if engine == "pyarrow" else "str"},
+                    loader_limit=4,
+                )()
+                self.assertEqual(
+                    list(ms["test"]),
+                    [{"label": "0"}, {"label": "1"}, {"label": "2"}, {"label": "0"}],
+                )
+
+        with self.assertRaises(AssertionError):
+            LoadCSV(files=files, engine="polars")
+
+    def test_load_csv_from_urls(self):
+        instances = [{"id": i, "text": f"text {i}"} for i in range(20)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            names = ["test.csv", "test.csv.gz", "test.csv.zip"]
+            for name in names:
+                pd.DataFrame(instances).to_csv(os.path.join(tmp_dir, name), index=False)
+            with serve_directory(tmp_dir) as url:
+                for name in names:
+                    for engine in ["pandas", "pyarrow"]:
+                        location = url
+                        if engine == "pyarrow" and name.endswith(".zip"):
+                            # zip files need random access, which this server lacks
+                            location = tmp_dir
+                        for streaming in [True, False]:
+                            ms = LoadCSV(
+                                files={"test": f"{location}/{name}"},
+                                engine=engine,
+                                streaming=streaming,
+                            )()
+                            self.assertEqual(list(ms["test"]), instances)
+
+    def test_load_csv_converters_and_dtypes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "train.csv")
+            pd.DataFrame(
+                {
+                    "id": [str(i) for i in range(299)] + ["last"],
+                    "answers": [json.dumps([f"answer {i}"]) for i in range(300)],
+                }
+            ).to_csv(file, index=False)
+
+            for engine in ["pandas", "pyarrow"]:
+                for streaming in [True, False]:
+                    ms = LoadCSV(
+                        files={"train": file},
+                        engine=engine,
+                        streaming=streaming,
+                        dtypes={"id": "string" if engine == "pyarrow" else "str"},
+                        converters={"answers": "json.loads"},
+                        block_size=1000,
+                    )()
+                    instances = list(ms["train"])
+                    self.assertEqual(instances[0], {"id": "0", "answers": ["answer 0"]})
+                    self.assertEqual(instances[-1]["id"], "last")
+
+            # the type of id is inferred from the first block, before "last"
+            ms = LoadCSV(
+                files={"train": file},
+                engine="pyarrow",
+                block_size=1000,
+            )()
+            with self.assertRaisesRegex(ValueError, "set the dtypes"):
+                list(ms["train"])
+
+    def test_load_jsonl_and_parquet(self):
+        instances = [
+            {"id": i, "lang": "en" if i % 2 else "fr", "answers": [f"answer {i}"]}
+            for i in range(30)
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for shard in range(3):
+                shard_instances = instances[shard * 10 : (shard + 1) * 10]
+                with open(os.path.join(tmp_dir, f"train-{shard}.jsonl"), "w") as f:
+                    for instance in shard_instances:
+                        f.write(json.dumps(instance) + "\n")
+                pd.DataFrame(shard_instances).to_parquet(
+                    os.path.join(tmp_dir, f"train-{shard}.parquet"), row_group_size=4
+                )
+
+            for loader_class, extension in [
+                (LoadJsonl, "jsonl"),
+                (LoadParquet, "parquet"),
+            ]:
+                files = {"train": os.path.join(tmp_dir, f"train-*.{extension}")}
+                ms = loader_class(files=files)()
+                self.assertEqual(list(ms["train"]), instances)
+
+                ms = loader_class(
+                    files=files,
+                    columns=["id"],
+                    filters=[["lang", "==", "en"], ["id", ">=", 7]],
+                    loader_limit=3,
+                )()
+                self.assertEqual(list(ms["train"]), [{"id": 7}, {"id": 9}, {"id": 11}])
+
+                ms = loader_class(
+                    files={
+                        "test": [
+                            os.path.join(tmp_dir, f"train-2.{extension}"),
+                            os.path.join(tmp_dir, f"train-0.{extension}"),
+                        ]
+                    },
+                    filters=[["id", "in", [1, 25]]],
+                )()
+                self.assertEqual([instance["id"] for instance in ms["test"]], [25, 1])
+
+                with self.assertRaises(FileNotFoundError):
+                    list(loader_class(files={"test": "missing-*.x"})()["test"])
+                with self.assertRaises(ValueError):
+                    loader_class(files=files, filters=[["id", "~", 1]])
+
+    def test_load_compressed_files(self):
+        instances = [{"id": i, "text": f"text {i}"} for i in range(40)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for shard, (opener, extension) in enumerate(
+                [(gzip.open, "gz"), (bz2.open, "bz2"), (lzma.open, "xz"), (open, "")]
+            ):
+                path = os.path.join(tmp_dir, f"train-{shard}.jsonl")
+                with opener(f"{path}.{extension}" if extension else path, "wt") as f:
+                    for instance in instances[shard * 10 : (shard + 1) * 10]:
+                        f.write(json.dumps(instance) + "\n")
+            ms = LoadJsonl(
+                files={"train": os.path.join(tmp_dir, "train-*")}, num_readers=2
+            )()
+            self.assertEqual(list(ms["train"]), instances)
+
+            csv_file = os.path.join(tmp_dir, "test.csv.xz")
+            pd.DataFrame(instances).to_csv(csv_file, index=False)
+            for engine in ["pandas", "pyarrow"]:
+                for streaming in [True, False]:
+                    ms = LoadCSV(
+                        files={"test": csv_file}, engine=engine, streaming=streaming
+                    )()
+                    self.assertEqual(list(ms["test"]), instances)
+
+            # compressions open_file does not support are left to pandas
+            zip_file = os.path.join(tmp_dir, "test.csv.zip")
+            pd.DataFrame(instances).to_csv(zip_file, index=False)
+            for compression in [None, "zip"]:
+                for streaming in [True, False]:
+                    ms = LoadCSV(
+                        files={"test": zip_file},
+                        compression=compression,
+                        streaming=streaming,
+                    )()
+                    self.assertEqual(list(ms["test"]), instances)
+
+    def test_load_files_in_parallel(self):
+        instances = [{"id": i} for i in range(60)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for shard in range(6):
+                with open(os.path.join(tmp_dir, f"train-{shard}.jsonl"), "w") as f:
+                    for instance in instances[shard * 10 : (shard + 1) * 10]:
+                        f.write(json.dumps(instance) + "\n")
+            files = {"train": os.path.join(tmp_dir, "train-*.jsonl")}
+
+            for reader_type in ["thread", "process"]:
+                ms = LoadJsonl(files=files, num_readers=3, reader_type=reader_type)()
+                self.assertEqual(list(ms["train"]), instances)
+
+                ms = LoadJsonl(
+                    files=files,
+                    num_readers=3,
+                    reader_type=reader_type,
+                    merge="first_ready",
+                )()
+                self.assertCountEqual(list(ms["train"]), instances)
+
+            ms = LoadJsonl(files=files, num_readers=3, loader_limit=25)()
+            self.assertEqual(list(ms["train"]), instances[:25])
+
+            # every shard reads its own files
+            shards = [
+                list(LoadJsonl(files=files, num_shards=4, shard_index=index)()["train"])
+                for index in range(4)
+            ]
+            self.assertEqual(shards[0], instances[0:10] + instances[40:50])
+            self.assertEqual(shards[3], instances[30:40])
+            self.assertCountEqual(sum(shards, []), instances)
+
+            with self.assertRaises(ValueError):
+                LoadJsonl(files=files, num_shards=2, shard_index=2)
+            with self.assertRaises(ValueError):
+                LoadJsonl(files=files, merge="random")
+
+    def test_load_from_tables(self):
+        instances = [{"id": i, "label": i // 80} for i in range(100)]
+        df = pd.DataFrame(instances)
+        for loader_class, table, head in [
+            (LoadFromDataFrame, df, df.iloc[:5]),
+            (LoadFromArrow, pa.Table.from_pandas(df), pa.Table.from_pandas(df[:5])),
+        ]:
+            ms = loader_class(tables={"train": table, "test": head}, batch_size=7)()
+            self.assertEqual(list(ms["train"]), instances)
+            self.assertEqual(list(ms["test"]), instances[:5])
+
+            ms = loader_class(tables={"train": table}, loader_limit=10)()
+            self.assertEqual(list(ms["train"]), instances[:10])
+
+            sample = list(
+                loader_class(
+                    tables={"train": table},
+                    loader_limit=10,
+                    loader_sampling="stratified",
+                    loader_sampling_field="label",
+                )()["train"]
+            )
+            self.assertEqual(
+                [instance["label"] for instance in sample], [0] * 8 + [1] * 2
+            )
+
+            # loaders of registered tables are saved without the data
+            register_table("test_table", table)
+            try:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    path = os.path.join(tmp_dir, "loader.json")
+                    loader_class(tables={"test": "test_table"}).save(path)
+                    with open(path) as f:
+                        self.assertLess(len(f.read()), 200)
+                    loader = Artifact.load(path)
+                self.assertEqual(list(loader()["test"]), instances)
+            finally:
+                unregister_table("test_table")
+            with self.assertRaises(ValueError):
+                list(loader()["test"])
+
+    def test_load_from_sql(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            database = os.path.join(tmp_dir, "eval.db")
+            with sqlite3.connect(database) as connection:
+                connection.execute(
+                    "CREATE TABLE qa (id INTEGER, question TEXT, split TEXT)"
+                )
+                connection.executemany(
+                    "INSERT INTO qa VALUES (?, ?, ?)",
+                    [
+                        (i, f"question {i}", "test" if i % 4 == 0 else "train")
+                        for i in range(100)
+                    ],
+                )
+            connection.close()
+            queries = {
+                "train": "SELECT id, question FROM qa WHERE split = 'train' ORDER BY id",
+                "test": "SELECT id FROM qa WHERE split = 'test' ORDER BY id;",
+            }
+
+            ms = LoadFromSQL(database=database, queries=queries, batch_size=7)()
+            self.assertEqual(
+                list(ms["train"])[:2],
+                [
+                    {"id": 1, "question": "question 1"},
+                    {"id": 2, "question": "question 2"},
+                ],
+            )
+            self.assertEqual(len(list(ms["train"])), 75)
+            self.assertEqual(list(ms["test"]), [{"id": i} for i in range(0, 100, 4)])
+
+            executed = []
+
+            def connect():
+                connection = sqlite3.connect(database)
+                connection.set_trace_callback(executed.append)
+                return connection
+
+            ms = LoadFromSQL(connect=connect, queries=queries, loader_limit=3)()
+            self.assertEqual(list(ms["test"]), [{"id": 0}, {"id": 4}, {"id": 8}])
+            self.assertIn("LIMIT 3", executed[-1])
+
+            ms = LoadFromSQL(
+                connect=connect,
+                queries=queries,
+                loader_limit=3,
+                loader_sampling="random",
+            )()
+            self.assertEqual(len(list(ms["test"])), 3)
+            self.assertNotIn("LIMIT", executed[-1])
+
+            with self.assertRaises(ValueError):
+                LoadFromSQL(queries=queries)
+
+    def test_loader_sampling(self):
+        # the instances are sorted by label, so the head of the split holds only label 0
+        instances = [{"id": i, "label": i // 80} for i in range(100)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pd.DataFrame(instances).to_csv(
+                os.path.join(tmp_dir, "train.csv"), index=False
+            )
+            pd.DataFrame(instances).to_parquet(
+                os.path.join(tmp_dir, "train.parquet"), row_group_size=10
+            )
+            with open(os.path.join(tmp_dir, "train.jsonl"), "w") as f:
+                for instance in instances:
+                    f.write(json.dumps(instance) + "\n")
+
+            loaders = [
+                lambda **kwargs: LoadCSV(
+                    files={"train": os.path.join(tmp_dir, "train.csv")}, **kwargs
+                ),
+                lambda **kwargs: LoadCSV(
+                    files={"train": os.path.join(tmp_dir, "train.csv")},
+                    engine="pyarrow",
+                    streaming=False,
+                    **kwargs,
+                ),
+                lambda **kwargs: LoadCSV(
+                    files={"train": os.path.join(tmp_dir, "train.csv")},
+                    streaming=False,
+                    **kwargs,
+                ),
+                lambda **kwargs: LoadJsonl(
+                    files={"train": os.path.join(tmp_dir, "train.jsonl")}, **kwargs
+                ),
+                lambda **kwargs: LoadParquet(
+                    files={"train": os.path.join(tmp_dir, "train.parquet")}, **kwargs
+                ),
+            ]
+            for make_loader in loaders:
+                head = list(make_loader(loader_limit=10)()["train"])
+                self.assertEqual([instance["id"] for instance in head], list(range(10)))
+
+                sample = list(
+                    make_loader(loader_limit=10, loader_sampling="random")()["train"]
+                )
+                ids = [instance["id"] for instance in sample]
+                self.assertEqual(len(set(ids)), 10)
+                self.assertEqual(ids, sorted(ids))
+                self.assertNotEqual(ids, list(range(10)))
+                self.assertEqual(sample, [instances[i] for i in ids])
+                # the sample is seeded
+                self.assertEqual(
+                    list(
+                        make_loader(loader_limit=10, loader_sampling="random")()[
+                            "train"
+                        ]
+                    ),
+                    sample,
+                )
+
+                sample = list(
+                    make_loader(
+                        loader_limit=10,
+                        loader_sampling="stratified",
+                        loader_sampling_field="label",
+                    )()["train"]
+                )
+                self.assertEqual(
+                    [instance["label"] for instance in sample], [0] * 8 + [1] * 2
+                )
+
+        with self.assertRaises(ValueError):
+            LoadCSV(files={}, loader_sampling="first")
+        with self.assertRaises(ValueError):
+            LoadCSV(files={}, loader_sampling="stratified")
+
+    def test_load_hf_sampling(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_file = os.path.join(tmp_dir, "data.jsonl")
+            with open(data_file, "w") as f:
+                for i in range(100):
+                    f.write(json.dumps({"id": i, "label": i // 80}) + "\n")
+            for streaming in [True, False]:
+                sample = list(
+                    LoadHF(
+                        path="json",
+                        data_files={"test": data_file},
+                        streaming=streaming,
+                        loader_limit=10,
+                        loader_sampling="stratified",
+                        loader_sampling_field="label",
+                    )()["test"]
+                )
+                ids = [instance["id"] for instance in sample]
+                self.assertEqual(len(set(ids)), 10)
+                self.assertEqual(ids, sorted(ids))
+                self.assertEqual(
+                    [instance["label"] for instance in sample], [0] * 8 + [1] * 2
+                )
+
     def test_load_from_ibm_cos(self):
         os.environ["DUMMY_URL_ENV"] = "DUMMY_URL"
         os.environ["DUMMY_KEY_ENV"] = "DUMMY_KEY"
@@ -96,6 +572,127 @@ class TestLoaders(UnitxtTestCase):
                         self.assertEqual(len(ds["test"]), loader_limit)
                     self.assertEqual(ds["test"][0], {"a": 1, "b": 2})
 
+    def test_load_from_ibm_cos_in_parts(self):
+        os.environ["DUMMY_URL_ENV"] = "DUMMY_URL"
+        os.environ["DUMMY_KEY_ENV"] = "DUMMY_KEY"
+        os.environ["DUMMY_SECRET_ENV"] = "DUMMY_SECRET"
+        instances = [{"id": i, "text": f"text {i}"} for i in range(100)]
+        content = b"".join(json.dumps(line).encode() + b"\n" for line in instances)
+        s3 = DummyS3(
+            objects={
+                "data/train.json": content,
+                "data/test.json": content[: content.index(b"\n") + 1],
+            }
+        )
+        part_size = 256
+        # the download of the train file fails at its third part
+        s3.failing_ranges = [("data/train.json", 2 * part_size)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.dict(
+            os.environ, {"UNITXT_IBM_COS_CACHE": tmp_dir}
+        ), patch.object(ibm_boto3, "resource", return_value=s3):
+            loader = LoadFromIBMCloud(
+                endpoint_url_env="DUMMY_URL_ENV",
+                aws_access_key_id_env="DUMMY_KEY_ENV",
+                aws_secret_access_key_env="DUMMY_SECRET_ENV",
+                bucket_name="DUMMY_BUCKET",
+                data_dir="data",
+                data_files={"train": "train.json", "test": "test.json"},
+                part_size=part_size,
+                max_workers=1,
+            )
+            with self.assertRaisesRegex(Exception, "Unabled to download"):
+                loader.process()
+            first_ranges = [
+                start for name, start, _ in s3.ranges if name == "data/train.json"
+            ]
+            self.assertEqual(first_ranges[:3], [0, part_size, 2 * part_size])
+
+            # the download continues with the part it did not download
+            s3.ranges.clear()
+            ms = loader.process()
+            self.assertEqual(list(ms["train"]), instances)
+            self.assertEqual(list(ms["test"]), instances[:1])
+            self.assertEqual(
+                s3.ranges, [("data/train.json", 2 * part_size, 3 * part_size - 1)]
+            )
+
+    def test_load_from_ibm_cos_object_replaced_during_download(self):
+        os.environ["DUMMY_URL_ENV"] = "DUMMY_URL"
+        os.environ["DUMMY_KEY_ENV"] = "DUMMY_KEY"
+        os.environ["DUMMY_SECRET_ENV"] = "DUMMY_SECRET"
+        old = [{"id": i, "text": f"old {i}"} for i in range(100)]
+        new = [{"id": i, "text": f"new {i}"} for i in range(100)]
+        s3 = DummyS3(
+            objects={
+                "data/train.json": b"".join(
+                    json.dumps(line).encode() + b"\n" for line in old
+                )
+            }
+        )
+        s3.replacements["data/train.json"] = b"".join(
+            json.dumps(line).encode() + b"\n" for line in new
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.dict(
+            os.environ, {"UNITXT_IBM_COS_CACHE": tmp_dir}
+        ), patch.object(ibm_boto3, "resource", return_value=s3):
+            loader = LoadFromIBMCloud(
+                endpoint_url_env="DUMMY_URL_ENV",
+                aws_access_key_id_env="DUMMY_KEY_ENV",
+                aws_secret_access_key_env="DUMMY_SECRET_ENV",
+                bucket_name="DUMMY_BUCKET",
+                data_dir="data",
+                data_files={"train": "train.json"},
+                part_size=256,
+                max_workers=1,
+            )
+            # the parts after the replacement are of another version
+            with self.assertRaisesRegex(Exception, "Unabled to download"):
+                loader.process()
+            self.assertEqual(list(loader.process()["train"]), new)
+
+    def test_load_from_ibm_cos_streaming(self):
+        os.environ["DUMMY_URL_ENV"] = "DUMMY_URL"
+        os.environ["DUMMY_KEY_ENV"] = "DUMMY_KEY"
+        os.environ["DUMMY_SECRET_ENV"] = "DUMMY_SECRET"
+        s3 = DummyS3(
+            objects={
+                "data/train-0.jsonl": b'{"a": 1}\n{"a": 2}\n',
+                "data/train-1.csv": b"a\n3\n4\n",
+                "data/test.csv.gz": gzip.compress(b"a\n5\n"),
+            }
+        )
+        with patch.object(ibm_boto3, "resource", return_value=s3):
+            for data_files in [
+                {"train": ["train-0.jsonl", "train-1.csv"], "test": "test.csv.gz"},
+                ["train-0.jsonl", "train-1.csv", "test.csv.gz"],
+            ]:
+                loader = LoadFromIBMCloud(
+                    endpoint_url_env="DUMMY_URL_ENV",
+                    aws_access_key_id_env="DUMMY_KEY_ENV",
+                    aws_secret_access_key_env="DUMMY_SECRET_ENV",
+                    bucket_name="DUMMY_BUCKET",
+                    data_dir="data",
+                    data_files=data_files,
+                    streaming=True,
+                    loader_limit=3,
+                )
+                ms = loader()
+                self.assertEqual(list(ms["train"]), [{"a": 1}, {"a": 2}, {"a": 3}])
+                self.assertEqual(list(ms["test"]), [{"a": 5}])
+            self.assertEqual(s3.ranges, [])
+
+            with self.assertRaises(ValueError):
+                LoadFromIBMCloud(
+                    endpoint_url_env="DUMMY_URL_ENV",
+                    aws_access_key_id_env="DUMMY_KEY_ENV",
+                    aws_secret_access_key_env="DUMMY_SECRET_ENV",
+                    bucket_name="DUMMY_BUCKET",
+                    data_files={"train": "train.parquet"},
+                    streaming=True,
+                )
+
     def test_load_from_HF_compressed(self):
         loader = LoadHF(path="GEM/xlsum", name="igbo")  # the smallest file
         ms = loader.process()
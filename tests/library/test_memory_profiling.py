@@ -0,0 +1,46 @@
+from src.unitxt.memory_profiling import MemoryProfiler, is_memory_profiling
+from src.unitxt.operator import SingleStreamOperator
+from src.unitxt.operators import AddFields
+from src.unitxt.stream import MultiStream
+from tests.utils import UnitxtTestCase
+
+
+class KeepBuffers(SingleStreamOperator):
+    def process(self, stream, stream_name=None):
+        self.buffers = []
+        for instance in stream:
+            self.buffers.append(bytearray(100000))
+            yield instance
+
+
+class TestMemoryProfiling(UnitxtTestCase):
+    def test_operator_attribution(self):
+        multi_stream = MultiStream.from_iterables(
+            {"train": [{"a": i} for i in range(20)], "test": [{"a": 1}]}
+        )
+        keep_buffers = KeepBuffers()
+        add_fields = AddFields(fields={"b": 1})
+
+        with MemoryProfiler(interval=0) as profiler:
+            self.assertTrue(is_memory_profiling())
+            result = add_fields(keep_buffers(multi_stream))
+            self.assertEqual(len(list(result["train"])), 20)
+            self.assertEqual(len(list(result["test"])), 1)
+        self.assertFalse(is_memory_profiling())
+
+        operators = {
+            (memory["operator"], memory["split"]): memory
+            for memory in profiler.report()["operators"]
+        }
+        self.assertEqual(operators[("KeepBuffers", "train")]["instances"], 20)
+        self.assertGreaterEqual(
+            operators[("KeepBuffers", "train")]["peak_bytes"], 20 * 100000
+        )
+        # the buffers are allocated upstream of AddFields, and not charged to it
+        self.assertLess(operators[("AddFields", "train")]["peak_bytes"], 100000)
+        self.assertEqual(next(iter(profiler.at_peak)), "KeepBuffers")
+        self.assertGreaterEqual(profiler.at_peak["KeepBuffers"], 20 * 100000)
+        # only the buffers of the last split are retained by the operator
+        self.assertGreaterEqual(profiler.retained["KeepBuffers"], 100000)
+        self.assertLess(profiler.retained["KeepBuffers"], 20 * 100000)
+        self.assertIn("KeepBuffers [train]", profiler.format_report())
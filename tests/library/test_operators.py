@@ -1,5 +1,13 @@
+import functools
+import hashlib
+import http.server
 import json
+import os
+import tempfile
+import threading
+import zipfile
 from collections import Counter
+from contextlib import contextmanager
 from typing import Any, Dict
 
 from src.unitxt.formats import SystemFormat
@@ -17,10 +25,14 @@ from src.unitxt.operators import (
     CopyFields,
     DeterministicBalancer,
     DivideAllFieldsBy,
+    DownloadError,
+    DownloadFiles,
+    DownloadOperator,
     EncodeLabels,
     ExecuteExpression,
     ExtractFieldValues,
     ExtractMostCommonFieldValues,
+    ExtractZipFile,
     FieldOperator,
     FilterByCondition,
     FilterByExpression,
@@ -44,9 +56,11 @@ from src.unitxt.operators import (
     SplitByValue,
     StreamRefiner,
     TakeByField,
+    UnexpectedHttpCodeError,
     Unique,
     ZipFieldValues,
 )
+from src.unitxt.settings_utils import get_settings
 from src.unitxt.stream import MultiStream
 from src.unitxt.templates import InputOutputTemplate, MultiReferenceTemplate
 from src.unitxt.test_utils.operators import (
@@ -2713,3 +2727,213 @@ Agent:"""
             "'percentage_to_perturbate' should be in the range 0..100. Received 200",
             str(ae.exception),
         )
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    requests_log = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):  # noqa: N802
+        self.requests_log.append((self.path, self.headers.get("Range")))
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            content = f.read()
+        etag = '"' + hashlib.md5(content).hexdigest() + '"'
+        requested_range = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if requested_range and if_range in [None, etag]:
+            start = int(requested_range[len("bytes=") :].split("-")[0])
+            if start >= len(content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(content)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+            content = content[start:]
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@contextmanager
+def serve_directory(directory):
+    handler = functools.partial(RangeRequestHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestDownloadOperators(UnitxtTestCase):
+    def setUp(self):
+        super().setUp()
+        RangeRequestHandler.requests_log = []
+        self.settings = get_settings()
+        self.saved_cache_dir = self.settings.cache_dir
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.settings.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.served_dir = os.path.join(self.tmp_dir.name, "served")
+        os.makedirs(self.served_dir)
+        self.content = bytes(range(256)) * 100
+        with open(os.path.join(self.served_dir, "data.bin"), "wb") as f:
+            f.write(self.content)
+        self.checksum = "sha256:" + hashlib.sha256(self.content).hexdigest()
+
+    def tearDown(self):
+        self.settings.cache_dir = self.saved_cache_dir
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_download_is_cached(self):
+        target = os.path.join(self.tmp_dir.name, "out", "data.bin")
+        with serve_directory(self.served_dir) as url:
+            for _ in range(2):
+                DownloadOperator(
+                    source=url + "/data.bin",
+                    target=target,
+                    checksum=self.checksum,
+                    chunk_size=1000,
+                )()
+                self.assertEqual(self.read(target), self.content)
+        self.assertEqual(RangeRequestHandler.requests_log, [("/data.bin", None)])
+
+    def write_partial_download(self, operator, content, etag):
+        part_file = operator.cache_file() + ".part"
+        os.makedirs(os.path.dirname(part_file))
+        with open(part_file, "wb") as f:
+            f.write(content)
+        with open(part_file + ".json", "w") as f:
+            json.dump({"validator": etag}, f)
+        return part_file
+
+    def test_download_resumes_a_partial_download(self):
+        target = os.path.join(self.tmp_dir.name, "data.bin")
+        etag = '"' + hashlib.md5(self.content).hexdigest() + '"'
+        with serve_directory(self.served_dir) as url:
+            operator = DownloadOperator(
+                source=url + "/data.bin", target=target, checksum=self.checksum
+            )
+            part_file = self.write_partial_download(
+                operator, self.content[:10000], etag
+            )
+            operator()
+        self.assertEqual(self.read(target), self.content)
+        self.assertEqual(
+            RangeRequestHandler.requests_log, [("/data.bin", "bytes=10000-")]
+        )
+        self.assertFalse(os.path.exists(part_file))
+        self.assertFalse(os.path.exists(part_file + ".json"))
+
+    def test_download_restarts_when_the_source_changed(self):
+        target = os.path.join(self.tmp_dir.name, "data.bin")
+        with serve_directory(self.served_dir) as url:
+            operator = DownloadOperator(source=url + "/data.bin", target=target)
+            self.write_partial_download(operator, b"old content", '"old"')
+            operator()
+        self.assertEqual(self.read(target), self.content)
+
+    def test_download_completes_a_complete_partial_download(self):
+        target = os.path.join(self.tmp_dir.name, "data.bin")
+        etag = '"' + hashlib.md5(self.content).hexdigest() + '"'
+        with serve_directory(self.served_dir) as url:
+            operator = DownloadOperator(source=url + "/data.bin", target=target)
+            self.write_partial_download(operator, self.content, etag)
+            operator()
+        self.assertEqual(self.read(target), self.content)
+        self.assertEqual(
+            RangeRequestHandler.requests_log,
+            [("/data.bin", f"bytes={len(self.content)}-")],
+        )
+
+    def test_download_with_wrong_checksum_fails(self):
+        target = os.path.join(self.tmp_dir.name, "data.bin")
+        with serve_directory(self.served_dir) as url:
+            operator = DownloadOperator(
+                source=url + "/data.bin", target=target, checksum="sha256:1234"
+            )
+            with self.assertRaisesRegex(DownloadError, "expected 1234"):
+                operator()
+            self.assertFalse(os.path.exists(operator.cache_file()))
+            self.assertFalse(os.path.exists(target))
+
+            operator = DownloadOperator(source=url + "/missing.bin", target=target)
+            with self.assertRaisesRegex(UnexpectedHttpCodeError, "404"):
+                operator()
+
+    def test_download_files(self):
+        names = [f"data_{i}.bin" for i in range(5)]
+        for name in names:
+            with open(os.path.join(self.served_dir, name), "wb") as f:
+                f.write(name.encode())
+        with serve_directory(self.served_dir) as url:
+            DownloadFiles(
+                downloads=[
+                    DownloadOperator(
+                        source=f"{url}/{name}",
+                        target=os.path.join(self.tmp_dir.name, name),
+                        caching=False,
+                    )
+                    for name in names
+                ],
+                max_workers=3,
+            )()
+        for name in names:
+            self.assertEqual(
+                self.read(os.path.join(self.tmp_dir.name, name)), name.encode()
+            )
+
+    def test_concurrent_downloads_of_the_same_file(self):
+        targets = [os.path.join(self.tmp_dir.name, f"data_{i}.bin") for i in range(4)]
+        with serve_directory(self.served_dir) as url:
+            DownloadFiles(
+                downloads=[
+                    DownloadOperator(
+                        source=url + "/data.bin",
+                        target=target,
+                        checksum=self.checksum,
+                        chunk_size=1000,
+                    )
+                    for target in targets
+                ],
+                max_workers=4,
+            )()
+        for target in targets:
+            self.assertEqual(self.read(target), self.content)
+        self.assertEqual(RangeRequestHandler.requests_log, [("/data.bin", None)])
+
+    def test_extract_zip_file_is_skipped_when_extracted(self):
+        zip_file = os.path.join(self.tmp_dir.name, "data.zip")
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("data.txt", "abc")
+        target_dir = os.path.join(self.tmp_dir.name, "extracted")
+        ExtractZipFile(zip_file=zip_file, target_dir=target_dir)()
+        self.assertEqual(self.read(os.path.join(target_dir, "data.txt")), b"abc")
+
+        os.remove(os.path.join(target_dir, "data.txt"))
+        ExtractZipFile(zip_file=zip_file, target_dir=target_dir)()
+        self.assertFalse(os.path.exists(os.path.join(target_dir, "data.txt")))
+
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("data.txt", "def")
+        ExtractZipFile(zip_file=zip_file, target_dir=target_dir)()
+        self.assertEqual(self.read(os.path.join(target_dir, "data.txt")), b"def")
@@ -0,0 +1,109 @@
+import os
+import tempfile
+
+from src.unitxt.catalog import LocalCatalog, record_saved_artifacts
+from src.unitxt.prepare_utils.runner import (
+    PACKAGE_DIR,
+    get_dependencies,
+    run_preparation,
+)
+from src.unitxt.processors import ToString
+from tests.utils import UnitxtTestCase
+
+SCRIPT = """
+from src.unitxt.catalog import add_to_catalog
+from src.unitxt.processors import ToString
+
+add_to_catalog(ToString(field="x"), "{name}", catalog_path={catalog!r}, overwrite=True)
+"""
+
+
+class TestPrepareRunner(UnitxtTestCase):
+    def write_script(self, prepare_dir, file_name, content):
+        path = os.path.join(prepare_dir, file_name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_dependencies(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.write_script(
+                tmp_dir, "script.py", "from src.unitxt.catalog import add_to_catalog"
+            )
+            dependencies = get_dependencies(path)
+        for module in ["__init__.py", "catalog.py", "artifact.py", "dataclass.py"]:
+            self.assertIn(os.path.join(PACKAGE_DIR, module), dependencies)
+        self.assertNotIn(os.path.join(PACKAGE_DIR, "templates.py"), dependencies)
+
+    def test_record_saved_artifacts(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            catalog = LocalCatalog(location=tmp_dir)
+            with record_saved_artifacts() as saved_paths:
+                catalog.save_artifact(ToString(field="x"), "a.b", verbose=False)
+            catalog.save_artifact(ToString(field="x"), "a.c", verbose=False)
+            self.assertListEqual(saved_paths, [catalog.path("a.b")])
+
+    def test_incremental_runs(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            prepare_dir = os.path.join(tmp_dir, "prepare")
+            catalog_dir = os.path.join(tmp_dir, "catalog")
+            os.makedirs(prepare_dir)
+            state_path = os.path.join(tmp_dir, "state.json")
+            first = self.write_script(
+                prepare_dir,
+                "first.py",
+                SCRIPT.format(name="a.first", catalog=catalog_dir),
+            )
+            self.write_script(
+                prepare_dir,
+                "second.py",
+                SCRIPT.format(name="a.second", catalog=catalog_dir),
+            )
+            self.write_script(prepare_dir, "failing.py", "raise ValueError('bad')")
+
+            def run():
+                return run_preparation(
+                    prepare_dir=prepare_dir,
+                    catalog_dir=catalog_dir,
+                    state_path=state_path,
+                    jobs=2,
+                )
+
+            summary = run()
+            self.assertEqual(summary["ran"], 3)
+            self.assertEqual(len(summary["failed"]), 1)
+            self.assertTrue(summary["failed"][0].endswith("failing.py"))
+            self.assertIn(
+                "ValueError: bad", summary["scripts"][summary["failed"][0]]["error"]
+            )
+            self.assertTrue(
+                os.path.isfile(os.path.join(catalog_dir, "a", "first.json"))
+            )
+            self.assertTrue(
+                os.path.isfile(os.path.join(catalog_dir, "a", "second.json"))
+            )
+
+            # Only the failed script runs again
+            summary = run()
+            self.assertEqual(summary["up_to_date"], 2)
+            self.assertListEqual(list(summary["scripts"]), summary["failed"])
+
+            # A changed script runs again
+            with open(first, "a") as f:
+                f.write("\n# changed\n")
+            summary = run()
+            self.assertEqual(
+                sorted(os.path.basename(key) for key in summary["scripts"]),
+                ["failing.py", "first.py"],
+            )
+
+            # A script whose artifact was removed runs again
+            os.remove(os.path.join(catalog_dir, "a", "second.json"))
+            summary = run()
+            self.assertEqual(
+                sorted(os.path.basename(key) for key in summary["scripts"]),
+                ["failing.py", "second.py"],
+            )
+            self.assertTrue(
+                os.path.isfile(os.path.join(catalog_dir, "a", "second.json"))
+            )
@@ -3,6 +3,9 @@ import random as python_random
 from src.unitxt.random_utils import (
     __default_seed__,
     new_random_generator,
+    reservoir_sample,
+    sample_indices,
+    stratum_sizes,
 )
 from tests.utils import UnitxtTestCase
 
@@ -37,3 +40,43 @@ class TestRandomUtils(UnitxtTestCase):
         python_random.seed(10)
         rand2 = randomize(sub_seed="b")
         self.assertEqual(rand1, rand2)
+
+    def test_stratum_sizes(self):
+        self.assertEqual(stratum_sizes({"a": 80, "b": 20}, 10), {"a": 8, "b": 2})
+        self.assertEqual(
+            stratum_sizes({"a": 98, "b": 1, "c": 1}, 10), {"a": 8, "b": 1, "c": 1}
+        )
+        self.assertEqual(
+            stratum_sizes({"a": 5, "b": 5, "c": 5}, 2), {"a": 1, "b": 1, "c": 0}
+        )
+        self.assertEqual(stratum_sizes({"a": 5, "b": 5}, 20), {"a": 5, "b": 5})
+        self.assertEqual(
+            sum(stratum_sizes({"a": 7, "b": 11, "c": 13}, 17).values()), 17
+        )
+
+    def test_sample_indices(self):
+        indices = sample_indices(100, 10, new_random_generator("test"))
+        self.assertEqual(len(set(indices)), 10)
+        self.assertEqual(indices, sorted(indices))
+        self.assertEqual(indices, sample_indices(100, 10, new_random_generator("test")))
+        self.assertEqual(
+            sample_indices(5, 10, new_random_generator("test")), list(range(5))
+        )
+
+        strata = [i // 80 for i in range(100)]
+        indices = sample_indices(100, 10, new_random_generator("test"), strata=strata)
+        self.assertEqual([strata[i] for i in indices], [0] * 8 + [1] * 2)
+
+    def test_reservoir_sample(self):
+        sample = reservoir_sample(iter(range(1000)), 10, new_random_generator("test"))
+        self.assertEqual(len(set(sample)), 10)
+        self.assertEqual(sample, sorted(sample))
+        self.assertNotEqual(sample, list(range(10)))
+        self.assertEqual(
+            reservoir_sample(range(5), 10, new_random_generator("test")), list(range(5))
+        )
+
+        sample = reservoir_sample(
+            range(1000), 10, new_random_generator("test"), stratum=lambda i: i // 800
+        )
+        self.assertEqual([i // 800 for i in sample], [0] * 8 + [1] * 2)
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import threading
+
+import pandas as pd
+
+from src.unitxt.card import TaskCard
+from src.unitxt.formats import SystemFormat
+from src.unitxt.loaders import LoadCSV
+from src.unitxt.renderer import InstanceRenderer
+from src.unitxt.splitters import RandomSampler
+from src.unitxt.standard import StandardRecipe
+from src.unitxt.task import FormTask
+from src.unitxt.templates import InputOutputTemplate
+from tests.utils import UnitxtTestCase
+
+
+class TestInstanceRenderer(UnitxtTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.files = {}
+        for split, size in [("train", 10), ("test", 5)]:
+            path = os.path.join(self.tmp_dir.name, f"{split}.csv")
+            pd.DataFrame(
+                {
+                    "text": [f"{split} sentence {i}" for i in range(size)],
+                    "label": ["positive" if i % 2 else "negative" for i in range(size)],
+                }
+            ).to_csv(path, index=False)
+            self.files[split] = path
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_recipe(self, **kwargs):
+        card = TaskCard(
+            loader=LoadCSV(files=self.files),
+            task=FormTask(
+                inputs=["text"], outputs=["label"], metrics=["metrics.accuracy"]
+            ),
+            sampler=RandomSampler(),
+        )
+        return StandardRecipe(
+            card=card,
+            template=InputOutputTemplate(
+                input_format="{text}", output_format="{label}", instruction="Classify."
+            ),
+            format=SystemFormat(
+                demo_format="Input: {source}\nOutput: {target}\n\n",
+                model_input_format="{instruction}\n{demos}Input: {source}\nOutput: ",
+            ),
+            **kwargs,
+        )
+
+    def test_render_like_recipe(self):
+        recipe = self.make_recipe()
+        renderer = InstanceRenderer(recipe)
+        expected = list(recipe()["test"])
+        fields = pd.read_csv(self.files["test"]).to_dict("records")
+        self.assertListEqual(renderer.render_many(fields), expected)
+        self.assertEqual(
+            renderer.render(fields[1])["source"],
+            "Classify.\nInput: test sentence 1\nOutput: ",
+        )
+
+    def test_render_with_demos(self):
+        renderer = InstanceRenderer(self.make_recipe(num_demos=2, demos_pool_size=4))
+        self.assertEqual(len(renderer.demos_pool), 4)
+        pool_sources = {demo["source"] for demo in renderer.demos_pool}
+
+        fields = {"text": "a new sentence", "label": "positive"}
+        result = renderer.render(fields)
+        self.assertDictEqual(fields, {"text": "a new sentence", "label": "positive"})
+        self.assertEqual(result["target"], "positive")
+        self.assertEqual(result["source"].count("Input: "), 3)
+        self.assertTrue(result["source"].endswith("Input: a new sentence\nOutput: "))
+        demo_sources = [
+            line[len("Input: ") :]
+            for line in result["source"].split("\n")
+            if line.startswith("Input: ")
+        ][:-1]
+        self.assertTrue(set(demo_sources).issubset(pool_sources))
+
+        # the same instance gets the same demos, also when rendered concurrently
+        results = []
+
+        def render():
+            for _ in range(20):
+                results.append(renderer.render(fields)["source"])
+
+        threads = [threading.Thread(target=render) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(set(results), {result["source"]})
+
+    def test_render_with_given_demos_pool(self):
+        renderer = InstanceRenderer(
+            self.make_recipe(num_demos=1, demos_pool_size=4),
+            demos_pool=[{"text": "the demo", "label": "negative"}],
+        )
+        self.assertEqual(
+            renderer.render({"text": "x", "label": "positive"})["source"],
+            "Classify.\nInput: the demo\nOutput: negative\n\nInput: x\nOutput: ",
+        )
@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+
+from src.unitxt.operators import AddFields
+from src.unitxt.settings_utils import get_settings
+from src.unitxt.stream import MultiStream
+from src.unitxt.telemetry import (
+    TelemetryRegistry,
+    disable_telemetry,
+    enable_telemetry,
+    is_telemetry_enabled,
+    record_cache,
+    registry,
+)
+from tests.utils import UnitxtTestCase
+
+
+class TestTelemetry(UnitxtTestCase):
+    def test_registry_export(self):
+        test_registry = TelemetryRegistry()
+        counter = test_registry.counter("test_total", "A counter.", ["split"])
+        counter.inc(split="train")
+        counter.inc(2, split="train")
+        histogram = test_registry.histogram(
+            "test_seconds", "A histogram.", buckets=[0.1, 1.0]
+        )
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        self.assertEqual(counter.get(split="train"), 3)
+        self.assertEqual(
+            test_registry.to_prometheus(),
+            "# HELP test_seconds A histogram.\n"
+            "# TYPE test_seconds histogram\n"
+            'test_seconds_bucket{le="0.1"} 1\n'
+            'test_seconds_bucket{le="1.0"} 2\n'
+            'test_seconds_bucket{le="+Inf"} 3\n'
+            "test_seconds_sum 5.55\n"
+            "test_seconds_count 3\n"
+            "# HELP test_total A counter.\n"
+            "# TYPE test_total counter\n"
+            'test_total{split="train"} 3\n',
+        )
+        with self.assertRaises(ValueError):
+            test_registry.histogram("test_total", "Not a counter.")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "unitxt.json")
+            test_registry.write_json(path)
+            with open(path) as f:
+                snapshot = json.load(f)["metrics"]
+        self.assertEqual(
+            snapshot["test_total"]["values"],
+            [{"labels": {"split": "train"}, "value": 3}],
+        )
+        self.assertEqual(snapshot["test_seconds"]["values"][0]["count"], 3)
+
+    def test_operator_telemetry(self):
+        counter = registry.get("unitxt_operator_instances_total")
+        operator = AddFields(fields={"b": 1})
+        multi_stream = MultiStream.from_iterables({"test": [{"a": 1}, {"a": 2}]})
+
+        was_enabled = is_telemetry_enabled()
+        disable_telemetry()
+        list(operator(multi_stream)["test"])
+        self.assertEqual(counter.get(operator="AddFields", split="test"), 0)
+
+        enable_telemetry()
+        try:
+            result = list(operator(multi_stream)["test"])
+        finally:
+            if not was_enabled:
+                disable_telemetry()
+        self.assertEqual(result, [{"a": 1, "b": 1}, {"a": 2, "b": 1}])
+        self.assertEqual(counter.get(operator="AddFields", split="test"), 2)
+        self.assertIn(
+            'unitxt_operator_instances_total{operator="AddFields",split="test"} 2',
+            registry.to_prometheus(),
+        )
+        registry.reset()
+        self.assertEqual(counter.get(operator="AddFields", split="test"), 0)
+
+    def test_telemetry_setting_changed_after_import(self):
+        settings = get_settings()
+        counter = registry.get("unitxt_cache_requests_total")
+        saved = settings.telemetry
+        try:
+            settings.telemetry = False
+            self.assertFalse(is_telemetry_enabled())
+            record_cache("test_cache", hit=True)
+            self.assertEqual(counter.get(cache="test_cache", result="hit"), 0)
+
+            settings.telemetry = True
+            self.assertTrue(is_telemetry_enabled())
+            record_cache("test_cache", hit=True)
+            self.assertEqual(counter.get(cache="test_cache", result="hit"), 1)
+        finally:
+            settings.telemetry = saved
+            registry.reset()
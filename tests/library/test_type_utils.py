@@ -1,6 +1,13 @@
 import typing
+from unittest.mock import patch
 
-from src.unitxt.type_utils import isoftype, issubtype, to_float_or_default
+from src.unitxt import type_utils
+from src.unitxt.type_utils import (
+    get_type_checker,
+    isoftype,
+    issubtype,
+    to_float_or_default,
+)
 from tests.utils import UnitxtTestCase
 
 
@@ -69,6 +76,26 @@ class TestAssertTyping(UnitxtTestCase):
             False,
         )
 
+    def test_compiled_type_checkers(self):
+        list_of_dicts = typing.List[typing.Dict[str, typing.Any]]
+        self.assertIs(get_type_checker(list_of_dicts), get_type_checker(list_of_dicts))
+        self.assertTrue(isoftype([{"a": 1}, {"b": [2]}], list_of_dicts))
+        self.assertFalse(isoftype([{"a": 1}, {2: "b"}], list_of_dicts))
+        self.assertTrue(isoftype((1, 2, 3), typing.Tuple[int, ...]))
+        self.assertFalse(isoftype((1, "2"), typing.Tuple[int, ...]))
+        self.assertTrue(isoftype([1, "2"], typing.List))
+        self.assertTrue(isoftype({1, 2}, typing.Set[int]))
+
+    def test_sampled_type_checking(self):
+        values = [1] * 10 + ["11"]
+        self.assertFalse(isoftype(values, typing.List[int]))
+        self.assertTrue(isoftype(values, typing.List[int], sample_size=10))
+        self.assertFalse(isoftype(values, typing.List[int], sample_size=11))
+        self.assertFalse(isoftype(["1"], typing.List[int], sample_size=10))
+        self.assertTrue(
+            isoftype({"a": 1, "b": "2"}, typing.Dict[str, int], sample_size=1)
+        )
+
     def test_is_typing_sub_type(self):
         # Define some base classes and subclasses
         class BaseName:
@@ -97,6 +124,38 @@ class TestAssertTyping(UnitxtTestCase):
             issubtype(typing.Dict[Name, Name2], typing.Dict[BaseName, Name])
         )
 
+    def test_issubtype_memoization(self):
+        left = typing.List[typing.Tuple[int, bytes]]
+        right = typing.Union[int, typing.Sequence]
+        type_utils._issubtype_cache.pop((left, right), None)
+        with patch.object(
+            type_utils, "_is_normal_subtype", wraps=type_utils._is_normal_subtype
+        ) as is_normal_subtype:
+            self.assertTrue(issubtype(left, right))
+            self.assertGreater(is_normal_subtype.call_count, 0)
+            self.assertIn((left, right), type_utils._issubtype_cache)
+
+            # the second check is answered by the memo, without computing it again
+            is_normal_subtype.reset_mock()
+            self.assertTrue(issubtype(left, right))
+            self.assertEqual(is_normal_subtype.call_count, 0)
+
+            # checks with forward_refs are not memoized
+            for json_type, expected in [
+                (typing.Union[int, bytes], True),
+                (typing.Union[int, float], False),
+            ]:
+                is_normal_subtype.reset_mock()
+                self.assertEqual(
+                    issubtype(
+                        typing.List[bytes],
+                        typing.List[typing.ForwardRef("JSON")],
+                        forward_refs={"JSON": json_type},
+                    ),
+                    expected,
+                )
+                self.assertGreater(is_normal_subtype.call_count, 0)
+
     def test_to_float_or_default(self):
         self.assertEqual(to_float_or_default("1", 0), 1)
         self.assertEqual(to_float_or_default("a", 0), 0)
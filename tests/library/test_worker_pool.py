@@ -0,0 +1,41 @@
+import json
+import os
+
+from src.unitxt.api import evaluate
+from src.unitxt.operators import ArtifactFetcherMixin
+from src.unitxt.worker_pool import WarmWorkerPool
+from tests.utils import UnitxtTestCase
+
+
+def cached_artifacts():
+    return os.getpid(), sorted(ArtifactFetcherMixin.cache)
+
+
+class TestWarmWorkerPool(UnitxtTestCase):
+    def test_evaluate_in_warm_workers(self):
+        data = [
+            {
+                "metrics": ["metrics.accuracy"],
+                "source": f"question {i}",
+                "target": "yes",
+                "references": ["yes"],
+                "task_data": json.dumps({}),
+                "group": "unitxt",
+                "postprocessors": ["processors.to_string_stripped"],
+            }
+            for i in range(4)
+        ]
+        predictions = ["yes", "no", "yes", "yes"]
+        expected = evaluate(predictions, data)
+
+        with WarmWorkerPool(processes=2, metrics=["metrics.accuracy"]) as pool:
+            pid, cached = pool.submit(cached_artifacts).get()
+            self.assertNotEqual(pid, os.getpid())
+            self.assertIn("metrics.accuracy", cached)
+
+            results = pool.map_evaluate([(predictions, data)] * 3)
+            self.assertEqual(len(results), 3)
+            for result in results:
+                self.assertDictEqual(
+                    result[0]["score"]["global"], expected[0]["score"]["global"]
+                )